@@ -2,15 +2,17 @@
 # -------------------
 # Package initializer for backend module
 
-from .data_preparation import prepare_category_data
-from .forecast_service import run_demand_forecast
+from .data_preparation import prepare_category_data, prepare_all_categories
+from .forecast_service import run_demand_forecast, run_batch_forecast
 from .prophet_model import DemandProphetModel
 from .ai_insight_service import generate_ai_insight
 from .config import settings
 
 __all__ = [
     "prepare_category_data",
+    "prepare_all_categories",
     "run_demand_forecast", 
+    "run_batch_forecast",
     "DemandProphetModel",
     "generate_ai_insight",
     "settings"
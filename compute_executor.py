@@ -0,0 +1,146 @@
+# backend/compute_executor.py
+# ---------------------------
+# Responsibility:
+# - Shared, size-limited executor for blocking forecasting work
+# - Async endpoints await it, so the event loop never runs parsing or model fits
+# - Queue depth, wait time and run time metrics
+
+import asyncio
+import functools
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Callable, Iterator, Optional
+
+import numpy as np
+
+from config import settings
+
+
+class ComputeExecutor:
+    """
+    Thread pool for CPU- and IO-heavy request work, with metrics.
+
+    Threads (not processes) are used because request work closes over
+    uploads and other unpicklable objects; Prophet fits run in a CmdStan
+    subprocess and pandas parsing releases the GIL, so threads still scale.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, metrics_window: int = 1000):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="compute")
+        self.max_workers = self._executor._max_workers
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._running = 0
+        self._completed = 0
+        self._failed = 0
+        self._wait_times = deque(maxlen=metrics_window)
+        self._run_times = deque(maxlen=metrics_window)
+
+    def submit(self, func: Callable, *args, **kwargs):
+        """Submit func(*args, **kwargs) and return a concurrent.futures.Future."""
+        submitted_at = time.perf_counter()
+        with self._lock:
+            self._queued += 1
+
+        def task():
+            started_at = time.perf_counter()
+            with self._lock:
+                self._queued -= 1
+                self._running += 1
+                self._wait_times.append(started_at - submitted_at)
+            failed = False
+            try:
+                return func(*args, **kwargs)
+            except BaseException:
+                failed = True
+                raise
+            finally:
+                with self._lock:
+                    self._running -= 1
+                    self._completed += 1
+                    self._failed += failed
+                    self._run_times.append(time.perf_counter() - started_at)
+
+        return self._executor.submit(task)
+
+    async def run(self, func: Callable, *args, **kwargs):
+        """Run a blocking call on the executor and await its result."""
+        return await asyncio.wrap_future(self.submit(func, *args, **kwargs))
+
+    async def iterate(self, iterator: Iterator) -> AsyncIterator:
+        """
+        Drive a blocking iterator on the executor, one item at a time.
+
+        If the consumer stops early (e.g. a streaming client disconnects),
+        a generator is closed on the executor as well, after any next() call
+        still in flight, so its cleanup never blocks the event loop.
+        """
+        done = object()
+        pending = None
+        exhausted = False
+        try:
+            while True:
+                pending = self.submit(next, iterator, done)
+                item = await asyncio.wrap_future(pending)
+                pending = None
+                if item is done:
+                    exhausted = True
+                    return
+                yield item
+        finally:
+            close = getattr(iterator, "close", None)
+            if close is not None and not exhausted:
+                # Not awaited: the awaiting task may be cancelled already
+                if pending is None or pending.done():
+                    self.submit(close)
+                else:
+                    pending.add_done_callback(lambda _: self.submit(close))
+
+    def offload(self, endpoint: Callable) -> Callable:
+        """
+        Decorator turning a blocking endpoint into an async one that runs on
+        this executor. The original signature is kept for FastAPI.
+        """
+        @functools.wraps(endpoint)
+        async def wrapper(*args, **kwargs):
+            return await self.run(endpoint, *args, **kwargs)
+        return wrapper
+
+    def stats(self) -> dict:
+        """Get executor queue depth, wait time and run time metrics."""
+        with self._lock:
+            wait_times = np.array(self._wait_times, dtype=float) * 1000
+            run_times = np.array(self._run_times, dtype=float) * 1000
+            counts = {
+                "max_workers": self.max_workers,
+                "queued": self._queued,
+                "running": self._running,
+                "completed": self._completed,
+                "failed": self._failed
+            }
+
+        def summarize(values: np.ndarray) -> Optional[dict]:
+            if len(values) == 0:
+                return None
+            return {
+                "avg_ms": round(float(values.mean()), 2),
+                "p50_ms": round(float(np.percentile(values, 50)), 2),
+                "p95_ms": round(float(np.percentile(values, 95)), 2),
+                "max_ms": round(float(values.max()), 2)
+            }
+
+        return {
+            **counts,
+            "wait_time": summarize(wait_times),
+            "run_time": summarize(run_times),
+            "samples": len(wait_times)
+        }
+
+
+# Global executor instance
+compute_executor = ComputeExecutor(
+    max_workers=settings.compute_workers,
+    metrics_window=settings.compute_metrics_window
+)
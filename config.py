@@ -40,6 +40,83 @@ class Settings(BaseSettings):
     sufficient_data_changepoint_scale: float = 0.05
     confidence_interval: float = 0.95  # ← Make configurable
     
+    # Uncertainty Sampling ("full" = simulated intervals, "fast" = point forecasts)
+    forecast_precision: str = "full"
+    full_uncertainty_samples: int = 1000
+    fast_uncertainty_samples: int = 0  # 0 = analytic interval from residual std
+    
+    # Cross-Validation
+    cv_parallel: Optional[str] = "processes"  # "processes", "threads" or None
+    cv_max_cutoffs: int = 12
+    
+    # Rolling-Origin Backtest
+    backtest_max_origins: int = 24
+    
+    # Statistical Fallback Forecasters (short / intermittent series)
+    statistical_fallback_enabled: bool = True
+    intermittent_zero_ratio: float = 0.3   # share of zero months that marks intermittent demand
+    croston_alpha: float = 0.1
+    
+    # Automatic Model Selection
+    auto_select_candidates: List[str] = ["prophet", "damped_holt", "holt", "seasonal_naive", "sba"]
+    auto_select_holdout_months: int = 3
+    auto_select_prophet_margin: float = 0.05   # Prophet must beat the best cheap model's MAE by 5%
+    auto_select_cache_enabled: bool = True
+    auto_select_cache_dir: str = ".selection_cache"
+    auto_select_cache_entries: int = 10000
+    auto_select_cache_max_size_mb: float = 16.0
+
+    # Batch Forecasting
+    batch_forecast_workers: Optional[int] = None  # None = one worker per CPU core
+    batch_forecast_start_method: str = "spawn"    # worker start method ("spawn" / "forkserver"); never fork the threaded server
+    
+    # Upload Ingestion
+    csv_chunk_rows: int = 500_000   # rows parsed per chunk when streaming CSV uploads
+
+    # Fitted Model Cache
+    model_cache_enabled: bool = True
+    model_cache_dir: str = ".model_cache"
+    model_cache_max_entries: int = 256
+    model_cache_max_size_mb: float = 512.0
+
+    # Dataset Sessions
+    dataset_dir: str = ".datasets"
+    dataset_memory_entries: int = 16     # parsed datasets kept in process memory
+    dataset_disk_entries: int = 256      # spilled datasets kept on local disk
+
+    # Background Jobs
+    job_workers: int = 2                 # forecasts / evaluations running at once
+    job_max_queued: int = 32             # further submissions are rejected with 429
+    job_result_ttl_seconds: int = 3600   # how long finished job results stay pollable
+
+    # Request Compute Executor
+    compute_workers: Optional[int] = None  # None = min(32, CPU cores + 4)
+    compute_metrics_window: int = 1000     # recent tasks used for wait / run time metrics
+
+    # Database Connection Pool
+    db_pool_size: int = 10
+    db_max_overflow: int = 20
+    db_pool_timeout: float = 10.0            # seconds to wait for a free connection before failing
+    db_pool_pre_ping: bool = True            # drop dead connections before handing them out
+    db_pool_recycle: int = 1800              # seconds; recycle before server-side idle timeouts
+    db_statement_timeout_ms: Optional[int] = 30000  # PostgreSQL statement_timeout, None disables
+
+    # Procurement Listings
+    po_list_max_limit: int = 1000            # largest page /procurement/po/list will serve
+
+    # Schema Migrations
+    db_auto_migrate: bool = True             # run `alembic upgrade head` on API startup
+
+    # LLM Procurement Reasoning
+    llm_reasoning_workers: int = 8                 # concurrent LLM calls
+    llm_reasoning_timeout_seconds: float = 15.0    # per LLM call
+    llm_reasoning_deadline_seconds: float = 0.5    # wait per request before using fallback text
+    llm_reasoning_cache_ttl_seconds: int = 3600
+    llm_reasoning_cache_entries: int = 1024
+
+    # Supplier Ranking Index
+    supplier_index_max_age_seconds: int = 300      # reload even without local writes (other workers, scripts)
+
     # AI Settings
     gemini_model: str = "gemini-1.5-flash"
     ai_temperature: float = 0.4      # ← Now configurable via .env
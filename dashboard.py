@@ -9,6 +9,7 @@ from streamlit_folium import st_folium
 import polyline
 from datetime import datetime, timedelta
 from streamlit_mic_recorder import speech_to_text 
+import hashlib
 import json
 import os
 import time
@@ -1343,6 +1344,44 @@ def find_col(keywords: list, columns: list) -> str:
     return columns[0] if columns else None
 
 
+def get_dataset_id(df: pd.DataFrame, date_col: str, category_col: str, units_col: str, source_key) -> str:
+    """Upload the mapped data to the backend once and reuse its dataset_id."""
+    session_key = (source_key, date_col, category_col, units_col)
+    cached = st.session_state.get('dataset_session')
+    if cached and cached['key'] == session_key:
+        return cached['dataset_id']
+    
+    temp_df = df.rename(columns={date_col: "Date", category_col: "Category", units_col: "Units_Sold"})
+    
+    buffer = io.StringIO()
+    temp_df.to_csv(buffer, index=False)
+    
+    files = {"file": ("data.csv", buffer.getvalue(), "text/csv")}
+    data = {"date_col": "Date", "category_col": "Category", "units_col": "Units_Sold"}
+    
+    response = requests.post(f"{API_URL}/datasets", files=files, data=data, timeout=120)
+    if response.status_code != 200:
+        raise ValueError(response.json().get("detail", "Unknown error"))
+    
+    dataset_id = response.json()["dataset_id"]
+    st.session_state['dataset_session'] = {"key": session_key, "dataset_id": dataset_id}
+    return dataset_id
+
+
+def post_with_dataset(endpoint: str, data: dict, df: pd.DataFrame, date_col: str, category_col: str,
+                      units_col: str, source_key, timeout: int = 120) -> requests.Response:
+    """POST to an endpoint with the cached dataset_id, re-uploading once if the server lost it."""
+    data["dataset_id"] = get_dataset_id(df, date_col, category_col, units_col, source_key)
+    response = requests.post(f"{API_URL}{endpoint}", data=data, timeout=timeout)
+    
+    if response.status_code == 404:
+        # Server-side dataset expired or was deleted - upload it again
+        st.session_state.pop('dataset_session', None)
+        data["dataset_id"] = get_dataset_id(df, date_col, category_col, units_col, source_key)
+        response = requests.post(f"{API_URL}{endpoint}", data=data, timeout=timeout)
+    return response
+
+
 def create_forecast_chart(history_data: list, forecast_data: list, category: str):
     """Generate Plotly chart with historical data, forecast, and confidence interval."""
     history_df = pd.DataFrame(history_data)
@@ -1901,6 +1940,8 @@ def render_generate_page():
             uploaded_file.seek(0)
             df = pd.read_csv(uploaded_file, dtype=str)
             cols = df.columns.tolist()
+            # Content hash: a different file with the same name and size must not reuse the dataset
+            source_key = hashlib.sha256(uploaded_file.getvalue()).hexdigest()
             
             with st.expander("👀 Preview Uploaded Data", expanded=False):
                 st.dataframe(df.head(10), use_container_width=True)
@@ -1952,17 +1993,12 @@ def render_generate_page():
             # Validate button
             if sel_cat and st.button("🔍 Validate Data"):
                 with st.spinner("Validating data..."):
-                    temp_df = df.rename(columns={date_col: "Date", category_col: "Category", units_col: "Units_Sold"})
-                    
-                    buffer = io.StringIO()
-                    temp_df.to_csv(buffer, index=False)
-                    buffer.seek(0)
-                    
-                    files = {"file": ("data.csv", buffer.getvalue(), "text/csv")}
-                    data = {"category": str(sel_cat), "date_col": "Date", "category_col": "Category", "units_col": "Units_Sold"}
-                    
                     try:
-                        response = requests.post(f"{API_URL}/validate-data", files=files, data=data, timeout=30)
+                        # Parsed once server-side, reused by the forecast request
+                        data = {"category": str(sel_cat)}
+                        response = post_with_dataset(
+                            "/validate-data", data, df, date_col, category_col, units_col, source_key, timeout=30
+                        )
                         
                         if response.status_code == 200:
                             st.session_state['validation_result'] = response.json()
@@ -1974,6 +2010,8 @@ def render_generate_page():
                             
                     except requests.exceptions.ConnectionError:
                         st.error("❌ Cannot connect to backend server")
+                    except ValueError as ve:
+                        st.error(f"❌ Validation Failed: {str(ve)}")
                     except Exception as e:
                         st.error(f"❌ Error: {str(e)}")
             
@@ -2084,18 +2122,8 @@ def render_generate_page():
                         status_placeholder = st.empty()
                         status_placeholder.info(f"⏳ Preparing data for **{sel_cat}**...")
                         
-                        temp_df = df.rename(columns={date_col: "Date", category_col: "Category", units_col: "Units_Sold"})
-                        
-                        buffer = io.StringIO()
-                        temp_df.to_csv(buffer, index=False)
-                        buffer.seek(0)
-                        
-                        files = {"file": ("data.csv", buffer.getvalue(), "text/csv")}
                         data = {
                             "category": str(sel_cat),
-                            "date_col": "Date",
-                            "category_col": "Category",
-                            "units_col": "Units_Sold",
                             "horizon": selected_horizon,
                             "upcoming_promotion": str(upcoming_promotion).lower(),
                             "marketing_campaign": str(marketing_campaign).lower(),
@@ -2126,7 +2154,9 @@ def render_generate_page():
                         try:
                             status_placeholder.info("⚙️ Running AI model & generating insights...")
                             
-                            api_response = requests.post(f"{API_URL}/forecast/upload", files=files, data=data, timeout=120)
+                            api_response = post_with_dataset(
+                                "/forecast/upload", data, df, date_col, category_col, units_col, source_key
+                            )
                             
                             if api_response.status_code == 200:
                                 result = api_response.json()
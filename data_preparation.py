@@ -5,8 +5,13 @@
 # - Filter by category
 # - Convert Daily data to Monthly Aggregation (Sum of units sold)
 # - Validate data sufficiency (Initial check for basic viability)
+# - Aggregate every category in a single pass for batch workloads
+# - Stream large CSV uploads in chunks with bounded memory
+# - Columnar Parquet / Arrow IPC and gzip / zstd compressed CSV uploads
 
 import pandas as pd
+from pandas.tseries.api import guess_datetime_format
+from typing import IO, Dict, Iterator, List, Optional, Tuple
 from config import settings
 
 
@@ -75,7 +80,17 @@ def prepare_category_data(
     # Sort by date
     monthly_df = monthly_df.sort_values("ds").reset_index(drop=True)
     
-    # 4. Data sufficiency check
+    # 4. Sufficiency check and context statistics
+    return _finalize_monthly_data(monthly_df, category)
+
+
+def _finalize_monthly_data(monthly_df: pd.DataFrame, category: str) -> pd.DataFrame:
+    """
+    Check data sufficiency and attach context statistics to a monthly series.
+    
+    Raises:
+        ValueError: If the series is shorter than the analysis minimum
+    """
     num_months = len(monthly_df)
     if num_months < settings.min_months_for_analysis:
         raise ValueError(
@@ -83,7 +98,6 @@ def prepare_category_data(
             f"Minimum {settings.min_months_for_analysis} months required for any analysis."
         )
 
-    # 5. Calculate additional statistics for context
     monthly_df.attrs["category"] = category
     monthly_df.attrs["total_units"] = int(monthly_df["y"].sum())
     monthly_df.attrs["avg_monthly_units"] = float(monthly_df["y"].mean())
@@ -93,6 +107,347 @@ def prepare_category_data(
     return monthly_df
 
 
+def _aggregate_monthly(
+    df: pd.DataFrame,
+    date_col: str,
+    category_col: str,
+    units_col: str,
+    categories: Optional[List[str]] = None,
+    date_format: Optional[str] = None
+) -> Tuple[pd.Series, int]:
+    """
+    Clean raw rows and sum units per (category, month start).
+    
+    Args:
+        date_format: strptime format of the dates (default: inferred by pandas)
+    
+    Returns:
+        tuple: (units indexed by (category, month), number of rows with a valid date)
+    """
+    df = df[[date_col, category_col, units_col]].copy()
+
+    df[date_col] = pd.to_datetime(df[date_col], errors="coerce", format=date_format)
+    df = df.dropna(subset=[date_col])
+    valid_rows = len(df)
+
+    df[units_col] = pd.to_numeric(df[units_col], errors="coerce").fillna(0)
+    df[units_col] = df[units_col].clip(lower=0)
+
+    if categories is not None:
+        df = df[df[category_col].isin(categories)]
+
+    grouped = (
+        df
+        .groupby([category_col, pd.Grouper(key=date_col, freq="MS")])[units_col]
+        .sum()
+    )
+    return grouped, valid_rows
+
+
+def split_monthly_totals(
+    grouped: pd.Series,
+    categories: Optional[List[str]] = None
+) -> Tuple[Dict[str, pd.DataFrame], Dict[str, str]]:
+    """
+    Turn a (category, month) units Series into per-category monthly frames.
+    
+    Args:
+        grouped: Units indexed by (category, month start)
+        categories: Optional subset of categories that were requested
+        
+    Returns:
+        tuple: (prepared, errors) as returned by prepare_all_categories
+    """
+    prepared = {}
+    errors = {}
+    for category, series in grouped.groupby(level=0, sort=False):
+        series = series.droplevel(0)
+
+        # Fill empty months with zero, matching resample("MS").sum()
+        full_range = pd.date_range(series.index.min(), series.index.max(), freq="MS")
+        monthly_df = (
+            series
+            .reindex(full_range, fill_value=0)
+            .rename_axis("ds")
+            .rename("y")
+            .reset_index()
+        )
+
+        # Sufficiency check and context statistics
+        try:
+            prepared[category] = _finalize_monthly_data(monthly_df, category)
+        except ValueError as ve:
+            errors[category] = str(ve)
+
+    if categories is not None:
+        for category in categories:
+            if category not in prepared and category not in errors:
+                errors[category] = (
+                    f"No data available for category '{category}'. "
+                    "Please check if the category exists in your data."
+                )
+
+    return prepared, errors
+
+
+def prepare_all_categories(
+    df: pd.DataFrame,
+    date_col: str = "Date",
+    category_col: str = "Category",
+    units_col: str = "Units_Sold",
+    categories: Optional[List[str]] = None
+) -> Tuple[Dict[str, pd.DataFrame], Dict[str, str]]:
+    """
+    Aggregate every category into monthly 'ds'/'y' series in a single pass.
+    
+    Equivalent to calling prepare_category_data once per category, but dates
+    and units are parsed once and all categories are summed by one groupby,
+    so the cost is O(rows) instead of O(categories x rows).
+    
+    Args:
+        df: Raw input DataFrame
+        date_col: Name of the date column in input
+        category_col: Name of the category column in input
+        units_col: Name of the units sold column in input
+        categories: Optional subset of categories to prepare (default: all)
+        
+    Returns:
+        tuple: (prepared, errors) where prepared maps category to its monthly
+               DataFrame and errors maps category to the reason it was skipped
+        
+    Raises:
+        ValueError: If no valid dates exist in the data at all
+    """
+    grouped, valid_rows = _aggregate_monthly(df, date_col, category_col, units_col, categories)
+
+    if valid_rows == 0:
+        raise ValueError("No valid dates found in the uploaded data.")
+
+    return split_monthly_totals(grouped, categories)
+
+
+# Leading bytes of each supported upload format
+_MAGIC_BYTES = [
+    (b"PAR1", "parquet"),
+    (b"ARROW1", "arrow"),
+    (b"\xff\xff\xff\xff", "arrow_stream"),
+    (b"\x1f\x8b", "csv.gz"),
+    (b"\x28\xb5\x2f\xfd", "csv.zst"),
+]
+
+_CSV_COMPRESSION = {"csv": None, "csv.gz": "gzip", "csv.zst": "zstd"}
+
+
+def detect_input_format(source: IO) -> str:
+    """
+    Detect the upload format from its leading bytes.
+    
+    Args:
+        source: Readable, seekable file object; rewound afterwards
+        
+    Returns:
+        str: One of 'csv', 'csv.gz', 'csv.zst', 'parquet', 'arrow', 'arrow_stream'
+    """
+    head = source.read(8)
+    source.seek(0)
+    
+    if isinstance(head, bytes):
+        for magic, input_format in _MAGIC_BYTES:
+            if head.startswith(magic):
+                return input_format
+    return "csv"
+
+
+def _check_columns(header: List[str], date_col: str, category_col: str, units_col: str):
+    """Raise if any mapped column is missing from the upload."""
+    missing_cols = [
+        f"{name} column '{col}'"
+        for col, name in [(date_col, "Date"), (category_col, "Category"), (units_col, "Units")]
+        if col not in header
+    ]
+    if missing_cols:
+        raise ValueError(f"Missing columns: {', '.join(missing_cols)}. Available columns: {', '.join(map(str, header))}")
+
+
+def _read_csv_chunks(
+    source: IO,
+    input_format: str,
+    date_col: str,
+    category_col: str,
+    units_col: str,
+    chunksize: int
+) -> Iterator[pd.DataFrame]:
+    """Check the header of a (possibly compressed) CSV and iterate its mapped columns in chunks."""
+    wanted = [date_col, category_col, units_col]
+    compression = _CSV_COMPRESSION[input_format]
+    
+    try:
+        header = pd.read_csv(source, nrows=0, compression=compression).columns.tolist()
+    except pd.errors.EmptyDataError:
+        raise ValueError("The uploaded CSV file is empty. Please upload a file with data.")
+    except ImportError as missing:
+        raise ValueError(f"Compressed upload '{input_format}' is not supported on this server: {str(missing)}")
+    except Exception as csv_error:
+        raise ValueError(f"Failed to read CSV file. Please ensure it's a valid CSV format. Error: {str(csv_error)}")
+    source.seek(0)
+    
+    _check_columns(header, date_col, category_col, units_col)
+    
+    return pd.read_csv(
+        source,
+        usecols=wanted,
+        dtype={col: str for col in wanted},
+        compression=compression,
+        chunksize=chunksize
+    )
+
+
+def _read_columnar_chunks(
+    source: IO,
+    input_format: str,
+    date_col: str,
+    category_col: str,
+    units_col: str,
+    chunksize: int
+) -> Iterator[pd.DataFrame]:
+    """Check the schema of a Parquet / Arrow IPC upload and iterate its mapped columns in batches."""
+    wanted = [date_col, category_col, units_col]
+    
+    try:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        import pyarrow.ipc as ipc
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ValueError("Parquet and Arrow uploads require 'pyarrow' on the server. Please upload a CSV file instead.")
+    
+    try:
+        if input_format == "parquet":
+            reader = pq.ParquetFile(source)
+            header = reader.schema_arrow.names
+        elif input_format == "arrow":
+            reader = ipc.open_file(source)
+            header = reader.schema.names
+        else:
+            reader = ipc.open_stream(source)
+            header = reader.schema.names
+    except Exception as arrow_error:
+        raise ValueError(f"Failed to read {input_format} file. Error: {str(arrow_error)}")
+    
+    _check_columns(header, date_col, category_col, units_col)
+    
+    if input_format == "parquet":
+        # Column projection happens in the reader - other columns are never decoded
+        batches = reader.iter_batches(batch_size=chunksize, columns=wanted)
+    elif input_format == "arrow":
+        batches = (reader.get_batch(i) for i in range(reader.num_record_batches))
+    else:
+        batches = iter(reader)
+    
+    def to_frame(batch) -> pd.DataFrame:
+        # Read as strings, like the CSV path (dtype=str), so e.g. an integer
+        # category column matches the category form field in every format
+        table = pa.Table.from_batches([batch]).select(wanted)
+        return pa.table({name: pc.cast(table[name], pa.string()) for name in wanted}).to_pandas()
+    
+    return (to_frame(batch) for batch in batches)
+
+
+def stream_monthly_totals(
+    source: IO,
+    date_col: str = "Date",
+    category_col: str = "Category",
+    units_col: str = "Units_Sold",
+    categories: Optional[List[str]] = None,
+    chunksize: Optional[int] = None
+) -> pd.Series:
+    """
+    Stream an upload in chunks and sum units per (category, month start).
+    
+    CSV (plain, gzip or zstd compressed), Parquet and Arrow IPC uploads are
+    accepted; the format is detected from the file content. Only the three
+    mapped columns are read, and each chunk is reduced to (category, month)
+    sums before the next one is read, so peak memory is bounded by the chunk
+    size and the number of category-months rather than by the size of the file.
+    
+    Args:
+        source: Readable, seekable file object (e.g. UploadFile.file)
+        date_col: Name of the date column in input
+        category_col: Name of the category column in input
+        units_col: Name of the units sold column in input
+        categories: Optional subset of categories to keep (default: all)
+        chunksize: Rows per chunk (default: settings.csv_chunk_rows)
+        
+    Returns:
+        pd.Series: Units indexed by (category, month start)
+        
+    Raises:
+        ValueError: If the file is empty, unreadable, misses a mapped column
+                    or contains no valid dates
+    """
+    chunksize = chunksize or settings.csv_chunk_rows
+
+    # 1. Detect the format and check the header before streaming the body
+    input_format = detect_input_format(source)
+    if input_format in _CSV_COMPRESSION:
+        chunks = _read_csv_chunks(source, input_format, date_col, category_col, units_col, chunksize)
+    else:
+        chunks = _read_columnar_chunks(source, input_format, date_col, category_col, units_col, chunksize)
+
+    # 2. Reduce each chunk to (category, month) sums and accumulate
+    totals = None
+    rows_read = 0
+    valid_rows = 0
+    integer_units = True
+    date_format = None
+    format_inferred = False
+    for chunk in chunks:
+        rows_read += len(chunk)
+        if not format_inferred:
+            # Infer the date format once, from the first date - as pd.to_datetime does
+            # for a whole file - so ambiguous day/month dates parse the same in every chunk
+            dates = chunk[date_col].dropna()
+            if len(dates):
+                date_format = guess_datetime_format(dates.iloc[0])
+                format_inferred = True
+        partial, chunk_valid = _aggregate_monthly(
+            chunk, date_col, category_col, units_col, categories, date_format=date_format
+        )
+        valid_rows += chunk_valid
+        integer_units = integer_units and pd.api.types.is_integer_dtype(partial)
+        totals = partial if totals is None else totals.add(partial, fill_value=0)
+
+    if rows_read == 0:
+        raise ValueError("The uploaded file is empty. Please upload a file with data.")
+    if valid_rows == 0:
+        raise ValueError("No valid dates found in the uploaded data.")
+
+    # add(fill_value=0) widens integer sums to float; keep the single-pass dtype
+    if integer_units:
+        totals = totals.astype("int64")
+    return totals
+
+
+def prepare_categories_from_file(
+    source: IO,
+    date_col: str = "Date",
+    category_col: str = "Category",
+    units_col: str = "Units_Sold",
+    categories: Optional[List[str]] = None,
+    chunksize: Optional[int] = None
+) -> Tuple[Dict[str, pd.DataFrame], Dict[str, str]]:
+    """
+    Stream an uploaded file in chunks and build per-category monthly series.
+    
+    See stream_monthly_totals for the memory behaviour and raised errors.
+    
+    Returns:
+        tuple: (prepared, errors) as returned by prepare_all_categories
+    """
+    totals = stream_monthly_totals(source, date_col, category_col, units_col, categories, chunksize)
+    return split_monthly_totals(totals, categories)
+
+
 def get_data_summary(monthly_df: pd.DataFrame) -> dict:
     """
     Generate a summary of the prepared data.
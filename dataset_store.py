@@ -0,0 +1,268 @@
+# backend/dataset_store.py
+# ------------------------
+# Responsibility:
+# - Server-side dataset sessions: parse an upload once, reuse it by dataset_id
+# - In-memory LRU of parsed datasets, spilled to local Parquet (pickle fallback)
+# - dataset_id = content hash of the raw upload + column mapping, so re-uploads dedupe
+
+import hashlib
+import json
+import os
+import re
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from typing import IO, Dict, List, Optional
+
+import pandas as pd
+
+from config import settings
+from data_preparation import stream_monthly_totals, split_monthly_totals
+
+_DATASET_ID = re.compile(r"[0-9a-f]{64}")
+
+
+def make_dataset_id(source: IO, date_col: str, category_col: str, units_col: str) -> str:
+    """
+    Hash the raw upload and its column mapping without loading it into memory.
+
+    Args:
+        source: Readable, seekable file object; rewound afterwards
+        date_col, category_col, units_col: Column mapping used to parse it
+
+    Returns:
+        str: Hex digest identifying this upload
+    """
+    hasher = hashlib.sha256()
+    hasher.update(json.dumps([date_col, category_col, units_col]).encode("utf-8"))
+    for block in iter(lambda: source.read(1024 * 1024), b""):
+        hasher.update(block if isinstance(block, bytes) else block.encode("utf-8"))
+    source.seek(0)
+    return hasher.hexdigest()
+
+
+class DatasetStore:
+    """
+    Parsed upload sessions keyed by dataset_id.
+
+    Each dataset is stored as its (category, month) totals - a few rows per
+    category regardless of how large the upload was - plus its metadata.
+    Recently used datasets stay in memory; every dataset is also written to
+    disk so it survives eviction, restarts and other worker processes.
+    """
+
+    def __init__(self, storage_dir: str, max_memory_entries: int = 16, max_disk_entries: int = 256):
+        self.storage_dir = storage_dir
+        self.max_memory_entries = max_memory_entries
+        self.max_disk_entries = max_disk_entries
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+
+    def create(
+        self,
+        source: IO,
+        date_col: str,
+        category_col: str,
+        units_col: str
+    ) -> dict:
+        """
+        Parse an upload and register it as a dataset.
+
+        Uploading the same file with the same mapping again returns the
+        existing dataset without re-parsing it.
+
+        Returns:
+            dict: Dataset metadata (see describe())
+
+        Raises:
+            ValueError: If the upload cannot be parsed
+        """
+        dataset_id = make_dataset_id(source, date_col, category_col, units_col)
+
+        existing = self.get(dataset_id)
+        if existing is not None:
+            return self.describe(existing)
+
+        totals = stream_monthly_totals(source, date_col, category_col, units_col)
+        prepared, errors = split_monthly_totals(totals)
+
+        record = {
+            "dataset_id": dataset_id,
+            "date_col": date_col,
+            "category_col": category_col,
+            "units_col": units_col,
+            "created_at": datetime.now().isoformat(),
+            "prepared": prepared,
+            "errors": errors
+        }
+
+        self._write(record, totals)
+        self._remember(record)
+        return self.describe(record)
+
+    def get(self, dataset_id: str) -> Optional[dict]:
+        """
+        Look up a dataset, loading it from disk if it was evicted from memory.
+
+        Returns:
+            dict: Record with 'prepared' and 'errors' as returned by
+                  prepare_all_categories, or None if unknown
+        """
+        # dataset_id ends up in a file path - only accept our own digests
+        if not _DATASET_ID.fullmatch(dataset_id):
+            return None
+
+        with self._lock:
+            record = self._memory.get(dataset_id)
+            if record is not None:
+                self._memory.move_to_end(dataset_id)
+                return record
+
+        record = self._read(dataset_id)
+        if record is not None:
+            self._remember(record)
+        return record
+
+    def delete(self, dataset_id: str) -> bool:
+        """
+        Remove a dataset from memory and disk.
+
+        Returns:
+            bool: True if the dataset existed
+        """
+        if not _DATASET_ID.fullmatch(dataset_id):
+            return False
+
+        with self._lock:
+            found = self._memory.pop(dataset_id, None) is not None
+
+        for path in self._paths(dataset_id).values():
+            if os.path.exists(path):
+                found = True
+                self._remove(path)
+        return found
+
+    @staticmethod
+    def describe(record: dict) -> dict:
+        """Public metadata of a dataset record."""
+        prepared = record["prepared"]
+        return {
+            "dataset_id": record["dataset_id"],
+            "created_at": record["created_at"],
+            "columns": {
+                "date_col": record["date_col"],
+                "category_col": record["category_col"],
+                "units_col": record["units_col"]
+            },
+            "categories": sorted(prepared),
+            "insufficient_categories": record["errors"],
+            "months_per_category": {c: len(df) for c, df in sorted(prepared.items())}
+        }
+
+    def stats(self) -> dict:
+        """Get store usage statistics."""
+        return {
+            "in_memory": len(self._memory),
+            "on_disk": len(self._disk_entries()),
+            "max_memory_entries": self.max_memory_entries,
+            "max_disk_entries": self.max_disk_entries
+        }
+
+    def _remember(self, record: dict):
+        with self._lock:
+            self._memory[record["dataset_id"]] = record
+            self._memory.move_to_end(record["dataset_id"])
+            while len(self._memory) > self.max_memory_entries:
+                self._memory.popitem(last=False)
+
+    def _paths(self, dataset_id: str) -> Dict[str, str]:
+        base = os.path.join(self.storage_dir, dataset_id)
+        return {"meta": f"{base}.json", "parquet": f"{base}.parquet", "pickle": f"{base}.pkl"}
+
+    def _write(self, record: dict, totals: pd.Series):
+        """Spill a dataset to disk as a long (category, ds, y) frame plus metadata."""
+        os.makedirs(self.storage_dir, exist_ok=True)
+        paths = self._paths(record["dataset_id"])
+
+        frame = totals.rename("y").rename_axis(["category", "ds"]).reset_index()
+        frame["category"] = frame["category"].astype(str)
+        try:
+            frame.to_parquet(paths["parquet"], index=False)
+        except ImportError:
+            # No pyarrow / fastparquet installed
+            frame.to_pickle(paths["pickle"])
+
+        meta = {k: record[k] for k in ("dataset_id", "date_col", "category_col", "units_col", "created_at")}
+        with open(paths["meta"], "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+
+        self._evict_disk()
+
+    def _read(self, dataset_id: str) -> Optional[dict]:
+        paths = self._paths(dataset_id)
+        try:
+            with open(paths["meta"], "r", encoding="utf-8") as f:
+                record = json.load(f)
+            if os.path.exists(paths["parquet"]):
+                frame = pd.read_parquet(paths["parquet"])
+            else:
+                frame = pd.read_pickle(paths["pickle"])
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # Corrupt or incompatible entry - drop it, the client re-uploads
+            for path in paths.values():
+                self._remove(path)
+            return None
+
+        # Mark as most recently used
+        try:
+            os.utime(paths["meta"], None)
+        except OSError:
+            pass
+
+        totals = frame.set_index(["category", "ds"])["y"]
+        record["prepared"], record["errors"] = split_monthly_totals(totals)
+        return record
+
+    def _disk_entries(self) -> List[tuple]:
+        """List stored datasets as (dataset_id, mtime), oldest first."""
+        if not os.path.isdir(self.storage_dir):
+            return []
+
+        entries = []
+        for name in os.listdir(self.storage_dir):
+            if not name.endswith(".json"):
+                continue
+            try:
+                mtime = os.stat(os.path.join(self.storage_dir, name)).st_mtime
+            except OSError:
+                continue
+            entries.append((name[:-len(".json")], mtime))
+
+        entries.sort(key=lambda e: e[1])
+        return entries
+
+    def _evict_disk(self):
+        with self._lock:
+            entries = self._disk_entries()
+            while len(entries) > self.max_disk_entries:
+                dataset_id, _ = entries.pop(0)
+                self._memory.pop(dataset_id, None)
+                for path in self._paths(dataset_id).values():
+                    self._remove(path)
+
+    @staticmethod
+    def _remove(path: str):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+# Global store instance
+dataset_store = DatasetStore(
+    storage_dir=settings.dataset_dir,
+    max_memory_entries=settings.dataset_memory_entries,
+    max_disk_entries=settings.dataset_disk_entries
+)
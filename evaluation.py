@@ -7,9 +7,11 @@
 
 import pandas as pd
 import numpy as np
-from typing import Optional, Dict
-from prophet import Prophet
+import time
+from typing import Optional, Dict, List
 from prophet.diagnostics import cross_validation, performance_metrics
+from prophet_model import DemandProphetModel
+from config import settings, validate_forecast_horizon
 
 
 def calculate_basic_metrics(actual: pd.Series, predicted: pd.Series) -> Dict[str, float]:
@@ -49,20 +51,55 @@ def calculate_basic_metrics(actual: pd.Series, predicted: pd.Series) -> Dict[str
     }
 
 
+def _monthly_cutoffs(
+    monthly_df: pd.DataFrame,
+    initial_months: int,
+    period_months: int,
+    horizon: pd.Timedelta,
+    max_cutoffs: Optional[int] = None
+) -> list:
+    """
+    Pick month-aligned cutoff dates for cross-validation.
+    
+    Cutoffs start after `initial_months` of training data, are spaced
+    `period_months` apart and leave a full horizon of actuals after each one.
+    When capped, the most recent cutoffs are kept.
+    """
+    dates = monthly_df["ds"].sort_values().reset_index(drop=True)
+    last_allowed = dates.iloc[-1] - horizon
+    
+    cutoffs = [
+        dates.iloc[i]
+        for i in range(initial_months - 1, len(dates), period_months)
+        if dates.iloc[i] <= last_allowed
+    ]
+    
+    if max_cutoffs:
+        cutoffs = cutoffs[-max_cutoffs:]
+    return cutoffs
+
+
 def run_cross_validation(
     monthly_df: pd.DataFrame,
     initial_months: int = 12,
     period_months: int = 1,
-    horizon_months: int = 1
+    horizon_months: int = 1,
+    parallel: Optional[str] = None,
+    max_cutoffs: Optional[int] = None
 ) -> Optional[Dict]:
     """
     Run Prophet cross-validation for model evaluation.
     
+    Uses the same adaptive DemandProphetModel configuration as the forecast
+    endpoint, and refits one model per cutoff in parallel when requested.
+    
     Args:
         monthly_df: Historical monthly data with 'ds' and 'y' columns
         initial_months: Initial training period in months
         period_months: Spacing between cutoff dates
         horizon_months: Forecast horizon to evaluate
+        parallel: 'processes', 'threads' or None (serial) for per-cutoff fits
+        max_cutoffs: Keep only the most recent N cutoffs (default: all)
         
     Returns:
         dict: Cross-validation metrics or None if insufficient data
@@ -78,23 +115,35 @@ def run_cross_validation(
             "metrics": None
         }
     
+    if parallel not in (None, "processes", "threads"):
+        return {
+            "status": "error",
+            "message": f"Invalid parallel mode '{parallel}'. Use 'processes', 'threads' or None.",
+            "metrics": None
+        }
+    
     try:
-        # Train model
-        model = Prophet(
-            yearly_seasonality=True,
-            weekly_seasonality=False,
-            daily_seasonality=False,
-            seasonality_mode="multiplicative"
-        )
-        model.add_country_holidays(country_name='IN')
-        model.fit(monthly_df)
+        # Train the adaptive model (goes through the fitted model cache)
+        model = DemandProphetModel(data_months=data_months)
+        model.train(monthly_df)
+        
+        # 31 days always reaches the next month start without spilling past it
+        horizon = pd.Timedelta(days=horizon_months * 31)
+        cutoffs = _monthly_cutoffs(monthly_df, initial_months, period_months, horizon, max_cutoffs)
+        
+        if not cutoffs:
+            return {
+                "status": "insufficient_data",
+                "message": "No cutoff leaves a full forecast horizon of actuals",
+                "metrics": None
+            }
         
         # Run cross-validation
         cv_results = cross_validation(
-            model,
-            initial=f"{initial_months * 30} days",
-            period=f"{period_months * 30} days",
-            horizon=f"{horizon_months * 30} days"
+            model.model,
+            horizon=horizon,
+            cutoffs=cutoffs,
+            parallel=parallel
         )
         
         # Calculate performance metrics
@@ -104,7 +153,7 @@ def run_cross_validation(
         avg_metrics = {
             "mae": round(float(metrics_df["mae"].mean()), 2),
             "rmse": round(float(metrics_df["rmse"].mean()), 2),
-            "mape": round(float(metrics_df["mape"].mean() * 100), 2),  # Convert to percentage
+            "mape": round(float(metrics_df["mape"].mean() * 100), 2) if "mape" in metrics_df else None,  # Convert to percentage
             "coverage": round(float(metrics_df["coverage"].mean() * 100), 2) if "coverage" in metrics_df else None
         }
         
@@ -114,6 +163,9 @@ def run_cross_validation(
             "metrics": avg_metrics,
             "cv_details": {
                 "initial_training_months": initial_months,
+                "horizon_months": horizon_months,
+                "cutoffs": len(cutoffs),
+                "parallel": parallel,
                 "evaluation_points": len(cv_results)
             }
         }
@@ -153,19 +205,20 @@ def evaluate_forecast_accuracy(
     test_df = monthly_df.iloc[-holdout_months:].copy()
     
     try:
-        # Train model
-        model = Prophet(
+        # Train model (goes through the fitted model cache)
+        model = DemandProphetModel(
             yearly_seasonality=True,
             weekly_seasonality=False,
             daily_seasonality=False,
-            seasonality_mode="multiplicative"
+            seasonality_mode="multiplicative",
+            add_country_holidays="IN",
+            precision="fast"  # Only point predictions are scored
         )
-        model.add_country_holidays(country_name='IN')
-        model.fit(train_df)
+        model.train(train_df)
         
         # Forecast for holdout period
-        future = model.make_future_dataframe(periods=holdout_months, freq="MS")
-        forecast = model.predict(future)
+        future = model.model.make_future_dataframe(periods=holdout_months, freq="MS")
+        forecast = model.model.predict(future)
         
         # Get predictions for holdout period
         predictions = forecast.iloc[-holdout_months:]["yhat"].values
@@ -204,6 +257,160 @@ def evaluate_forecast_accuracy(
         }
 
 
+def score_model_holdout(model, monthly_df: pd.DataFrame, holdout_months: int = 3) -> Dict[str, float]:
+    """
+    Train any forecaster on all but the last `holdout_months` and score it.
+    
+    Args:
+        model: Untrained forecaster with train()/forecast() (Prophet or statistical)
+        monthly_df: Complete monthly data
+        holdout_months: Number of months to hold out for testing
+        
+    Returns:
+        dict: MAE, RMSE and MAPE on the holdout months
+    """
+    train_df = monthly_df.iloc[:-holdout_months].copy()
+    test_df = monthly_df.iloc[-holdout_months:]
+    
+    model.train(train_df)
+    predictions = model.forecast(holdout_months)["Forecasted_Units"].to_numpy(dtype=float)
+    
+    return calculate_basic_metrics(
+        pd.Series(test_df["y"].to_numpy(dtype=float)),
+        pd.Series(predictions)
+    )
+
+
+def run_backtest(
+    monthly_df: pd.DataFrame,
+    horizons: Optional[List[int]] = None,
+    min_train_months: Optional[int] = None,
+    max_origins: Optional[int] = None,
+    warm_start: bool = True,
+    precision: str = "fast"
+) -> Dict:
+    """
+    Rolling-origin backtest across many forecast origins and horizons.
+    
+    For each origin the adaptive model is trained on all data up to that
+    month and scored on the following 1..max(horizons) months. Each fit is
+    warm-started from the previous origin's parameters, which converge in far
+    fewer optimizer iterations than cold fits on nearly identical data.
+    
+    Args:
+        monthly_df: Complete monthly data with 'ds' and 'y' columns
+        horizons: Forecast horizons in months (default: allowed horizons for the data length)
+        min_train_months: Training months at the first origin (default: settings.min_months_for_analysis)
+        max_origins: Keep only the most recent N origins (default: settings.backtest_max_origins)
+        warm_start: Initialize each fit from the previous origin's parameters
+        precision: 'full' or 'fast' uncertainty estimation for coverage
+        
+    Returns:
+        dict: Per-origin/per-horizon error table plus aggregated metrics
+    """
+    
+    data_months = len(monthly_df)
+    monthly_df = monthly_df.sort_values("ds").reset_index(drop=True)
+    
+    if horizons is None:
+        horizons = validate_forecast_horizon(data_months, 1)["allowed_horizons"]
+    horizons = sorted(set(h for h in horizons if h >= 1))
+    min_train_months = max(min_train_months or settings.min_months_for_analysis, settings.min_months_for_analysis)
+    max_origins = max_origins or settings.backtest_max_origins
+    
+    # An origin needs at least one actual month after it
+    origins = list(range(min_train_months, data_months))
+    if not horizons or not origins:
+        return {
+            "status": "insufficient_data",
+            "message": f"Need more than {min_train_months} months for a backtest, have {data_months}",
+            "metrics": None
+        }
+    origins = origins[-max_origins:]
+    
+    started = time.perf_counter()
+    rows = []
+    init = None
+    warm_fits = 0
+    
+    try:
+        for origin in origins:
+            train_df = monthly_df.iloc[:origin]
+            remaining = data_months - origin
+            periods = min(max(horizons), remaining, settings.max_forecast_horizon)
+            
+            model = DemandProphetModel(data_months=origin, precision=precision)
+            model.train(train_df, init=init if warm_start else None)
+            if init is not None and warm_start and not model.loaded_from_cache:
+                warm_fits += 1
+            init = model.get_warm_start_params()
+            
+            forecast_df = model.forecast(periods)
+            
+            for h in horizons:
+                if h > periods:
+                    continue
+                actual = float(monthly_df["y"].iloc[origin + h - 1])
+                predicted = float(forecast_df["Forecasted_Units"].iloc[h - 1])
+                lower = float(forecast_df["Lower_Bound"].iloc[h - 1])
+                upper = float(forecast_df["Upper_Bound"].iloc[h - 1])
+                
+                rows.append({
+                    "origin": train_df["ds"].iloc[-1].strftime("%Y-%m-%d"),
+                    "target_date": monthly_df["ds"].iloc[origin + h - 1].strftime("%Y-%m-%d"),
+                    "horizon": h,
+                    "train_months": origin,
+                    "actual": actual,
+                    "predicted": predicted,
+                    "lower_bound": lower,
+                    "upper_bound": upper,
+                    "error": round(predicted - actual, 2),
+                    "abs_pct_error": round(abs(predicted - actual) / actual * 100, 2) if actual != 0 else None,
+                    "covered": lower <= actual <= upper
+                })
+    
+    except Exception as e:
+        return {
+            "status": "error",
+            "message": f"Backtest failed: {str(e)}",
+            "metrics": None
+        }
+    
+    if not rows:
+        return {
+            "status": "insufficient_data",
+            "message": "No origin has actuals for the requested horizons",
+            "metrics": None
+        }
+    
+    table = pd.DataFrame(rows)
+    
+    def _aggregate(frame: pd.DataFrame) -> Dict:
+        metrics = calculate_basic_metrics(frame["actual"].reset_index(drop=True), frame["predicted"].reset_index(drop=True))
+        metrics["coverage"] = round(float(frame["covered"].mean() * 100), 2)
+        metrics["evaluations"] = len(frame)
+        return metrics
+    
+    return {
+        "status": "success",
+        "message": f"Backtest completed over {len(origins)} origins",
+        "metrics": _aggregate(table),
+        "metrics_by_horizon": {
+            str(h): _aggregate(group) for h, group in table.groupby("horizon")
+        },
+        "backtest_details": {
+            "origins": len(origins),
+            "horizons": horizons,
+            "first_origin": rows[0]["origin"],
+            "last_origin": rows[-1]["origin"],
+            "warm_started_fits": warm_fits,
+            "precision": precision,
+            "elapsed_seconds": round(time.perf_counter() - started, 2)
+        },
+        "results": rows
+    }
+
+
 def _interpret_accuracy(score: float) -> str:
     """Interpret accuracy score for business users."""
     if score >= 90:
@@ -251,7 +458,7 @@ def get_model_diagnostics(monthly_df: pd.DataFrame) -> Dict:
     quality_checks = {
         "has_sufficient_data": data_months >= 12,
         "has_yearly_seasonality_data": data_months >= 24,
-        "has_zero_values": (monthly_df["y"] == 0).any(),
+        "has_zero_values": bool((monthly_df["y"] == 0).any()),
         "has_missing_months": False  # Already aggregated by month
     }
     
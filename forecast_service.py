@@ -3,11 +3,25 @@
 # Responsibility:
 # - Adaptive forecasting based on data quality
 # - Run forecasting model with appropriate warnings
+# - Route short or intermittent series to lightweight statistical models
+# - Auto-select the best forecaster per category and remember the winner
 # - Calculate comprehensive metrics
+# - Fan multi-category batch forecasts out across a shared process pool
 
 import pandas as pd
+import math
+import multiprocessing
+import os
+import threading
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Iterator, List, Optional
 from prophet_model import DemandProphetModel
-from config import settings, get_data_quality_tier
+from statistical_models import STATISTICAL_MODELS
+from evaluation import score_model_holdout
+from selection_cache import selection_cache
+from data_preparation import prepare_all_categories
+from config import settings, get_data_quality_tier, validate_forecast_horizon
 
 
 def calculate_trend(mom_change: float) -> str:
@@ -87,9 +101,147 @@ def calculate_yoy_change(monthly_df: pd.DataFrame, forecasted_units: int) -> flo
     return None
 
 
+FORECASTER_TYPES = ["prophet"] + list(STATISTICAL_MODELS)
+
+
+def select_forecaster(monthly_df: pd.DataFrame, model_type: str = None, precision: str = None):
+    """
+    Build the forecaster for a series.
+    
+    With no explicit model_type, intermittent series (many zero months) use
+    Croston/SBA and low-tier series (6-11 months) use a damped Holt trend,
+    both of which fit in microseconds. Everything else uses adaptive Prophet.
+    
+    Args:
+        monthly_df: Monthly data with 'ds' and 'y' columns
+        model_type: One of FORECASTER_TYPES, or None for rule-based selection
+        precision: 'full' or 'fast' uncertainty estimation
+        
+    Returns:
+        Untrained forecaster exposing the DemandProphetModel interface
+    """
+    data_months = len(monthly_df)
+    
+    if model_type is None:
+        model_type = "prophet"
+        if settings.statistical_fallback_enabled:
+            zero_ratio = float((monthly_df["y"] == 0).mean()) if data_months else 0.0
+            if zero_ratio >= settings.intermittent_zero_ratio:
+                model_type = "sba"
+            elif get_data_quality_tier(data_months)["tier"] == "low":
+                model_type = "damped_holt"
+    
+    if model_type == "prophet":
+        return DemandProphetModel(data_months=data_months, precision=precision)
+    if model_type in STATISTICAL_MODELS:
+        return STATISTICAL_MODELS[model_type](data_months, precision)
+    
+    raise ValueError(f"Unknown model type '{model_type}'. Use one of: {', '.join(FORECASTER_TYPES)}")
+
+
+def _data_fingerprint(monthly_df: pd.DataFrame) -> dict:
+    """
+    Coarse description of a series used to decide whether a remembered
+    auto-selection winner is still valid.
+    
+    New or removed months always change it; small revisions to values do not,
+    because the level is bucketed in ~10% steps.
+    """
+    mean = float(monthly_df["y"].mean())
+    return {
+        "start": monthly_df["ds"].min().strftime("%Y-%m"),
+        "end": monthly_df["ds"].max().strftime("%Y-%m"),
+        "months": len(monthly_df),
+        "zero_months": int((monthly_df["y"] == 0).sum()),
+        "level_bucket": int(round(math.log(mean, 1.1))) if mean > 0 else None
+    }
+
+
+def auto_select_model(
+    monthly_df: pd.DataFrame,
+    candidates: Optional[List[str]] = None,
+    holdout_months: Optional[int] = None,
+    use_cache: bool = True
+) -> dict:
+    """
+    Score candidate forecasters on a short holdout and pick the best one.
+    
+    Candidates are scored by holdout MAE. Prophet is only chosen when it
+    beats the best cheap model by settings.auto_select_prophet_margin, so
+    the expensive fit runs only where it actually pays off. The winner is
+    remembered per category and data fingerprint.
+    
+    Args:
+        monthly_df: Monthly data with 'ds' and 'y' columns
+        candidates: Forecaster types to compare (default: settings.auto_select_candidates)
+        holdout_months: Months held out for scoring (default: settings.auto_select_holdout_months)
+        use_cache: Reuse a remembered winner when the data has not changed materially
+        
+    Returns:
+        dict: 'model_type' of the winner, per-candidate 'scores' and 'from_cache'
+    """
+    candidates = candidates or settings.auto_select_candidates
+    holdout_months = holdout_months or settings.auto_select_holdout_months
+    category = monthly_df.attrs.get("category", "")
+    fingerprint = _data_fingerprint(monthly_df)
+    
+    if use_cache and settings.auto_select_cache_enabled:
+        remembered = selection_cache.get_winner(category, fingerprint)
+        if remembered and remembered.get("candidates") == list(candidates):
+            return {**remembered, "from_cache": True}
+    
+    # Not enough history to hold anything out - use the rule-based choice
+    if len(monthly_df) - holdout_months < settings.min_months_for_analysis:
+        fallback = select_forecaster(monthly_df).get_model_info()["model_type"]
+        return {
+            "model_type": fallback,
+            "scores": {},
+            "candidates": list(candidates),
+            "holdout_months": holdout_months,
+            "from_cache": False
+        }
+    
+    train_months = len(monthly_df) - holdout_months
+    scores = {}
+    for model_type in candidates:
+        try:
+            model = select_forecaster(monthly_df.iloc[:train_months], model_type=model_type, precision="fast")
+            scores[model_type] = score_model_holdout(model, monthly_df, holdout_months)
+        except Exception:
+            # A candidate that cannot fit this series simply drops out
+            continue
+    
+    cheap = {m: s for m, s in scores.items() if m != "prophet"}
+    if cheap:
+        winner = min(cheap, key=lambda m: cheap[m]["mae"])
+        if "prophet" in scores and scores["prophet"]["mae"] < cheap[winner]["mae"] * (1 - settings.auto_select_prophet_margin):
+            winner = "prophet"
+    elif scores:
+        winner = "prophet"
+    else:
+        winner = select_forecaster(monthly_df).get_model_info()["model_type"]
+    
+    selection = {
+        "model_type": winner,
+        "scores": scores,
+        "candidates": list(candidates),
+        "holdout_months": holdout_months
+    }
+    
+    if use_cache and settings.auto_select_cache_enabled and scores:
+        try:
+            selection_cache.put_winner(category, fingerprint, selection)
+        except Exception:
+            pass
+    
+    return {**selection, "from_cache": False}
+
+
 def run_demand_forecast(
     monthly_df: pd.DataFrame,
-    periods: int = 1
+    periods: int = 1,
+    precision: str = None,
+    model_type: str = None
 ) -> dict:
     """
     Run adaptive demand forecasting with comprehensive validation.
@@ -97,6 +249,9 @@ def run_demand_forecast(
     Args:
         monthly_df: Pre-aggregated monthly data with 'ds' and 'y' columns
         periods: Number of months to forecast (default: 1)
+        precision: 'full' or 'fast' uncertainty estimation (default: settings.forecast_precision)
+        model_type: Forecaster to use, 'auto' for a holdout tournament
+                    (default: chosen by data quality, see select_forecaster)
         
     Returns:
         dict: Complete forecast results including metrics, warnings, and data quality info
@@ -120,8 +275,13 @@ def run_demand_forecast(
             "Please upload more historical sales data to generate a forecast."
         )
 
-    # 2️⃣ Initialize ADAPTIVE Prophet model
-    model = DemandProphetModel(data_months=data_months)
+    # 2️⃣ Initialize ADAPTIVE model (Prophet or lightweight statistical fallback)
+    selection = None
+    if model_type == "auto":
+        selection = auto_select_model(monthly_df)
+        model_type = selection["model_type"]
+    
+    model = select_forecaster(monthly_df, model_type=model_type, precision=precision)
     model.train(monthly_df)
     
     # Get model configuration info
@@ -230,9 +390,12 @@ def run_demand_forecast(
         
         # === MODEL INFO ===
         "model_config": {
+            "model_type": model_info["model_type"],
             "yearly_seasonality_enabled": model_info["yearly_seasonality_enabled"],
             "holidays_enabled": model_info["holidays_enabled"],
-            "seasonality_mode": model_info["seasonality_mode"]
+            "seasonality_mode": model_info["seasonality_mode"],
+            "precision": model_info["precision"],
+            "selection": selection
         },
         
         # === WARNINGS & RECOMMENDATIONS ===
@@ -243,3 +406,207 @@ def run_demand_forecast(
         "history_data": history_for_plot,
         "forecast_data": forecast_for_plot
     }
+
+
+_batch_pool: Optional[ProcessPoolExecutor] = None
+_batch_pool_lock = threading.Lock()
+
+
+def batch_pool_size() -> int:
+    """Worker processes in the shared batch forecast pool."""
+    return settings.batch_forecast_workers or os.cpu_count() or 1
+
+
+def get_batch_pool() -> ProcessPoolExecutor:
+    """
+    Shared worker process pool for batch forecasts, created on first use.
+    
+    Workers are started with settings.batch_forecast_start_method rather than
+    the platform default: forking a server process that already runs threads
+    can copy locks held by other threads into the child.
+    """
+    global _batch_pool
+    with _batch_pool_lock:
+        if _batch_pool is None:
+            _batch_pool = ProcessPoolExecutor(
+                max_workers=batch_pool_size(),
+                mp_context=multiprocessing.get_context(settings.batch_forecast_start_method)
+            )
+        return _batch_pool
+
+
+def _discard_batch_pool(pool: ProcessPoolExecutor):
+    """Replace a pool that broke (a worker died) so the next batch gets a fresh one."""
+    global _batch_pool
+    with _batch_pool_lock:
+        if _batch_pool is pool:
+            _batch_pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def shutdown_batch_pool():
+    """Stop the worker processes (app shutdown). Queued fits are cancelled."""
+    global _batch_pool
+    with _batch_pool_lock:
+        pool, _batch_pool = _batch_pool, None
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _forecast_category(
+    category: str,
+    monthly_df: pd.DataFrame,
+    periods: int,
+    precision: str = None,
+    model_type: str = None
+) -> dict:
+    """
+    Forecast a single category inside a batch worker process.
+    
+    Errors are returned as part of the result instead of raised so that one
+    bad category never aborts the rest of the batch.
+    """
+    try:
+        validation = validate_forecast_horizon(len(monthly_df), periods)
+        if not validation["valid"]:
+            return {"category": category, "status": "error", "message": validation["message"]}
+        
+        forecast_result = run_demand_forecast(
+            monthly_df=monthly_df,
+            periods=periods,
+            precision=precision,
+            model_type=model_type
+        )
+        return {"category": category, "status": "success", **forecast_result}
+    except Exception as e:
+        return {"category": category, "status": "error", "message": str(e)}
+
+
+def run_batch_forecast(
+    df: pd.DataFrame,
+    date_col: str = "Date",
+    category_col: str = "Category",
+    units_col: str = "Units_Sold",
+    periods: int = 1,
+    categories: Optional[List[str]] = None,
+    max_workers: Optional[int] = None,
+    precision: str = None,
+    model_type: str = None
+) -> Iterator[dict]:
+    """
+    Forecast many categories from one raw DataFrame in parallel.
+    
+    The raw data is aggregated for all categories in one pass and the
+    category fits run on the shared worker process pool, so throughput
+    scales with CPU cores.
+    
+    Args:
+        df: Raw input DataFrame containing every category
+        date_col: Name of the date column in input
+        category_col: Name of the category column in input
+        units_col: Name of the units sold column in input
+        periods: Number of months to forecast per category
+        categories: Optional subset of categories to forecast (default: all)
+        max_workers: Categories fitted at once (default and cap: batch_pool_size())
+        precision: 'full' or 'fast' uncertainty estimation (default: settings.forecast_precision)
+        model_type: Forecaster for every category, or 'auto' (default: rule-based)
+        
+    Yields:
+        dict: One result per category, in completion order. Each has
+              'category' and 'status' keys plus either the full
+              run_demand_forecast output or an error 'message'.
+    """
+    # 1️⃣ Parse and aggregate every category in one pass
+    try:
+        prepared, errors = prepare_all_categories(
+            df=df,
+            date_col=date_col,
+            category_col=category_col,
+            units_col=units_col,
+            categories=categories
+        )
+    except ValueError as ve:
+        yield {"category": None, "status": "error", "message": str(ve)}
+        return
+    
+    # 2️⃣ Fan the model fits out across worker processes
+    yield from forecast_prepared_categories(
+        prepared=prepared,
+        errors=errors,
+        periods=periods,
+        max_workers=max_workers,
+        precision=precision,
+        model_type=model_type
+    )
+
+
+def forecast_prepared_categories(
+    prepared: Dict[str, pd.DataFrame],
+    errors: Optional[Dict[str, str]] = None,
+    periods: int = 1,
+    max_workers: Optional[int] = None,
+    precision: str = None,
+    model_type: str = None
+) -> Iterator[dict]:
+    """
+    Forecast already-aggregated categories on the shared worker process pool.
+    
+    At most max_workers categories of this batch are queued or running at a
+    time, so one large batch does not occupy every worker of the pool.
+    
+    Args:
+        prepared: Category to monthly DataFrame, as from prepare_all_categories
+        errors: Category to preparation error, reported before any forecast
+        periods: Number of months to forecast per category
+        max_workers: Categories fitted at once (default and cap: batch_pool_size())
+        precision: 'full' or 'fast' uncertainty estimation (default: settings.forecast_precision)
+        model_type: Forecaster for every category, or 'auto' (default: rule-based)
+        
+    Yields:
+        dict: One result per category, in completion order
+    """
+    for category, message in (errors or {}).items():
+        yield {"category": category, "status": "error", "message": message}
+    
+    if not prepared:
+        return
+    
+    window = min(max_workers or batch_pool_size(), batch_pool_size())
+    remaining = iter(prepared.items())
+    futures = {}
+    
+    def submit_next():
+        for category, monthly_df in remaining:
+            args = (_forecast_category, category, monthly_df, periods, precision, model_type)
+            pool = get_batch_pool()
+            try:
+                future = pool.submit(*args)
+            except BrokenProcessPool:
+                _discard_batch_pool(pool)
+                pool = get_batch_pool()
+                future = pool.submit(*args)
+            futures[future] = (category, pool)
+            return
+    
+    for _ in range(window):
+        submit_next()
+    
+    try:
+        while futures:
+            done, _ = wait(futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                category, pool = futures.pop(future)
+                try:
+                    result = future.result()
+                except Exception as e:
+                    # Worker crashed (e.g. killed by the OS) rather than returning
+                    if isinstance(e, BrokenProcessPool):
+                        _discard_batch_pool(pool)
+                    result = {"category": category, "status": "error", "message": str(e)}
+                submit_next()
+                yield result
+    finally:
+        # Consumer stopped early (client disconnected): drop this batch's
+        # queued categories; fits already running finish in the shared pool
+        for future in futures:
+            future.cancel()
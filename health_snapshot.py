@@ -0,0 +1,254 @@
+# backend/health_snapshot.py
+# --------------------------
+# Responsibility:
+# - Materialized inputs of the supply chain health score (health_snapshots, one row)
+# - Incremental maintenance: every ORM flush that touches products, suppliers or
+#   purchase orders applies its delta to the row in the same transaction
+# - Full rebuild and consistency check:
+#     python health_snapshot.py           # rebuild from the source tables
+#     python health_snapshot.py --check   # report drift without writing
+
+import sys
+from collections import Counter
+from datetime import datetime, timezone
+
+from sqlalchemy import event, inspect, insert, select, update, delete, func
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+import models
+
+SNAPSHOT_ID = 1
+PENDING_PO_STATUSES = ("DRAFT", "APPROVED")
+TOTAL_FIELDS = ("critical_items", "pending_pos", "rated_suppliers", "reliability_sum")
+TRACKED_MODELS = (models.Product, models.Supplier, models.PurchaseOrder)
+
+_snapshot_table = models.HealthSnapshot.__table__
+
+
+def is_critical(current_stock, optimal_stock_level) -> bool:
+    """Python twin of models.product_stock_ratio < CRITICAL_STOCK_RATIO (NULL ratio = not critical)."""
+    if current_stock is None:
+        return False
+    if not optimal_stock_level:
+        # No optimal level: only negative stock is low
+        return current_stock < 0
+    return current_stock / optimal_stock_level < models.CRITICAL_STOCK_RATIO
+
+
+def compute_totals(session: Session) -> dict:
+    """Recompute the snapshot totals from the source tables."""
+    critical_items = session.scalar(
+        select(func.count()).select_from(models.Product).where(
+            models.product_stock_ratio < models.CRITICAL_STOCK_RATIO
+        )
+    )
+    pending_pos = session.scalar(
+        select(func.count()).select_from(models.PurchaseOrder).where(
+            models.PurchaseOrder.status.in_(PENDING_PO_STATUSES)
+        )
+    )
+    rated_suppliers, reliability_sum = session.execute(
+        select(
+            func.count(models.Supplier.reliability_score),
+            func.coalesce(func.sum(models.Supplier.reliability_score), 0.0)
+        )
+    ).one()
+    return {
+        "critical_items": critical_items,
+        "pending_pos": pending_pos,
+        "rated_suppliers": rated_suppliers,
+        "reliability_sum": float(reliability_sum)
+    }
+
+
+def _insert_placeholder_row(session: Session) -> bool:
+    """
+    Insert an all-zero, not yet rebuilt row unless one exists (INSERT ... ON CONFLICT DO NOTHING).
+
+    Returns:
+        bool: True if the row was inserted
+    """
+    values = {"id": SNAPSHOT_ID, "rebuilt_at": None, **{field: 0 for field in TOTAL_FIELDS}}
+    dialect = session.get_bind().dialect.name
+    if dialect in ("postgresql", "sqlite"):
+        dialect_insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+        result = session.execute(
+            dialect_insert(_snapshot_table).values(**values).on_conflict_do_nothing(index_elements=["id"])
+        )
+        return result.rowcount > 0
+    try:
+        with session.begin_nested():
+            session.execute(insert(_snapshot_table).values(**values))
+        return True
+    except IntegrityError:
+        return False
+
+
+def rebuild_snapshot(session: Session) -> models.HealthSnapshot:
+    """
+    Recompute the snapshot and store it. The caller commits the rebuilt row.
+
+    The row must exist and be locked before the totals are computed:
+    writers that commit earlier are waited for and included in the totals,
+    later ones wait and apply their deltas on top. So a missing row is
+    first inserted as a placeholder and committed (this also commits any
+    pending work in the session), then locked with SELECT ... FOR UPDATE.
+    """
+    if _insert_placeholder_row(session):
+        session.commit()
+
+    snapshot = session.execute(
+        select(models.HealthSnapshot)
+        .where(models.HealthSnapshot.id == SNAPSHOT_ID)
+        .with_for_update()
+        .execution_options(populate_existing=True)
+    ).scalar_one()
+
+    for field, value in compute_totals(session).items():
+        setattr(snapshot, field, value)
+    now = datetime.now(timezone.utc)
+    snapshot.updated_at = now
+    snapshot.rebuilt_at = now
+    session.flush()
+    return snapshot
+
+
+def get_snapshot(session: Session) -> models.HealthSnapshot:
+    """
+    Read the snapshot, building it first if it does not exist yet (new
+    database, dropped after a bulk write, or a placeholder whose rebuild
+    has not committed).
+    """
+    snapshot = session.get(models.HealthSnapshot, SNAPSHOT_ID, populate_existing=True)
+    if snapshot is not None and snapshot.rebuilt_at is not None:
+        return snapshot
+
+    snapshot = rebuild_snapshot(session)
+    session.commit()
+    return snapshot
+
+
+def check_snapshot(session: Session) -> dict:
+    """
+    Compare the stored snapshot against a fresh recomputation.
+
+    Returns:
+        dict: field -> {'stored', 'actual'} for every field that drifted
+              (every field if there is no snapshot yet)
+    """
+    snapshot = session.get(models.HealthSnapshot, SNAPSHOT_ID)
+    actual = compute_totals(session)
+    drift = {}
+    for field, value in actual.items():
+        stored = getattr(snapshot, field) if snapshot is not None else None
+        if stored is None or abs(stored - value) > 1e-6:
+            drift[field] = {"stored": stored, "actual": value}
+    return drift
+
+
+# --- Incremental maintenance ---
+
+def _column_default(obj, key):
+    default = obj.__table__.c[key].default
+    return default.arg if default is not None and default.is_scalar else None
+
+
+def _current(obj, key):
+    value = getattr(obj, key)
+    if value is None and inspect(obj).pending:
+        # Column defaults are only applied by the INSERT
+        value = _column_default(obj, key)
+    return value
+
+
+def _previous(obj, key):
+    history = inspect(obj).attrs[key].history
+    if history.deleted:
+        return history.deleted[0]
+    return getattr(obj, key)
+
+
+def _contribution(obj, value) -> Counter:
+    """What one row adds to the snapshot totals, reading fields through value(obj, key)."""
+    if isinstance(obj, models.Product):
+        critical = is_critical(value(obj, "current_stock"), value(obj, "optimal_stock_level"))
+        return Counter(critical_items=int(critical))
+    if isinstance(obj, models.PurchaseOrder):
+        return Counter(pending_pos=int(value(obj, "status") in PENDING_PO_STATUSES))
+    if isinstance(obj, models.Supplier):
+        reliability = value(obj, "reliability_score")
+        if reliability is None:
+            return Counter()
+        return Counter(rated_suppliers=1, reliability_sum=reliability)
+    return Counter()
+
+
+@event.listens_for(Session, "before_flush")
+def _apply_flush_delta(session, flush_context, instances):
+    delta = {field: 0 for field in TOTAL_FIELDS}
+
+    def add(counter: Counter, sign: int):
+        for field, value in counter.items():
+            delta[field] += sign * value
+
+    for obj in session.new:
+        if isinstance(obj, TRACKED_MODELS):
+            add(_contribution(obj, _current), 1)
+    for obj in session.deleted:
+        if isinstance(obj, TRACKED_MODELS):
+            add(_contribution(obj, _previous), -1)
+    for obj in session.dirty:
+        if isinstance(obj, TRACKED_MODELS) and session.is_modified(obj):
+            add(_contribution(obj, _current), 1)
+            add(_contribution(obj, _previous), -1)
+
+    if not any(delta.values()):
+        return
+
+    # Relative UPDATE: concurrent transactions add up instead of overwriting each other.
+    # No row yet = nothing to maintain; it is built from scratch on first read.
+    session.connection().execute(
+        update(_snapshot_table)
+        .where(_snapshot_table.c.id == SNAPSHOT_ID)
+        .values(
+            updated_at=func.now(),
+            **{field: _snapshot_table.c[field] + change for field, change in delta.items() if change}
+        )
+    )
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _invalidate_on_bulk_write(orm_execute_state):
+    """Bulk ORM insert / update / delete skip the flush - drop the row so the next read rebuilds it."""
+    if not (orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    if any(mapper.class_ in TRACKED_MODELS for mapper in orm_execute_state.all_mappers):
+        orm_execute_state.session.connection().execute(
+            delete(_snapshot_table).where(_snapshot_table.c.id == SNAPSHOT_ID)
+        )
+
+
+if __name__ == "__main__":
+    import database
+
+    db = database.SessionLocal()
+    try:
+        drift = check_snapshot(db)
+        for field, values in drift.items():
+            print(f"⚠️  {field}: stored {values['stored']}, actual {values['actual']}")
+
+        if "--check" in sys.argv[1:]:
+            print("✅ Health snapshot is consistent." if not drift else f"❌ {len(drift)} field(s) drifted.")
+            sys.exit(1 if drift else 0)
+
+        print("🛠️  Rebuilding health snapshot...")
+        snapshot = rebuild_snapshot(db)
+        db.commit()
+        print(
+            f"✅ Rebuilt: {snapshot.critical_items} critical items, {snapshot.pending_pos} pending POs, "
+            f"{snapshot.rated_suppliers} rated suppliers"
+        )
+    finally:
+        db.close()
@@ -1,11 +1,13 @@
 # init_db.py
-from database import engine, SessionLocal
+from database import SessionLocal
+from migrate import upgrade_database
+import health_snapshot  # keeps the health snapshot in sync with seeded rows
 import models
 from datetime import datetime, timedelta
 
 # 1. Create the Database Tables
 print("🛠️  Creating database tables...")
-models.Base.metadata.create_all(bind=engine)
+upgrade_database()
 
 # 2. Start a Session
 db = SessionLocal()
@@ -0,0 +1,233 @@
+# backend/job_queue.py
+# --------------------
+# Responsibility:
+# - Run long forecast / evaluation requests off the event loop
+# - Bounded worker pool plus a cap on queued jobs
+# - Status, progress, result and cooperative cancellation per job id
+
+import threading
+import time
+import traceback
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+from config import settings
+
+
+class JobCancelled(Exception):
+    """Raised inside a job when cancellation was requested."""
+
+
+class QueueFull(Exception):
+    """Raised when too many jobs are already waiting."""
+
+
+class Job:
+    """
+    A unit of background work and its observable state.
+
+    The work function receives the Job itself and may call report() to
+    publish progress and check_cancelled() between stages to stop early.
+    """
+
+    def __init__(self, kind: str, description: str = None):
+        self.job_id = uuid.uuid4().hex
+        self.kind = kind
+        self.description = description
+        self.status = "queued"
+        self.progress = 0.0
+        self.message = "Waiting for a free worker"
+        self.result = None
+        self.error = None
+        self.created_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+
+        self._cancel_requested = threading.Event()
+        self._future = None
+        self._on_finish = None
+
+    def report(self, progress: float, message: str = None):
+        """Publish progress (0-1) and an optional status message."""
+        self.check_cancelled()
+        self.progress = round(min(max(progress, 0.0), 1.0), 3)
+        if message:
+            self.message = message
+
+    def check_cancelled(self):
+        """Stop the job if cancellation was requested."""
+        if self._cancel_requested.is_set():
+            raise JobCancelled()
+
+    @property
+    def finished(self) -> bool:
+        return self.status in ("succeeded", "failed", "cancelled")
+
+    def to_dict(self, include_result: bool = True) -> dict:
+        """Public view of the job."""
+        info = {
+            "job_id": self.job_id,
+            "kind": self.kind,
+            "description": self.description,
+            "status": self.status,
+            "progress": self.progress,
+            "message": self.message,
+            "error": self.error,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "runtime_seconds": (
+                round((self.finished_at or time.time()) - self.started_at, 2)
+                if self.started_at else None
+            )
+        }
+        if include_result:
+            info["result"] = self.result
+        return info
+
+
+class JobQueue:
+    """
+    Bounded background job runner.
+
+    At most max_workers jobs run at once and at most max_queued wait for a
+    worker; further submissions are rejected. Finished jobs are kept for
+    result_ttl seconds so clients can poll for their results.
+    """
+
+    def __init__(self, max_workers: int = 2, max_queued: int = 32, result_ttl: int = 3600):
+        self.max_workers = max_workers
+        self.max_queued = max_queued
+        self.result_ttl = result_ttl
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="job")
+        self._jobs: Dict[str, Job] = {}
+        self._lock = threading.Lock()
+
+    def submit(
+        self,
+        kind: str,
+        work: Callable[[Job], object],
+        description: str = None,
+        on_finish: Callable[[], None] = None
+    ) -> Job:
+        """
+        Queue a job.
+
+        Args:
+            kind: Job type label (e.g. 'forecast', 'evaluate')
+            work: Callable taking the Job and returning a JSON-serializable result
+            description: Optional human readable label
+            on_finish: Optional cleanup hook run after the job ends, whatever the outcome
+
+        Returns:
+            Job: The queued job
+
+        Raises:
+            QueueFull: If max_queued jobs are already waiting
+        """
+        self._purge_expired()
+
+        with self._lock:
+            queued = sum(1 for job in self._jobs.values() if job.status == "queued")
+            if queued >= self.max_queued:
+                raise QueueFull(
+                    f"Job queue is full ({queued} jobs waiting). Please retry later."
+                )
+
+            job = Job(kind, description)
+            job._on_finish = on_finish
+            self._jobs[job.job_id] = job
+            job._future = self._executor.submit(self._run, job, work)
+
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        return self._jobs.get(job_id)
+
+    def list(self) -> List[Job]:
+        self._purge_expired()
+        return sorted(self._jobs.values(), key=lambda job: job.created_at, reverse=True)
+
+    def cancel(self, job_id: str) -> Optional[Job]:
+        """
+        Cancel a job. Queued jobs never start; running jobs stop at their
+        next progress checkpoint.
+
+        Returns:
+            Job: The job, or None if unknown
+        """
+        job = self._jobs.get(job_id)
+        if job is None or job.finished:
+            return job
+
+        job._cancel_requested.set()
+        if job._future is not None and job._future.cancel():
+            job.status = "cancelled"
+            job.message = "Cancelled before start"
+            job.finished_at = time.time()
+            self._cleanup(job)
+        else:
+            job.message = "Cancellation requested"
+        return job
+
+    def stats(self) -> dict:
+        """Get queue usage statistics."""
+        counts = {"queued": 0, "running": 0, "succeeded": 0, "failed": 0, "cancelled": 0}
+        for job in list(self._jobs.values()):
+            counts[job.status] += 1
+        return {**counts, "max_workers": self.max_workers, "max_queued": self.max_queued}
+
+    def _run(self, job: Job, work: Callable[[Job], object]):
+        try:
+            job.check_cancelled()
+            job.status = "running"
+            job.started_at = time.time()
+            job.message = "Running"
+
+            job.result = work(job)
+
+            job.status = "succeeded"
+            job.progress = 1.0
+            job.message = "Completed"
+        except JobCancelled:
+            job.status = "cancelled"
+            job.message = "Cancelled"
+        except Exception as e:
+            # HTTPException carries its message in .detail and 4xx codes are client errors
+            job.status = "failed"
+            job.error = getattr(e, "detail", None) or str(e)
+            job.message = "Failed"
+            if getattr(e, "status_code", 500) >= 500:
+                print(f"Job {job.job_id} ({job.kind}) Error: {job.error}")
+                print(traceback.format_exc())
+        finally:
+            job.finished_at = time.time()
+            self._cleanup(job)
+
+    @staticmethod
+    def _cleanup(job: Job):
+        if job._on_finish is not None:
+            try:
+                job._on_finish()
+            except Exception:
+                pass
+            job._on_finish = None
+
+    def _purge_expired(self):
+        cutoff = time.time() - self.result_ttl
+        with self._lock:
+            expired = [
+                job_id for job_id, job in self._jobs.items()
+                if job.finished and job.finished_at < cutoff
+            ]
+            for job_id in expired:
+                del self._jobs[job_id]
+
+
+# Global queue instance
+job_queue = JobQueue(
+    max_workers=settings.job_workers,
+    max_queued=settings.job_max_queued,
+    result_ttl=settings.job_result_ttl_seconds
+)
@@ -1,33 +1,60 @@
-from fastapi import FastAPI, Depends, HTTPException, UploadFile, Form
+from fastapi import FastAPI, Depends, HTTPException, UploadFile, Form, Query, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import exc as sa_exc, select, func, case
+from typing import Dict, List, Optional
 from datetime import datetime, timedelta
+from contextlib import asynccontextmanager
 from pydantic import BaseModel
 from openai import OpenAI
 import models, database
+import numpy as np
 import pandas as pd
 import io
 import json
 import os
+import shutil
+import tempfile
 import traceback
 from dotenv import load_dotenv
 from geopy.geocoders import Nominatim
 import requests
 import re
 
-from data_preparation import prepare_category_data, get_data_summary
-from forecast_service import run_demand_forecast
+from data_preparation import prepare_categories_from_file, get_data_summary
+from forecast_service import (
+    run_demand_forecast, forecast_prepared_categories, batch_pool_size, shutdown_batch_pool, FORECASTER_TYPES
+)
 from ai_insight_service import generate_ai_insight
-from evaluation import evaluate_forecast_accuracy, get_model_diagnostics
+from evaluation import evaluate_forecast_accuracy, get_model_diagnostics, run_cross_validation, run_backtest
 from config import settings, get_festivals_for_month, validate_forecast_horizon
 from ai_agent import SupplyChainAgent
+from model_cache import model_cache
+from selection_cache import selection_cache
+from dataset_store import dataset_store
+from job_queue import job_queue, Job, QueueFull
+from compute_executor import compute_executor
+from migrate import upgrade_database
+from reasoning_cache import reasoning_cache
+from supplier_index import supplier_index, normalize_weights, top_k
+import health_snapshot
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # Stop the batch forecast worker processes with the server
+    shutdown_batch_pool()
+
 
 # Initialize FastAPI app
 app = FastAPI(
     title=settings.app_name,
     version=settings.app_version,
-    description="Adaptive AI-powered demand forecasting with comprehensive insights"
+    description="Adaptive AI-powered demand forecasting with comprehensive insights",
+    lifespan=lifespan
 )
 
 # FIXED CORS - Allow all origins for development
@@ -37,6 +64,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 # --- 1. CONFIGURATION & SETUP ---
 load_dotenv()
@@ -47,8 +75,18 @@ client = OpenAI(
     base_url="https://api.groq.com/openai/v1"
 )
 
-# Initialize Database
-models.Base.metadata.create_all(bind=database.engine)
+# Initialize Database - apply pending migrations (alembic upgrade head)
+if settings.db_auto_migrate:
+    upgrade_database()
+
+@app.exception_handler(sa_exc.TimeoutError)
+async def db_pool_timeout_handler(request, exc):
+    """Fail fast with 503 when every pooled connection is busy"""
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "Database is busy - no connection available. Please retry shortly."},
+        headers={"Retry-After": "1"}
+    )
 
 # Initialize Geocoder
 geolocator = Nominatim(user_agent="scm_app_free_v1")
@@ -90,6 +128,22 @@ class SupplierCreate(BaseModel):
     delivery_speed_days: int = 5
     price_per_unit: float = 10.0
 
+class SupplierUpdate(BaseModel):
+    contact_email: Optional[str] = None
+    category: Optional[str] = None
+    reliability_score: Optional[float] = None
+    delivery_speed_days: Optional[int] = None
+    price_per_unit: Optional[float] = None
+    delivery_cost: Optional[float] = None
+
+class ScoreMatrixRequest(BaseModel):
+    product_ids: Optional[List[int]] = None      # None = every product
+    category: Optional[str] = None               # only products in this category
+    weights: Optional[Dict[str, float]] = None   # reliability / lead_time / price, default 40/30/30
+    same_category_only: bool = False            # only suppliers in the product's category
+    top_k: int = 5
+    include_matrix: bool = False                # full products x suppliers scores (large)
+
 # Purchase Order Schemas
 class POCreate(BaseModel):
     supplier_id: int
@@ -247,28 +301,21 @@ def parse_product_info_local(description: str):
 
 # --- NEW: PROCUREMENT-SPECIFIC HELPER FUNCTIONS ---
 
-def calculate_supply_chain_health_score(db: Session):
+def calculate_supply_chain_health_score(critical_items: int, avg_reliability: Optional[float], pending_pos: int):
     """
     Calculates a comprehensive health score (0-100) based on:
-    - Critical stock items
+    - Critical stock items (count of products below 20% of optimal)
     - Pending POs
-    - Supplier reliability
+    - Supplier reliability (average, None when there are no suppliers)
     """
-    products = db.query(models.Product).all()
-    suppliers = db.query(models.Supplier).all()
-    pending_pos = db.query(models.PurchaseOrder).filter(
-        models.PurchaseOrder.status.in_(["DRAFT", "APPROVED"])
-    ).count()
-    
-    # Calculate critical items (< 20% of optimal)
-    critical_items = sum(1 for p in products if p.current_stock < (p.optimal_stock_level * 0.2))
     critical_penalty = min(critical_items * 5, 40)  # Max 40 points penalty
     
     # Pending PO penalty
     po_penalty = min(pending_pos * 3, 20)  # Max 20 points penalty
     
     # Supplier reliability (average)
-    avg_reliability = sum(s.reliability_score for s in suppliers) / len(suppliers) if suppliers else 90
+    if avg_reliability is None:
+        avg_reliability = 90
     supplier_bonus = (avg_reliability - 80) / 2  # Bonus if above 80
     
     health_score = 100 - critical_penalty - po_penalty + supplier_bonus
@@ -298,41 +345,14 @@ def calculate_supplier_score(supplier, product_price=None):
     score = (reliability_norm * 0.4) + (lead_time_norm * 0.3) + (price_norm * 0.3)
     return round(score * 100, 2)
 
-def find_best_supplier_for_product(product, db: Session):
-    """
-    Finds the best supplier match for a given product using smart logic
-    """
-    suppliers = db.query(models.Supplier).filter(
-        models.Supplier.category == product.category
-    ).all()
-    
-    if not suppliers:
-        # Fallback to any supplier
-        suppliers = db.query(models.Supplier).all()
-    
-    if not suppliers:
-        return None
-    
-    # Score all suppliers
-    supplier_scores = []
-    for supplier in suppliers:
-        score = calculate_supplier_score(supplier, product.unit_price)
-        supplier_scores.append({
-            "supplier": supplier,
-            "score": score
-        })
-    
-    # Sort by score descending
-    supplier_scores.sort(key=lambda x: x["score"], reverse=True)
-    return supplier_scores[0]["supplier"] if supplier_scores else None
+FALLBACK_MORNING_BRIEFING = "Market conditions are stable. Review critical items and expedite pending orders. Health score indicates attention needed in supply chain operations. Prioritize addressing critical inventory levels and monitor pending purchase orders closely."
 
-def generate_ai_morning_briefing(health_score, critical_count, pending_pos, db: Session):
+def generate_ai_morning_briefing(health_score, critical_count, pending_pos, critical_products: list):
     """
-    Uses LLM to generate a strategic morning briefing
+    Uses LLM to generate a strategic morning briefing.
+    Returns a callable making the blocking LLM call (raises on failure),
+    resolved through reasoning_cache like the urgency reasonings.
     """
-    products = db.query(models.Product).all()
-    critical_products = [p.name for p in products if p.current_stock < (p.optimal_stock_level * 0.2)][:3]
-    
     prompt = f"""
     You are a Supply Chain Director AI. Generate a comprehensive morning briefing (detailed analysic and one paragraph ).
     
@@ -353,21 +373,22 @@ def generate_ai_morning_briefing(health_score, critical_count, pending_pos, db:
     Tone: Professional, actionable, and strategic. Highlight the most urgent concern first, then provide comprehensive analysis.
     """
     
-    try:
+    def call_llm():
         response = client.chat.completions.create(
             model="llama-3.3-70b-versatile",
-            messages=[{"role": "user", "content": prompt}]
+            messages=[{"role": "user", "content": prompt}],
+            timeout=settings.llm_reasoning_timeout_seconds
         )
         return response.choices[0].message.content
-    except:
-        return "Market conditions are stable. Review critical items and expedite pending orders. Health score indicates attention needed in supply chain operations. Prioritize addressing critical inventory levels and monitor pending purchase orders closely."
+    
+    return call_llm
 
-def generate_urgency_reasoning(product, supplier):
+def generate_urgency_reasoning(product, supplier, stock_pct):
     """
-    Uses LLM to explain WHY a product needs urgent attention
+    Uses LLM to explain WHY a product needs urgent attention.
+    Returns a callable making the blocking LLM call (raises on failure), so
+    the prompt is built from the ORM objects before they leave the session.
     """
-    stock_pct = (product.current_stock / product.optimal_stock_level * 100) if product.optimal_stock_level > 0 else 0
-    
     prompt = f"""
     Generate a 1-2 sentence urgent reasoning for procurement.
     
@@ -378,63 +399,95 @@ def generate_urgency_reasoning(product, supplier):
     Be direct and actionable.
     """
     
-    try:
+    def call_llm():
         response = client.chat.completions.create(
             model="llama-3.3-70b-versatile",
-            messages=[{"role": "user", "content": prompt}]
+            messages=[{"role": "user", "content": prompt}],
+            timeout=settings.llm_reasoning_timeout_seconds
         )
         return response.choices[0].message.content
-    except:
-        return f"Stock critically low at {stock_pct:.0f}%. Immediate replenishment required."
+    
+    return call_llm
+
+def fallback_urgency_reasoning(product, supplier, stock_pct):
+    """Deterministic reasoning used while the LLM text is not cached yet"""
+    return (
+        f"Stock critically low at {stock_pct:.0f}% of optimal. Immediate replenishment required - "
+        f"{supplier.name} can deliver in {supplier.delivery_speed_days} days."
+    )
 
 # --- 4. API ENDPOINTS ---
 
 # --- NEW: PROCUREMENT ENDPOINTS ---
 
 @app.get("/procurement/health")
-def get_procurement_health(db: Session = Depends(database.get_db)):
+async def get_procurement_health(db: AsyncSession = Depends(database.get_async_db)):
     """
-    Returns comprehensive supply chain health metrics
+    Returns comprehensive supply chain health metrics.
+    Counts come from the incrementally maintained health snapshot.
     """
-    health_score = calculate_supply_chain_health_score(db)
-    
-    products = db.query(models.Product).all()
-    critical_count = sum(1 for p in products if p.current_stock < (p.optimal_stock_level * 0.2))
-    
-    pending_pos = db.query(models.PurchaseOrder).filter(
-        models.PurchaseOrder.status.in_(["DRAFT", "APPROVED"])
-    ).count()
-    
-    briefing = generate_ai_morning_briefing(health_score, critical_count, pending_pos, db)
+    snapshot = await db.run_sync(health_snapshot.get_snapshot)
+    critical_count = snapshot.critical_items
+    pending_pos = snapshot.pending_pos
+    
+    # Most depleted first, for the briefing examples (index range scan, LIMIT 3)
+    critical_products = []
+    if critical_count:
+        critical_products = (await db.execute(
+            select(models.Product.name)
+            .where(models.product_stock_ratio < models.CRITICAL_STOCK_RATIO)
+            .order_by(models.product_stock_ratio, models.Product.id).limit(3)
+        )).scalars().all()
+    
+    health_score = calculate_supply_chain_health_score(critical_count, snapshot.avg_reliability, pending_pos)
+    
+    # The LLM client is blocking - resolve through the cache on its worker pool
+    briefing_key = ("morning_briefing", round(health_score, 1), critical_count, pending_pos, tuple(critical_products))
+    briefings = await run_in_threadpool(
+        reasoning_cache.resolve,
+        {
+            briefing_key: (
+                generate_ai_morning_briefing(health_score, critical_count, pending_pos, list(critical_products)),
+                FALLBACK_MORNING_BRIEFING
+            )
+        },
+        settings.llm_reasoning_deadline_seconds
+    )
     
     return {
         "health_score": round(health_score, 1),
         "critical_items_count": critical_count,
         "pending_pos": pending_pos,
-        "morning_briefing": briefing,
-        "status": "CRITICAL" if health_score < 60 else "WARNING" if health_score < 80 else "HEALTHY"
+        "morning_briefing": briefings[briefing_key],
+        "status": "CRITICAL" if health_score < 60 else "WARNING" if health_score < 80 else "HEALTHY",
+        "snapshot_updated_at": snapshot.updated_at
     }
 
 @app.get("/procurement/recommendations")
 def get_smart_recommendations(db: Session = Depends(database.get_db)):
     """
-    Returns AI-powered procurement recommendations with matched suppliers
+    Returns AI-powered procurement recommendations with matched suppliers.
+    LLM reasonings are generated concurrently and cached; any not ready by
+    the deadline use fallback text and are served from cache next time.
     """
-    products = db.query(models.Product).all()
-    
-    # Identify products that need reordering
-    critical_products = [
-        p for p in products 
-        if p.current_stock < (p.optimal_stock_level * 0.5)
-    ]
+    # Products that need reordering, most depleted first - top 10
+    critical_products = db.query(models.Product).filter(
+        models.product_stock_ratio < models.REORDER_STOCK_RATIO
+    ).order_by(models.product_stock_ratio, models.Product.id).limit(10).all()
     
     recommendations = []
-    for product in critical_products[:10]:  # Limit to top 10
-        # Find best supplier
-        best_supplier = find_best_supplier_for_product(product, db)
-        
-        if not best_supplier:
+    reasoning_requests = {}
+    reasoning_keys = []
+    # Best supplier for every product in one vectorized lookup
+    matches = supplier_index.best_for_products(
+        db,
+        [p.category for p in critical_products],
+        [p.unit_price for p in critical_products]
+    )
+    for product, match in zip(critical_products, matches):
+        if not match:
             continue
+        best_supplier, supplier_score = match
         
         # Calculate urgency
         stock_pct = (product.current_stock / product.optimal_stock_level * 100) if product.optimal_stock_level > 0 else 0
@@ -455,11 +508,12 @@ def get_smart_recommendations(db: Session = Depends(database.get_db)):
         # Calculate estimated cost
         total_cost = qty_needed * product.unit_price
         
-        # Generate AI reasoning
-        reasoning = generate_urgency_reasoning(product, best_supplier)
-        
-        # Calculate supplier score
-        supplier_score = calculate_supplier_score(best_supplier, product.unit_price)
+        # Queue AI reasoning (resolved for all products at once below)
+        reasoning_key = (product.id, round(stock_pct), best_supplier.id)
+        reasoning_requests[reasoning_key] = (
+            generate_urgency_reasoning(product, best_supplier, stock_pct),
+            fallback_urgency_reasoning(product, best_supplier, stock_pct)
+        )
         
         recommendations.append({
             "product_id": product.id,
@@ -476,8 +530,15 @@ def get_smart_recommendations(db: Session = Depends(database.get_db)):
             "supplier_score": supplier_score,
             "delivery_days": best_supplier.delivery_speed_days,
             "estimated_cost": round(total_cost, 2),
-            "ai_reasoning": reasoning
+            "ai_reasoning": None
         })
+        reasoning_keys.append(reasoning_key)
+    
+    reasonings = reasoning_cache.resolve(
+        reasoning_requests, deadline=settings.llm_reasoning_deadline_seconds
+    )
+    for rec, key in zip(recommendations, reasoning_keys):
+        rec["ai_reasoning"] = reasonings[key]
     
     # Sort by urgency and stock percentage
     urgency_order = {"CRITICAL": 0, "HIGH": 1, "MEDIUM": 2}
@@ -485,22 +546,113 @@ def get_smart_recommendations(db: Session = Depends(database.get_db)):
     
     return recommendations
 
+@app.post("/procurement/suppliers/score_matrix")
+def get_supplier_score_matrix(request: ScoreMatrixRequest, db: Session = Depends(database.get_db)):
+    """
+    Scores every supplier against every (selected) product in one NumPy pass.
+    For what-if sourcing analysis: custom weights, top-k suppliers per product.
+    """
+    if request.top_k < 1:
+        raise HTTPException(status_code=400, detail="top_k must be at least 1")
+    
+    query = db.query(
+        models.Product.id, models.Product.name, models.Product.category, models.Product.unit_price
+    )
+    if request.product_ids is not None:
+        query = query.filter(models.Product.id.in_(request.product_ids))
+    if request.category:
+        query = query.filter(models.Product.category == request.category)
+    products = query.order_by(models.Product.id).all()
+    
+    try:
+        suppliers, scores = supplier_index.score_all(
+            db,
+            [p.category for p in products],
+            [p.unit_price for p in products],
+            weights=request.weights,
+            same_category_only=request.same_category_only
+        )
+        weights = normalize_weights(request.weights)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    best = top_k(scores, request.top_k)
+    best_scores = np.take_along_axis(scores, best, axis=1)
+    
+    results = []
+    for row, product in enumerate(products):
+        results.append({
+            "product_id": product.id,
+            "product_name": product.name,
+            "category": product.category,
+            "top_suppliers": [
+                {
+                    "supplier_id": suppliers[col].id,
+                    "supplier_name": suppliers[col].name,
+                    "score": float(score)
+                }
+                for col, score in zip(best[row], best_scores[row])
+                if np.isfinite(score)
+            ]
+        })
+    
+    response = {
+        "weights": {k: round(w, 4) for k, w in weights.items()},
+        "product_count": len(products),
+        "supplier_count": len(suppliers),
+        "products": results
+    }
+    
+    if request.include_matrix:
+        # Excluded suppliers (-inf) become null - JSON has no infinity
+        matrix = scores.astype(object)
+        matrix[~np.isfinite(scores)] = None
+        response["supplier_ids"] = [s.id for s in suppliers]
+        response["product_ids"] = [p.id for p in products]
+        response["matrix"] = matrix.tolist()
+    
+    # Plain Python types already - skip jsonable_encoder, which dominates at 5k x 300
+    return JSONResponse(content=response)
+
 @app.get("/procurement/suppliers/analysis")
 def analyze_suppliers(db: Session = Depends(database.get_db)):
     """
     Returns detailed supplier performance analysis
     """
-    suppliers = db.query(models.Supplier).all()
+    po = models.PurchaseOrder
+    
+    # PO history aggregated per supplier in the database
+    po_stats = (
+        select(
+            po.supplier_id,
+            func.count(po.id).label("total_pos"),
+            func.count(case((po.status == "RECEIVED", po.id))).label("completed_pos"),
+            func.sum(po.total_value).label("total_spend")
+        )
+        .group_by(po.supplier_id)
+        .subquery()
+    )
+    
+    suppliers = db.execute(
+        select(
+            models.Supplier.id,
+            models.Supplier.name,
+            models.Supplier.category,
+            models.Supplier.reliability_score,
+            models.Supplier.delivery_speed_days,
+            models.Supplier.price_per_unit,
+            func.coalesce(po_stats.c.total_pos, 0).label("total_pos"),
+            func.coalesce(po_stats.c.completed_pos, 0).label("completed_pos"),
+            func.coalesce(po_stats.c.total_spend, 0.0).label("total_spend")
+        )
+        .outerjoin(po_stats, po_stats.c.supplier_id == models.Supplier.id)
+        .order_by(models.Supplier.id)
+    ).all()
     
     analysis = []
     for supplier in suppliers:
-        # Get PO history
-        pos = db.query(models.PurchaseOrder).filter(
-            models.PurchaseOrder.supplier_id == supplier.id
-        ).all()
-        
-        total_pos = len(pos)
-        completed_pos = len([p for p in pos if p.status == "RECEIVED"])
+        total_pos = supplier.total_pos
+        completed_pos = supplier.completed_pos
         
         # Calculate on-time delivery rate
         on_time_rate = (completed_pos / total_pos * 100) if total_pos > 0 else 0
@@ -527,6 +679,8 @@ def analyze_suppliers(db: Session = Depends(database.get_db)):
             "delivery_speed_days": supplier.delivery_speed_days,
             "price_per_unit": supplier.price_per_unit,
             "total_pos": total_pos,
+            "completed_pos": completed_pos,
+            "total_spend": round(float(supplier.total_spend), 2),
             "on_time_delivery_rate": round(on_time_rate, 1),
             "overall_score": overall_score,
             "verdict": verdict,
@@ -562,6 +716,7 @@ def create_supplier(supplier: SupplierCreate, db: Session = Depends(database.get
     db.add(db_supplier)
     db.commit()
     db.refresh(db_supplier)
+    supplier_index.invalidate()
     
     # Calculate initial trust score
     trust_score = calculate_supplier_score(db_supplier)
@@ -572,6 +727,48 @@ def create_supplier(supplier: SupplierCreate, db: Session = Depends(database.get
         "initial_trust_score": trust_score
     }
 
+@app.put("/procurement/suppliers/{supplier_id}")
+def update_supplier(supplier_id: int, supplier: SupplierUpdate, db: Session = Depends(database.get_db)):
+    """
+    Updates supplier details and refreshes the supplier ranking index
+    """
+    db_supplier = db.query(models.Supplier).filter(models.Supplier.id == supplier_id).first()
+    if not db_supplier:
+        raise HTTPException(status_code=404, detail="Supplier not found")
+    
+    for field, value in supplier.dict(exclude_unset=True).items():
+        if value is not None:
+            setattr(db_supplier, field, value)
+    if supplier.delivery_speed_days is not None:
+        db_supplier.lead_time_days = supplier.delivery_speed_days  # Alias for compatibility
+    
+    db.commit()
+    supplier_index.invalidate()
+    return {"message": "Supplier updated successfully", "supplier_id": supplier_id}
+
+@app.delete("/procurement/suppliers/{supplier_id}")
+def delete_supplier(supplier_id: int, db: Session = Depends(database.get_db)):
+    """
+    Deletes a supplier that has no purchase orders
+    """
+    db_supplier = db.query(models.Supplier).filter(models.Supplier.id == supplier_id).first()
+    if not db_supplier:
+        raise HTTPException(status_code=404, detail="Supplier not found")
+    
+    po_count = db.query(func.count(models.PurchaseOrder.id)).filter(
+        models.PurchaseOrder.supplier_id == supplier_id
+    ).scalar()
+    if po_count:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Supplier has {po_count} purchase order(s) and cannot be deleted"
+        )
+    
+    db.delete(db_supplier)
+    db.commit()
+    supplier_index.invalidate()
+    return {"message": "Supplier deleted"}
+
 @app.post("/procurement/po/create")
 def create_purchase_order(po: POCreate, db: Session = Depends(database.get_db)):
     """
@@ -632,44 +829,89 @@ def create_purchase_order(po: POCreate, db: Session = Depends(database.get_db)):
         "expected_delivery": expected_delivery.strftime("%Y-%m-%d")
     }
 
+PO_STATUS_COLORS = {
+    "DRAFT": "#9E9E9E",
+    "APPROVED": "#2196F3",
+    "IN_TRANSIT": "#FF9800",
+    "RECEIVED": "#4CAF50"
+}
+
 @app.get("/procurement/po/list")
-def list_purchase_orders(db: Session = Depends(database.get_db)):
+async def list_purchase_orders(
+    response: Response,
+    status: Optional[str] = Query(None, description="Comma-separated statuses, e.g. DRAFT,APPROVED"),
+    priority: Optional[str] = Query(None, description="Comma-separated priorities, e.g. High,Urgent"),
+    supplier_id: Optional[int] = Query(None),
+    limit: Optional[int] = Query(None, ge=1, le=settings.po_list_max_limit),
+    cursor: Optional[int] = Query(None, description="X-Next-Cursor value from the previous page"),
+    db: AsyncSession = Depends(database.get_async_db)
+):
     """
-    Returns all purchase orders with enhanced details
+    Returns purchase orders with enhanced details, newest first.
+    
+    Suppliers are joined in the same query and only displayed columns are
+    fetched. Without limit every matching PO is returned; with limit the
+    next page's cursor is sent in the X-Next-Cursor header.
     """
-    pos = db.query(models.PurchaseOrder).all()
+    po = models.PurchaseOrder
+    query = (
+        select(
+            po.id,
+            po.po_number,
+            po.product_name,
+            po.quantity,
+            po.total_value,
+            po.status,
+            po.priority,
+            po.expected_delivery,
+            po.created_at,
+            models.Supplier.name.label("supplier_name")
+        )
+        .outerjoin(models.Supplier, models.Supplier.id == po.supplier_id)
+        .order_by(po.id.desc())
+    )
     
+    if status:
+        query = query.where(po.status.in_([s.strip() for s in status.split(",") if s.strip()]))
+    if priority:
+        query = query.where(po.priority.in_([p.strip() for p in priority.split(",") if p.strip()]))
+    if supplier_id is not None:
+        query = query.where(po.supplier_id == supplier_id)
+    if cursor is not None:
+        # Keyset pagination - ids are unique and follow creation order
+        query = query.where(po.id < cursor)
+    if limit is not None:
+        # One extra row tells us whether another page exists
+        query = query.limit(limit + 1)
+    
+    rows = (await db.execute(query)).all()
+    
+    if limit is not None and len(rows) > limit:
+        rows = rows[:limit]
+        response.headers["X-Next-Cursor"] = str(rows[-1].id)
+    
+    now = datetime.now()
     result = []
-    for po in pos:
-        supplier = db.query(models.Supplier).filter(models.Supplier.id == po.supplier_id).first()
-        
+    for row in rows:
         # Calculate days until delivery
-        if po.expected_delivery:
-            days_remaining = (po.expected_delivery - datetime.now()).days
+        if row.expected_delivery:
+            days_remaining = (row.expected_delivery - now).days
         else:
             days_remaining = 0
         
-        # Status color
-        status_colors = {
-            "DRAFT": "#9E9E9E",
-            "APPROVED": "#2196F3",
-            "IN_TRANSIT": "#FF9800",
-            "RECEIVED": "#4CAF50"
-        }
-        
         result.append({
-            "id": po.id,
-            "po_number": po.po_number,
-            "supplier_name": supplier.name if supplier else "Unknown",
-            "product_name": po.product_name,
-            "quantity": po.quantity,
-            "total_value": po.total_value,
-            "status": po.status,
-            "status_color": status_colors.get(po.status, "#757575"),
-            "priority": po.priority,
-            "expected_delivery": po.expected_delivery.strftime("%Y-%m-%d") if po.expected_delivery else "N/A",
+            "id": row.id,
+            "po_number": row.po_number,
+            "supplier_name": row.supplier_name or "Unknown",
+            "product_name": row.product_name,
+            "quantity": row.quantity,
+            "total_value": row.total_value,
+            "status": row.status,
+            "status_color": PO_STATUS_COLORS.get(row.status, "#757575"),
+            "priority": row.priority,
+            "expected_delivery": row.expected_delivery.strftime("%Y-%m-%d") if row.expected_delivery else "N/A",
             "days_remaining": days_remaining,
-            "created_at": po.created_at.strftime("%Y-%m-%d") if po.created_at else "N/A"
+            "created_at": row.created_at.strftime("%Y-%m-%d") if row.created_at else "N/A"
         })
     
     return result
@@ -1004,8 +1246,8 @@ def log_stock_movement(movement: StockMovement, db: Session = Depends(database.g
     return {"message": "Stock updated", "new_stock": product.current_stock}
 
 @app.get("/inventory/analysis")
-def analyze_inventory(db: Session = Depends(database.get_db)):
-    products = db.query(models.Product).all()
+async def analyze_inventory(db: AsyncSession = Depends(database.get_async_db)):
+    products = (await db.execute(select(models.Product))).scalars().all()
     results = []
     for p in products:
         status = "OK"
@@ -1043,8 +1285,8 @@ def create_order(order: OrderCreate, db: Session = Depends(database.get_db)):
     return db_order
 
 @app.get("/orders/", response_model=List[OrderResponse])
-def read_orders(db: Session = Depends(database.get_db)):
-    return db.query(models.Order).all()
+async def read_orders(db: AsyncSession = Depends(database.get_async_db)):
+    return (await db.execute(select(models.Order))).scalars().all()
 
 # --- FORECASTING,
 def str_to_bool(value: str) -> bool:
@@ -1054,6 +1296,147 @@ def str_to_bool(value: str) -> bool:
     return str(value).lower() in ('true', '1', 'yes', 'on')
 
 
+def validate_precision(precision: Optional[str]):
+    """Reject unknown forecast precision modes with a 400"""
+    if precision is not None and precision not in ("full", "fast"):
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid precision '{precision}'. Use 'full' or 'fast'."
+        )
+
+
+def validate_model_type(model_type: Optional[str]):
+    """Reject unknown forecaster types with a 400"""
+    if model_type is not None and model_type != "auto" and model_type not in FORECASTER_TYPES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid model_type '{model_type}'. Use 'auto' or one of: {', '.join(FORECASTER_TYPES)}"
+        )
+
+
+def resolve_categories(
+    file: Optional[UploadFile],
+    dataset_id: Optional[str],
+    date_col: Optional[str],
+    category_col: Optional[str],
+    units_col: Optional[str],
+    categories: Optional[List[str]] = None
+):
+    """
+    Get per-category monthly series from a stored dataset or an uploaded file.
+    
+    Returns:
+        tuple: (prepared, errors) as returned by prepare_all_categories
+    """
+    if dataset_id:
+        record = dataset_store.get(dataset_id)
+        if record is None:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Dataset '{dataset_id}' not found or expired. Upload it again via /datasets."
+            )
+        
+        prepared, errors = record["prepared"], record["errors"]
+        if categories is None:
+            return dict(prepared), dict(errors)
+        
+        return (
+            {c: prepared[c] for c in categories if c in prepared},
+            {
+                c: errors.get(c, f"No data available for category '{c}'. Please check if the category exists in your data.")
+                for c in categories if c not in prepared
+            }
+        )
+    
+    if file is None:
+        raise HTTPException(status_code=400, detail="Provide either a file or a dataset_id")
+    if not (date_col and category_col and units_col):
+        raise HTTPException(
+            status_code=400,
+            detail="date_col, category_col and units_col are required when uploading a file"
+        )
+    
+    try:
+        return prepare_categories_from_file(
+            file.file,
+            date_col=date_col,
+            category_col=category_col,
+            units_col=units_col,
+            categories=categories
+        )
+    except ValueError as ve:
+        raise HTTPException(status_code=400, detail=str(ve))
+
+
+def load_category_data(
+    file: Optional[UploadFile],
+    dataset_id: Optional[str],
+    category: str,
+    date_col: Optional[str],
+    category_col: Optional[str],
+    units_col: Optional[str]
+) -> pd.DataFrame:
+    """Return the monthly series for one category of a stored dataset or uploaded file"""
+    prepared, errors = resolve_categories(
+        file, dataset_id, date_col, category_col, units_col, categories=[category]
+    )
+    
+    if category in errors:
+        raise HTTPException(status_code=400, detail=errors[category])
+    # Stored datasets are shared between requests - hand out a private copy
+    return prepared[category].copy()
+
+
+def _json_default(value):
+    """JSON fallback for numpy scalars and timestamps in streamed results"""
+    if hasattr(value, "item"):
+        return value.item()
+    return str(value)
+
+
+def _to_jsonable(result):
+    """Plain-Python copy of a result, so numpy scalars never reach the response encoder"""
+    return json.loads(json.dumps(result, default=_json_default))
+
+
+def submit_job(kind: str, description: str, file: Optional[UploadFile], work) -> JSONResponse:
+    """
+    Queue work(upload, job) on the background job queue and return 202 with the job id.
+    
+    Request uploads are closed once the response is sent, so the file is
+    copied to a private temp file that lives until the job finishes.
+    The result is stored as plain JSON types, ready for GET /jobs/{job_id}.
+    """
+    upload = None
+    spooled = None
+    if file is not None:
+        spooled = tempfile.TemporaryFile()
+        shutil.copyfileobj(file.file, spooled)
+        spooled.seek(0)
+        upload = UploadFile(file=spooled, filename=file.filename)
+    
+    try:
+        job = job_queue.submit(
+            kind,
+            lambda job: _to_jsonable(work(upload, job=job)),
+            description=description,
+            on_finish=spooled.close if spooled is not None else None
+        )
+    except QueueFull as qf:
+        if spooled is not None:
+            spooled.close()
+        raise HTTPException(status_code=429, detail=str(qf))
+    
+    return JSONResponse(
+        status_code=202,
+        content={
+            "job_id": job.job_id,
+            "status": job.status,
+            "status_url": f"/jobs/{job.job_id}"
+        }
+    )
+
+
 @app.get("/")
 async def root():
     """Health check endpoint"""
@@ -1082,67 +1465,113 @@ async def health_check():
         "optimal_months": settings.optimal_months,
         "ai_model": settings.gemini_model,
         "max_forecast_horizon": settings.max_forecast_horizon,
-        "supported_countries": ["IN", "US", "UK"]
+        "supported_countries": ["IN", "US", "UK"],
+        "model_cache": model_cache.stats() if settings.model_cache_enabled else None,
+        "selection_cache": selection_cache.stats() if settings.auto_select_cache_enabled else None,
+        "datasets": dataset_store.stats(),
+        "jobs": job_queue.stats(),
+        "executor": compute_executor.stats(),
+        "reasoning_cache": reasoning_cache.stats(),
+        "supplier_index": supplier_index.stats()
     }
 
 
-@app.post("/validate-data")
-async def validate_data(
+@app.get("/db/pool")
+def get_db_pool_stats():
+    """Database connection pool statistics (checked-out, overflow, waits)."""
+    return database.get_pool_stats()
+
+
+@app.post("/datasets")
+@compute_executor.offload
+def create_dataset(
     file: UploadFile,
-    category: str = Form(...),
     date_col: str = Form(...),
     category_col: str = Form(...),
     units_col: str = Form(...)
+):
+    """
+    Parse an uploaded file once and keep it server-side.
+    
+    Accepts CSV (optionally gzip / zstd compressed), Parquet or Arrow IPC.
+    
+    The returned dataset_id can be passed to /validate-data, /forecast/upload,
+    /forecast/batch, /forecast/evaluate, /forecast/backtest and /data/summary
+    instead of re-uploading the file.
+    """
+    try:
+        return dataset_store.create(file.file, date_col, category_col, units_col)
+    except ValueError as ve:
+        raise HTTPException(status_code=400, detail=str(ve))
+    except Exception as e:
+        print(f"Dataset Error: {str(e)}")
+        print(traceback.format_exc())
+        raise HTTPException(
+            status_code=500,
+            detail=f"Server error while storing dataset: {str(e)}"
+        )
+
+
+@app.get("/datasets/{dataset_id}")
+def get_dataset(dataset_id: str):
+    """Get categories and column mapping of a stored dataset."""
+    record = dataset_store.get(dataset_id)
+    if record is None:
+        raise HTTPException(status_code=404, detail=f"Dataset '{dataset_id}' not found or expired")
+    return dataset_store.describe(record)
+
+
+@app.delete("/datasets/{dataset_id}")
+def delete_dataset(dataset_id: str):
+    """Remove a stored dataset."""
+    if not dataset_store.delete(dataset_id):
+        raise HTTPException(status_code=404, detail=f"Dataset '{dataset_id}' not found or expired")
+    return {"status": "deleted", "dataset_id": dataset_id}
+
+
+@app.get("/jobs")
+async def list_jobs():
+    """List background jobs, newest first (results omitted)."""
+    return {
+        "jobs": [job.to_dict(include_result=False) for job in job_queue.list()],
+        "queue": job_queue.stats()
+    }
+
+
+@app.get("/jobs/{job_id}")
+async def get_job(job_id: str):
+    """Get status, progress and - once finished - the result of a background job."""
+    job = job_queue.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job '{job_id}' not found or expired")
+    return job.to_dict()
+
+
+@app.delete("/jobs/{job_id}")
+async def cancel_job(job_id: str):
+    """Cancel a queued or running background job."""
+    job = job_queue.cancel(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job '{job_id}' not found or expired")
+    return job.to_dict(include_result=False)
+
+
+@app.post("/validate-data")
+@compute_executor.offload
+def validate_data(
+    file: Optional[UploadFile] = None,
+    dataset_id: str = Form(None),
+    category: str = Form(...),
+    date_col: str = Form(None),
+    category_col: str = Form(None),
+    units_col: str = Form(None)
 ):
     """
     Validate uploaded data and return horizon availability.
     """
     try:
-        # Read file
-        contents = await file.read()
-        
-        # Try to parse CSV
-        try:
-            df = pd.read_csv(io.BytesIO(contents))
-        except Exception as csv_error:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Failed to read CSV file. Please ensure it's a valid CSV format. Error: {str(csv_error)}"
-            )
-        
-        # Check if dataframe is empty
-        if df.empty:
-            raise HTTPException(
-                status_code=400,
-                detail="The uploaded CSV file is empty. Please upload a file with data."
-            )
-        
-        # Validate columns exist
-        missing_cols = []
-        for col, name in [(date_col, "Date"), (category_col, "Category"), (units_col, "Units")]:
-            if col not in df.columns:
-                missing_cols.append(f"{name} column '{col}'")
-        
-        if missing_cols:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Missing columns: {', '.join(missing_cols)}. Available columns: {', '.join(df.columns.tolist())}"
-            )
-        
-        # Prepare data
-        try:
-            monthly_df = prepare_category_data(
-                df=df,
-                category=category,
-                date_col=date_col,
-                category_col=category_col,
-                units_col=units_col
-            )
-        except ValueError as ve:
-            raise HTTPException(
-                status_code=400,
-                detail=str(ve)
-            )
+        # Stream and aggregate the uploaded data
+        monthly_df = load_category_data(file, dataset_id, category, date_col, category_col, units_col)
         
         data_months = len(monthly_df)
         data_summary = get_data_summary(monthly_df)
@@ -1186,13 +1615,158 @@ async def validate_data(
         )
 
 
+def build_forecast_response(
+    monthly_df: pd.DataFrame,
+    category: str,
+    horizon: int,
+    precision: Optional[str],
+    model_type: Optional[str],
+    factors: dict,
+    region: str,
+    country: str,
+    job: Optional[Job] = None
+) -> dict:
+    """
+    Forecast one category and enrich it with external factors and an AI insight.
+    Shared by /forecast/upload and background forecast jobs.
+    """
+    report = job.report if job else (lambda progress, message=None: None)
+    
+    data_months = len(monthly_df)
+    
+    # Validate horizon
+    validation = validate_forecast_horizon(data_months, horizon)
+    if not validation["valid"]:
+        raise HTTPException(
+            status_code=400,
+            detail=validation["message"]
+        )
+    
+    data_summary = get_data_summary(monthly_df)
+
+    # Run forecast
+    report(0.2, "Fitting forecast model")
+    try:
+        forecast_result = run_demand_forecast(
+            monthly_df=monthly_df,
+            periods=horizon,
+            precision=precision,
+            model_type=model_type
+        )
+    except ValueError as ve:
+        raise HTTPException(
+            status_code=400,
+            detail=str(ve)
+        )
+
+    # Prepare context
+    next_month = monthly_df["ds"].max() + pd.DateOffset(months=1)
+    month_name = next_month.strftime("%B %Y")
+    
+    # Get festivals
+    festivals_in_window = get_festivals_for_month(
+        next_month.strftime("%B"),
+        country
+    )
+
+    
+    # Parse external factors
+    external_factors_dict = {
+        "upcoming_promotion": str_to_bool(factors["upcoming_promotion"]),
+        "marketing_campaign": str_to_bool(factors["marketing_campaign"]),
+        "new_product_launch": str_to_bool(factors["new_product_launch"]),
+        "availability_issues": str_to_bool(factors["availability_issues"]),
+        "price_change": factors["price_change"],
+        "supply_chain_disruption": str_to_bool(factors["supply_chain_disruption"]),
+        "regulatory_changes": str_to_bool(factors["regulatory_changes"]),
+        "logistics_constraints": str_to_bool(factors["logistics_constraints"]),
+        "economic_uncertainty": factors["economic_uncertainty"],
+        "region": region
+    }
+                
+    # Build external factors summary
+    external_factors_summary = []
+    if external_factors_dict["upcoming_promotion"]:
+        external_factors_summary.append("Upcoming promotion planned")
+    if external_factors_dict["marketing_campaign"]:
+        external_factors_summary.append("Active marketing campaign")
+    if external_factors_dict["new_product_launch"]:
+        external_factors_summary.append("New product launch expected")
+    if external_factors_dict["availability_issues"]:
+        external_factors_summary.append("Availability constraints present")
+    if external_factors_dict["price_change"] != "Same":
+        external_factors_summary.append(f"Price change: {external_factors_dict['price_change']}")
+    if external_factors_dict["supply_chain_disruption"]:
+        external_factors_summary.append("Supply chain risk identified")
+    if external_factors_dict["regulatory_changes"]:
+        external_factors_summary.append("Regulatory changes expected")
+    if external_factors_dict["logistics_constraints"]:
+        external_factors_summary.append("Logistics constraints present")
+    if external_factors_dict["economic_uncertainty"] != "None":
+        external_factors_summary.append(f"Economic uncertainty: {external_factors_dict['economic_uncertainty']}")
+
+    # Enhance warnings
+    enhanced_warnings = forecast_result.get("warnings", []).copy()
+
+    if external_factors_dict["availability_issues"]:
+        enhanced_warnings.append("Availability constraints may limit ability to meet forecasted demand")
+    if external_factors_dict["supply_chain_disruption"]:
+        enhanced_warnings.append("Supply chain disruptions may impact fulfillment capacity")
+    if external_factors_dict["price_change"] == "Increase":
+        enhanced_warnings.append("Price increase may reduce actual demand below forecast")
+    elif external_factors_dict["price_change"] == "Decrease":
+        enhanced_warnings.append("Price decrease may drive demand above forecast")
+    if external_factors_dict["economic_uncertainty"] in ["Medium", "High"]:
+        enhanced_warnings.append(f"{external_factors_dict['economic_uncertainty']} economic uncertainty increases forecast risk")
+
+    # Generate AI insight
+    report(0.7, "Generating AI insight")
+    ai_insight = generate_ai_insight(
+        category=category,
+        forecasted_units=forecast_result["forecasted_units"],
+        mom_change=forecast_result["mom_change_percent"],
+        trend=forecast_result["trend"],
+        month=month_name,
+        lower_bound=forecast_result.get("lower_bound"),
+        upper_bound=forecast_result.get("upper_bound"),
+        historical_avg=forecast_result.get("historical_avg"),
+        yoy_change=forecast_result.get("yoy_change_percent"),
+        data_months=forecast_result.get("data_months"),
+        confidence=forecast_result.get("confidence"),
+        region=region,
+        festivals=festivals_in_window,
+        seasonality=forecast_result.get("seasonality"),
+        warnings=enhanced_warnings,
+        coefficient_of_variation=forecast_result.get("coefficient_of_variation"),
+        external_factors=external_factors_dict,
+        country=country
+    )
+
+    # Return response
+    return {
+        **forecast_result,
+        "ai_insight": ai_insight,
+        "data_summary": data_summary,
+        "forecast_month": month_name,
+        "festivals": festivals_in_window,
+        "external_factors": external_factors_summary,
+        "region": region,
+        "country": country,
+        "data_quality_message": forecast_result.get("data_quality_message"),
+        "warnings": enhanced_warnings,
+        "recommendations": forecast_result.get("recommendations", [])
+    }
+
+
 @app.post("/forecast/upload")
-async def upload_and_forecast(
-    file: UploadFile,
+@compute_executor.offload
+def upload_and_forecast(
+    file: Optional[UploadFile] = None,
+    dataset_id: str = Form(None),
     category: str = Form(...),
-    date_col: str = Form(...),
-    category_col: str = Form(...),
-    units_col: str = Form(...),
+    date_col: str = Form(None),
+    category_col: str = Form(None),
+    units_col: str = Form(None),
     horizon: int = Form(1),
     # External factors
     upcoming_promotion: str = Form("false"),
@@ -1205,10 +1779,16 @@ async def upload_and_forecast(
     logistics_constraints: str = Form("false"),
     economic_uncertainty: str = Form("None"),
     region: str = Form("India"),
-    country: str = Form("IN")
+    country: str = Form("IN"),
+    precision: str = Form(None),
+    model_type: str = Form(None),
+    background: str = Form("false")
 ):
     """
     Upload sales data and generate adaptive AI-powered demand forecast.
+    
+    With background=true the forecast is queued as a job and a job id is
+    returned immediately; poll /jobs/{job_id} for progress and the result.
     """
     
     try:
@@ -1219,219 +1799,272 @@ async def upload_and_forecast(
                 detail=f"Forecast horizon must be between 1 and {settings.max_forecast_horizon} months"
             )
         
-        # Read uploaded file
-        contents = await file.read()
+        validate_precision(precision)
+        validate_model_type(model_type)
         
-        # Parse CSV
-        try:
-            df = pd.read_csv(io.BytesIO(contents))
-        except Exception as csv_error:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Failed to read CSV file: {str(csv_error)}"
+        factors = {
+            "upcoming_promotion": upcoming_promotion,
+            "marketing_campaign": marketing_campaign,
+            "new_product_launch": new_product_launch,
+            "availability_issues": availability_issues,
+            "price_change": price_change,
+            "supply_chain_disruption": supply_chain_disruption,
+            "regulatory_changes": regulatory_changes,
+            "logistics_constraints": logistics_constraints,
+            "economic_uncertainty": economic_uncertainty
+        }
+        
+        def forecast(upload, job=None):
+            # Stream and aggregate the uploaded data
+            monthly_df = load_category_data(upload, dataset_id, category, date_col, category_col, units_col)
+            return build_forecast_response(
+                monthly_df, category, horizon, precision, model_type, factors, region, country, job=job
             )
+        
+        if str_to_bool(background):
+            return submit_job("forecast", f"Forecast {category}", file, forecast)
+        
+        return forecast(file)
 
-        # Check if empty
-        if df.empty:
-            raise HTTPException(
-                status_code=400,
-                detail="The uploaded CSV file is empty"
-            )
+    except HTTPException:
+        raise
+    except Exception as e:
+        # Log full error
+        print(f"Forecast Error: {str(e)}")
+        print(traceback.format_exc())
+        raise HTTPException(
+            status_code=500,
+            detail=f"Server error during forecast: {str(e)}"
+        )
 
-        # Prepare and aggregate data
-        try:
-            monthly_df = prepare_category_data(
-                df=df,
-                category=category,
-                date_col=date_col,
-                category_col=category_col,
-                units_col=units_col
-            )
-        except ValueError as ve:
+
+@app.post("/forecast/batch")
+@compute_executor.offload
+def batch_forecast(
+    file: Optional[UploadFile] = None,
+    dataset_id: str = Form(None),
+    date_col: str = Form(None),
+    category_col: str = Form(None),
+    units_col: str = Form(None),
+    horizon: int = Form(1),
+    categories: str = Form(""),
+    max_workers: Optional[int] = Form(None),
+    precision: str = Form(None),
+    model_type: str = Form(None)
+):
+    """
+    Forecast every category in the uploaded data in a single request.
+    
+    Results are streamed back as newline-delimited JSON, one line per
+    category, as soon as each category's forecast finishes.
+    """
+    
+    try:
+        if horizon < 1 or horizon > settings.max_forecast_horizon:
             raise HTTPException(
                 status_code=400,
-                detail=str(ve)
+                detail=f"Forecast horizon must be between 1 and {settings.max_forecast_horizon} months"
             )
         
-        data_months = len(monthly_df)
+        if max_workers is not None:
+            if max_workers < 1:
+                raise HTTPException(status_code=400, detail="max_workers must be at least 1")
+            # A batch can use at most every worker of the shared pool
+            max_workers = min(max_workers, batch_pool_size())
         
-        # Validate horizon
-        validation = validate_forecast_horizon(data_months, horizon)
-        if not validation["valid"]:
-            raise HTTPException(
-                status_code=400,
-                detail=validation["message"]
-            )
+        validate_precision(precision)
+        validate_model_type(model_type)
         
-        data_summary = get_data_summary(monthly_df)
+        selected = [c.strip() for c in categories.split(",") if c.strip()] or None
+        
+        # Stored dataset, or stream and aggregate every category in one pass
+        prepared, errors = resolve_categories(
+            file, dataset_id, date_col, category_col, units_col, categories=selected
+        )
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        print(f"Batch Forecast Error: {str(e)}")
+        print(traceback.format_exc())
+        raise HTTPException(
+            status_code=500,
+            detail=f"Server error during batch forecast: {str(e)}"
+        )
+    
+    async def stream_results():
+        results = forecast_prepared_categories(
+            prepared=prepared,
+            errors=errors,
+            periods=horizon,
+            max_workers=max_workers,
+            precision=precision,
+            model_type=model_type
+        )
+        # Wait for each category on the compute executor, not the event loop
+        async for result in compute_executor.iterate(results):
+            yield json.dumps(result, default=_json_default) + "\n"
+    
+    return StreamingResponse(stream_results(), media_type="application/x-ndjson")
+
+
+def build_evaluation_response(
+    monthly_df: pd.DataFrame,
+    category: str,
+    holdout_months: int,
+    cross_validate: bool,
+    cv_horizon: int,
+    cv_parallel: Optional[str],
+    cv_max_cutoffs: Optional[int],
+    job: Optional[Job] = None
+) -> dict:
+    """
+    Holdout evaluation, diagnostics and optional cross-validation for one category.
+    Shared by /forecast/evaluate and background evaluation jobs.
+    """
+    report = job.report if job else (lambda progress, message=None: None)
+    
+    if len(monthly_df) < holdout_months + settings.min_months_for_analysis:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Insufficient data for evaluation. Need at least {holdout_months + settings.min_months_for_analysis} months"
+        )
+    
+    report(0.1, "Evaluating on holdout months")
+    evaluation_result = evaluate_forecast_accuracy(
+        monthly_df=monthly_df,
+        holdout_months=holdout_months
+    )
+    
+    report(0.4, "Computing diagnostics")
+    diagnostics = get_model_diagnostics(monthly_df)
+    
+    cv_result = None
+    if cross_validate:
+        report(0.5, "Running cross-validation")
+        cv_result = run_cross_validation(
+            monthly_df=monthly_df,
+            horizon_months=cv_horizon,
+            parallel=cv_parallel,
+            max_cutoffs=min(cv_max_cutoffs or settings.cv_max_cutoffs, settings.cv_max_cutoffs)
+        )
+    
+    return {
+        "category": category,
+        "evaluation": evaluation_result,
+        "cross_validation": cv_result,
+        "diagnostics": diagnostics
+    }
 
-        # Run forecast
-        try:
-            forecast_result = run_demand_forecast(
-                monthly_df=monthly_df,
-                periods=horizon
-            )
-        except ValueError as ve:
+
+@app.post("/forecast/evaluate")
+@compute_executor.offload
+def evaluate_model(
+    file: Optional[UploadFile] = None,
+    dataset_id: str = Form(None),
+    category: str = Form(...),
+    date_col: str = Form(None),
+    category_col: str = Form(None),
+    units_col: str = Form(None),
+    holdout_months: int = Form(3),
+    cross_validate: str = Form("false"),
+    cv_horizon: int = Form(1),
+    cv_parallel: str = Form(None),
+    cv_max_cutoffs: int = Form(None),
+    background: str = Form("false")
+):
+    """
+    Evaluate forecast model accuracy, optionally with rolling cross-validation.
+    
+    With background=true the evaluation is queued as a job; poll /jobs/{job_id}.
+    """
+    
+    try:
+        parallel = cv_parallel if cv_parallel is not None else settings.cv_parallel
+        if parallel in ("", "none", "None"):
+            parallel = None
+        if parallel not in (None, "processes", "threads"):
             raise HTTPException(
                 status_code=400,
-                detail=str(ve)
+                detail=f"Invalid cv_parallel '{cv_parallel}'. Use 'processes', 'threads' or 'none'."
             )
-
-        # Prepare context
-        next_month = monthly_df["ds"].max() + pd.DateOffset(months=1)
-        month_name = next_month.strftime("%B %Y")
-        
-        # Get festivals
-        festivals_in_window = get_festivals_for_month(
-            next_month.strftime("%B"),
-            country
-        )
-
         
-        # Parse external factors
-        external_factors_dict = {
-            "upcoming_promotion": str_to_bool(upcoming_promotion),
-            "marketing_campaign": str_to_bool(marketing_campaign),
-            "new_product_launch": str_to_bool(new_product_launch),
-            "availability_issues": str_to_bool(availability_issues),
-            "price_change": price_change,
-            "supply_chain_disruption": str_to_bool(supply_chain_disruption),
-            "regulatory_changes": str_to_bool(regulatory_changes),
-            "logistics_constraints": str_to_bool(logistics_constraints),
-            "economic_uncertainty": economic_uncertainty,
-            "region": region
-        }
-                
-        # Build external factors summary
-        external_factors_summary = []
-        if external_factors_dict["upcoming_promotion"]:
-            external_factors_summary.append("Upcoming promotion planned")
-        if external_factors_dict["marketing_campaign"]:
-            external_factors_summary.append("Active marketing campaign")
-        if external_factors_dict["new_product_launch"]:
-            external_factors_summary.append("New product launch expected")
-        if external_factors_dict["availability_issues"]:
-            external_factors_summary.append("Availability constraints present")
-        if external_factors_dict["price_change"] != "Same":
-            external_factors_summary.append(f"Price change: {external_factors_dict['price_change']}")
-        if external_factors_dict["supply_chain_disruption"]:
-            external_factors_summary.append("Supply chain risk identified")
-        if external_factors_dict["regulatory_changes"]:
-            external_factors_summary.append("Regulatory changes expected")
-        if external_factors_dict["logistics_constraints"]:
-            external_factors_summary.append("Logistics constraints present")
-        if external_factors_dict["economic_uncertainty"] != "None":
-            external_factors_summary.append(f"Economic uncertainty: {external_factors_dict['economic_uncertainty']}")
-
-        # Enhance warnings
-        enhanced_warnings = forecast_result.get("warnings", []).copy()
+        def evaluate(upload, job=None):
+            monthly_df = load_category_data(upload, dataset_id, category, date_col, category_col, units_col)
+            return build_evaluation_response(
+                monthly_df, category, holdout_months, str_to_bool(cross_validate),
+                cv_horizon, parallel, cv_max_cutoffs, job=job
+            )
         
-        if external_factors_dict["availability_issues"]:
-            enhanced_warnings.append("Availability constraints may limit ability to meet forecasted demand")
-        if external_factors_dict["supply_chain_disruption"]:
-            enhanced_warnings.append("Supply chain disruptions may impact fulfillment capacity")
-        if external_factors_dict["price_change"] == "Increase":
-            enhanced_warnings.append("Price increase may reduce actual demand below forecast")
-        elif external_factors_dict["price_change"] == "Decrease":
-            enhanced_warnings.append("Price decrease may drive demand above forecast")
-        if external_factors_dict["economic_uncertainty"] in ["Medium", "High"]:
-            enhanced_warnings.append(f"{external_factors_dict['economic_uncertainty']} economic uncertainty increases forecast risk")
+        if str_to_bool(background):
+            return submit_job("evaluate", f"Evaluate {category}", file, evaluate)
         
-        # Generate AI insight
-        ai_insight = generate_ai_insight(
-            category=category,
-            forecasted_units=forecast_result["forecasted_units"],
-            mom_change=forecast_result["mom_change_percent"],
-            trend=forecast_result["trend"],
-            month=month_name,
-            lower_bound=forecast_result.get("lower_bound"),
-            upper_bound=forecast_result.get("upper_bound"),
-            historical_avg=forecast_result.get("historical_avg"),
-            yoy_change=forecast_result.get("yoy_change_percent"),
-            data_months=forecast_result.get("data_months"),
-            confidence=forecast_result.get("confidence"),
-            region=region,
-            festivals=festivals_in_window,
-            seasonality=forecast_result.get("seasonality"),
-            warnings=enhanced_warnings,
-            coefficient_of_variation=forecast_result.get("coefficient_of_variation"),
-            external_factors=external_factors_dict,
-            country=country
-        )
-
-        # Return response
-        return {
-            **forecast_result,
-            "ai_insight": ai_insight,
-            "data_summary": data_summary,
-            "forecast_month": month_name,
-            "festivals": festivals_in_window,
-            "external_factors": external_factors_summary,
-            "region": region,
-            "country": country,
-            "data_quality_message": forecast_result.get("data_quality_message"),
-            "warnings": enhanced_warnings,
-            "recommendations": forecast_result.get("recommendations", [])
-        }
+        return evaluate(file)
 
     except HTTPException:
         raise
     except Exception as e:
-        # Log full error
-        print(f"Forecast Error: {str(e)}")
+        print(f"Evaluation Error: {str(e)}")
         print(traceback.format_exc())
         raise HTTPException(
-            status_code=500,
-            detail=f"Server error during forecast: {str(e)}"
+            status_code=500, 
+            detail=f"Server error: {str(e)}"
         )
 
 
-@app.post("/forecast/evaluate")
-async def evaluate_model(
-    file: UploadFile,
+@app.post("/forecast/backtest")
+@compute_executor.offload
+def backtest_model(
+    file: Optional[UploadFile] = None,
+    dataset_id: str = Form(None),
     category: str = Form(...),
-    date_col: str = Form(...),
-    category_col: str = Form(...),
-    units_col: str = Form(...),
-    holdout_months: int = Form(3)
+    date_col: str = Form(None),
+    category_col: str = Form(None),
+    units_col: str = Form(None),
+    horizons: str = Form(""),
+    min_train_months: int = Form(None),
+    max_origins: int = Form(None),
+    warm_start: str = Form("true"),
+    precision: str = Form("fast")
 ):
-    """Evaluate forecast model accuracy."""
+    """Rolling-origin backtest over many origins and 1/3/6-month horizons."""
     
     try:
-        contents = await file.read()
-        df = pd.read_csv(io.BytesIO(contents))
-
-        monthly_df = prepare_category_data(
-            df=df,
-            category=category,
-            date_col=date_col,
-            category_col=category_col,
-            units_col=units_col
-        )
+        validate_precision(precision)
         
-        if len(monthly_df) < holdout_months + settings.min_months_for_analysis:
+        try:
+            requested_horizons = [int(h) for h in horizons.split(",") if h.strip()] or None
+        except ValueError:
             raise HTTPException(
                 status_code=400,
-                detail=f"Insufficient data for evaluation. Need at least {holdout_months + settings.min_months_for_analysis} months"
+                detail="horizons must be a comma-separated list of integers, e.g. '1,3,6'"
             )
         
-        evaluation_result = evaluate_forecast_accuracy(
+        monthly_df = load_category_data(file, dataset_id, category, date_col, category_col, units_col)
+        
+        backtest_result = run_backtest(
             monthly_df=monthly_df,
-            holdout_months=holdout_months
+            horizons=requested_horizons,
+            min_train_months=min_train_months,
+            max_origins=max_origins,
+            warm_start=str_to_bool(warm_start),
+            precision=precision
         )
         
-        diagnostics = get_model_diagnostics(monthly_df)
+        if backtest_result["status"] == "insufficient_data":
+            raise HTTPException(status_code=400, detail=backtest_result["message"])
         
         return {
             "category": category,
-            "evaluation": evaluation_result,
-            "diagnostics": diagnostics
+            "backtest": backtest_result
         }
 
     except HTTPException:
         raise
+    except ValueError as ve:
+        raise HTTPException(status_code=400, detail=str(ve))
     except Exception as e:
-        print(f"Evaluation Error: {str(e)}")
+        print(f"Backtest Error: {str(e)}")
         print(traceback.format_exc())
         raise HTTPException(
             status_code=500, 
@@ -1440,26 +2073,19 @@ async def evaluate_model(
 
 
 @app.post("/data/summary")
-async def get_data_info(
-    file: UploadFile,
+@compute_executor.offload
+def get_data_info(
+    file: Optional[UploadFile] = None,
+    dataset_id: str = Form(None),
     category: str = Form(...),
-    date_col: str = Form(...),
-    category_col: str = Form(...),
-    units_col: str = Form(...)
+    date_col: str = Form(None),
+    category_col: str = Form(None),
+    units_col: str = Form(None)
 ):
     """Get data summary."""
     
     try:
-        contents = await file.read()
-        df = pd.read_csv(io.BytesIO(contents))
-
-        monthly_df = prepare_category_data(
-            df=df,
-            category=category,
-            date_col=date_col,
-            category_col=category_col,
-            units_col=units_col
-        )
+        monthly_df = load_category_data(file, dataset_id, category, date_col, category_col, units_col)
         
         summary = get_data_summary(monthly_df)
         diagnostics = get_model_diagnostics(monthly_df)
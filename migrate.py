@@ -0,0 +1,55 @@
+# migrate.py
+# Bring the database schema up to date with the Alembic migrations in migrations/.
+#
+# Usage:
+#   python migrate.py              # upgrade to the latest revision
+#   python migrate.py <revision>   # upgrade to a specific revision
+#   alembic downgrade <revision>   # roll back
+#
+# New schema changes: `alembic revision --autogenerate -m "..."`, then review
+# the script - index builds on large tables should use migrations/online.py.
+
+import os
+import sys
+
+from alembic import command
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+
+import database
+
+ALEMBIC_INI = os.path.join(os.path.dirname(os.path.abspath(__file__)), "alembic.ini")
+
+
+def get_config() -> Config:
+    config = Config(ALEMBIC_INI)
+    config.set_main_option("script_location", os.path.join(os.path.dirname(ALEMBIC_INI), "migrations"))
+    # Leave the caller's logging setup alone
+    config.attributes["configure_logger"] = False
+    return config
+
+
+def current_revision(engine=database.engine):
+    """Revision the database is at, or None if it was never migrated."""
+    with engine.connect() as conn:
+        return MigrationContext.configure(conn).get_current_revision()
+
+
+def upgrade_database(revision: str = "head"):
+    """
+    Upgrade the schema to the given revision. A no-op when already current.
+    """
+    config = get_config()
+    head = ScriptDirectory.from_config(config).get_current_head()
+    if revision == "head" and current_revision() == head:
+        return
+    command.upgrade(config, revision)
+
+
+if __name__ == "__main__":
+    target = sys.argv[1] if len(sys.argv) > 1 else "head"
+    before = current_revision()
+    print(f"🛠️  Migrating database from {before or 'empty'} to {target}...")
+    command.upgrade(get_config(), target)
+    print(f"✅ Database is at revision {current_revision()}.")
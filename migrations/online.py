@@ -0,0 +1,39 @@
+# migrations/online.py
+# Helpers for schema changes that must not block a live database
+
+from alembic import op
+
+
+def create_index_online(name: str, table: str, columns: list, unique: bool = False):
+    """
+    Build an index without locking the table against writes.
+
+    PostgreSQL uses CREATE INDEX CONCURRENTLY, which cannot run inside a
+    transaction, so the statement runs in an autocommit block. Other
+    dialects (SQLite in tests) fall back to a plain CREATE INDEX.
+    IF NOT EXISTS makes the migration safe on databases that already have
+    the index, e.g. ones created by create_all().
+
+    A failed concurrent build leaves an INVALID index behind, which IF NOT
+    EXISTS would then skip - drop it (drop_index_online) before retrying.
+    """
+    with op.get_context().autocommit_block():
+        op.create_index(
+            name,
+            table,
+            columns,
+            unique=unique,
+            if_not_exists=True,
+            postgresql_concurrently=True
+        )
+
+
+def drop_index_online(name: str, table: str):
+    """Drop an index without locking the table (DROP INDEX CONCURRENTLY on PostgreSQL)."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            name,
+            table_name=table,
+            if_exists=True,
+            postgresql_concurrently=True
+        )
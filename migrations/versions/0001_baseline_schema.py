@@ -0,0 +1,138 @@
+"""Baseline schema
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-17
+
+Tables as they existed before migrations were introduced. Databases that
+were created with create_all() already have them; only missing tables are
+created, so those databases are adopted as-is by `alembic upgrade head`.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def _missing(table: str) -> bool:
+    return not sa.inspect(op.get_bind()).has_table(table)
+
+
+def upgrade():
+    if _missing("users"):
+        op.create_table(
+            "users",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("name", sa.String(), nullable=False),
+            sa.Column("email", sa.String(), nullable=False),
+            sa.Column("role", sa.String(), nullable=False),
+        )
+        op.create_index("ix_users_id", "users", ["id"])
+        op.create_index("ix_users_email", "users", ["email"], unique=True)
+
+    if _missing("products"):
+        op.create_table(
+            "products",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("sku", sa.String(), nullable=False),
+            sa.Column("name", sa.String(), nullable=False),
+            sa.Column("category", sa.String(), nullable=False),
+            sa.Column("stage", sa.String()),
+            sa.Column("current_stock", sa.Integer()),
+            sa.Column("safety_stock_level", sa.Integer()),
+            sa.Column("optimal_stock_level", sa.Integer()),
+            sa.Column("unit_price", sa.Float(), nullable=False),
+        )
+        op.create_index("ix_products_id", "products", ["id"])
+        op.create_index("ix_products_sku", "products", ["sku"], unique=True)
+
+    if _missing("inventory_logs"):
+        op.create_table(
+            "inventory_logs",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("product_id", sa.Integer(), sa.ForeignKey("products.id"), nullable=False),
+            sa.Column("change_date", sa.DateTime()),
+            sa.Column("quantity_change", sa.Integer(), nullable=False),
+            sa.Column("reason", sa.String(), nullable=False),
+            sa.Column("stockout_flag", sa.Boolean()),
+        )
+        op.create_index("ix_inventory_logs_id", "inventory_logs", ["id"])
+
+    if _missing("forecasts"):
+        op.create_table(
+            "forecasts",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("product_id", sa.Integer(), sa.ForeignKey("products.id"), nullable=False),
+            sa.Column("forecast_date", sa.Date(), nullable=False),
+            sa.Column("predicted_quantity", sa.Float(), nullable=False),
+            sa.Column("confidence_score", sa.Float()),
+        )
+        op.create_index("ix_forecasts_id", "forecasts", ["id"])
+
+    if _missing("orders"):
+        op.create_table(
+            "orders",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("customer_name", sa.String(), nullable=False),
+            sa.Column("delivery_address", sa.String(), nullable=True),
+            sa.Column("status", sa.String()),
+            sa.Column("ai_risk_assessment", sa.Text(), nullable=True),
+            sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        )
+        op.create_index("ix_orders_id", "orders", ["id"])
+
+    if _missing("suppliers"):
+        op.create_table(
+            "suppliers",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("name", sa.String(), nullable=False, unique=True),
+            sa.Column("contact_email", sa.String(), nullable=False),
+            sa.Column("category", sa.String()),
+            sa.Column("reliability_score", sa.Float()),
+            sa.Column("delivery_speed_days", sa.Integer()),
+            sa.Column("lead_time_days", sa.Integer()),
+            sa.Column("price_per_unit", sa.Float()),
+            sa.Column("delivery_cost", sa.Float()),
+        )
+        op.create_index("ix_suppliers_id", "suppliers", ["id"])
+
+    if _missing("purchase_orders"):
+        op.create_table(
+            "purchase_orders",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("po_number", sa.String(), nullable=False, unique=True),
+            sa.Column("supplier_id", sa.Integer(), sa.ForeignKey("suppliers.id"), nullable=False),
+            sa.Column("product_name", sa.String(), nullable=True),
+            sa.Column("quantity", sa.Integer(), nullable=True),
+            sa.Column("total_value", sa.Float()),
+            sa.Column("priority", sa.String()),
+            sa.Column("total_amount", sa.DECIMAL(10, 2), nullable=True),
+            sa.Column("status", sa.String()),
+            sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+            sa.Column("expected_delivery", sa.DateTime(), nullable=True),
+            sa.Column("expected_delivery_date", sa.Date(), nullable=True),
+        )
+        op.create_index("ix_purchase_orders_id", "purchase_orders", ["id"])
+
+    if _missing("po_items"):
+        op.create_table(
+            "po_items",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("po_id", sa.Integer(), sa.ForeignKey("purchase_orders.id"), nullable=False),
+            sa.Column("product_id", sa.Integer(), sa.ForeignKey("products.id"), nullable=False),
+            sa.Column("quantity_ordered", sa.Integer(), nullable=False),
+            sa.Column("unit_price", sa.DECIMAL(10, 2), nullable=False),
+        )
+        op.create_index("ix_po_items_id", "po_items", ["id"])
+
+
+def downgrade():
+    for table in [
+        "po_items", "purchase_orders", "suppliers", "orders",
+        "forecasts", "inventory_logs", "products", "users"
+    ]:
+        op.drop_table(table)
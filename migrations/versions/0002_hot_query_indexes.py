@@ -0,0 +1,39 @@
+"""Indexes for hot query patterns
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17
+
+Built online (CREATE INDEX CONCURRENTLY on PostgreSQL), so applying this
+to a live database does not block writes to the indexed tables.
+"""
+from migrations.online import create_index_online, drop_index_online
+
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+INDEXES = [
+    ("ix_purchase_orders_status", "purchase_orders", ["status"]),
+    ("ix_purchase_orders_created_at", "purchase_orders", ["created_at"]),
+    ("ix_purchase_orders_supplier_id_created_at", "purchase_orders", ["supplier_id", "created_at"]),
+    ("ix_suppliers_category", "suppliers", ["category"]),
+    ("ix_inventory_logs_product_id_change_date", "inventory_logs", ["product_id", "change_date"]),
+    ("ix_po_items_po_id", "po_items", ["po_id"]),
+    ("ix_forecasts_product_id_forecast_date", "forecasts", ["product_id", "forecast_date"]),
+    ("ix_orders_status", "orders", ["status"]),
+    ("ix_orders_created_at", "orders", ["created_at"]),
+]
+
+
+def upgrade():
+    for name, table, columns in INDEXES:
+        create_index_online(name, table, columns)
+
+
+def downgrade():
+    for name, table, _ in reversed(INDEXES):
+        drop_index_online(name, table)
@@ -0,0 +1,30 @@
+"""Expression index on the product stock ratio
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17
+
+Backs the critical / low stock filters and "most depleted first" ordering
+of the procurement endpoints (models.product_stock_ratio).
+"""
+import sqlalchemy as sa
+
+from migrations.online import create_index_online, drop_index_online
+
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    create_index_online(
+        "ix_products_stock_ratio",
+        "products",
+        [sa.text("(CAST(current_stock AS FLOAT) / nullif(optimal_stock_level, 0))")]
+    )
+
+
+def downgrade():
+    drop_index_online("ix_products_stock_ratio", "products")
@@ -0,0 +1,40 @@
+"""Health snapshot table
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17
+
+The row itself is built on first read (or `python health_snapshot.py`).
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+
+def _missing(table: str) -> bool:
+    return not sa.inspect(op.get_bind()).has_table(table)
+
+
+def upgrade():
+    if not _missing("health_snapshots"):
+        return
+
+    op.create_table(
+        "health_snapshots",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("critical_items", sa.Integer(), nullable=False),
+        sa.Column("pending_pos", sa.Integer(), nullable=False),
+        sa.Column("rated_suppliers", sa.Integer(), nullable=False),
+        sa.Column("reliability_sum", sa.Float(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("rebuilt_at", sa.DateTime(timezone=True), nullable=True),
+    )
+
+
+def downgrade():
+    op.drop_table("health_snapshots")
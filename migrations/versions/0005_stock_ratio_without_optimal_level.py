@@ -0,0 +1,36 @@
+"""Stock ratio index for products without an optimal stock level
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-17
+
+models.product_stock_ratio no longer is NULL for products with
+optimal_stock_level = 0: negative stock counts as low, like the original
+"current_stock < optimal_stock_level * ratio" check. The index is rebuilt
+on the new expression.
+"""
+import sqlalchemy as sa
+
+from migrations.online import create_index_online, drop_index_online
+
+
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+STOCK_RATIO = (
+    "(CASE WHEN (optimal_stock_level != 0) THEN CAST(current_stock AS FLOAT) / optimal_stock_level "
+    "WHEN (current_stock < 0) THEN CAST(current_stock AS FLOAT) END)"
+)
+PREVIOUS_STOCK_RATIO = "(CAST(current_stock AS FLOAT) / nullif(optimal_stock_level, 0))"
+
+
+def upgrade():
+    drop_index_online("ix_products_stock_ratio", "products")
+    create_index_online("ix_products_stock_ratio", "products", [sa.text(STOCK_RATIO)])
+
+
+def downgrade():
+    drop_index_online("ix_products_stock_ratio", "products")
+    create_index_online("ix_products_stock_ratio", "products", [sa.text(PREVIOUS_STOCK_RATIO)])
@@ -0,0 +1,211 @@
+# backend/model_cache.py
+# ----------------------
+# Responsibility:
+# - Content-addressed disk cache for fitted Prophet models
+# - Key = hash of the training series + fit-relevant model configuration
+# - LRU eviction bounded by entry count and total size on disk
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from typing import Optional
+
+import pandas as pd
+from prophet import Prophet
+from prophet.serialize import model_to_json, model_from_json
+
+from config import settings
+
+
+def make_cache_key(monthly_df: pd.DataFrame, model_config: dict) -> str:
+    """
+    Build a content hash for a training series and its model configuration.
+
+    Every column is hashed, not just 'ds' and 'y', so regressor, cap and
+    floor values are part of the key.
+
+    Args:
+        monthly_df: Training data with 'ds', 'y' and any extra input columns
+        model_config: Fit-relevant Prophet settings (must be JSON serializable)
+
+    Returns:
+        str: Hex digest identifying this exact fit
+    """
+    hasher = hashlib.sha256()
+    columns = sorted(monthly_df.columns, key=str)
+    hasher.update(json.dumps(columns, default=str).encode("utf-8"))
+    row_hashes = pd.util.hash_pandas_object(monthly_df[columns], index=False)
+    hasher.update(row_hashes.values.tobytes())
+    hasher.update(json.dumps(model_config, sort_keys=True, default=str).encode("utf-8"))
+    return hasher.hexdigest()
+
+
+class JsonFileCache:
+    """
+    Disk-backed LRU cache of JSON documents, one file per key.
+
+    File modification times track recency, so the LRU order survives
+    restarts and is shared between worker processes using the same directory.
+    """
+
+    def __init__(self, cache_dir: str, max_entries: int = 256, max_size_mb: float = 512.0):
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self.max_bytes = int(max_size_mb * 1024 * 1024)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def _decode(self, text: str):
+        return json.loads(text)
+
+    def _encode(self, value) -> str:
+        return json.dumps(value, default=str)
+
+    def get(self, key: str):
+        """
+        Load an entry from the cache.
+
+        Returns:
+            The decoded entry, or None on a miss or unreadable entry
+        """
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                value = self._decode(f.read())
+        except FileNotFoundError:
+            self._count(hit=False)
+            return None
+        except Exception:
+            # Corrupt or incompatible entry - drop it and recompute
+            self._remove(path)
+            self._count(hit=False)
+            return None
+
+        # Mark as most recently used
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+
+        self._count(hit=True)
+        return value
+
+    def put(self, key: str, value):
+        """
+        Store an entry and evict least recently used entries if needed.
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+        # Write atomically so concurrent readers never see a partial file
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(self._encode(value))
+            os.replace(tmp_path, self._path(key))
+        except Exception:
+            self._remove(tmp_path)
+            raise
+
+        self._evict()
+
+    def clear(self):
+        """Remove every cached entry."""
+        for path, _, _ in self._entries():
+            self._remove(path)
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        """Get cache usage statistics."""
+        entries = self._entries()
+        with self._lock:
+            hits, misses = self.hits, self.misses
+        return {
+            "entries": len(entries),
+            "size_mb": round(sum(size for _, size, _ in entries) / (1024 * 1024), 2),
+            "max_entries": self.max_entries,
+            "max_size_mb": round(self.max_bytes / (1024 * 1024), 2),
+            "hits": hits,
+            "misses": misses
+        }
+
+    def _entries(self) -> list:
+        """List cache files as (path, size, mtime), oldest first."""
+        if not os.path.isdir(self.cache_dir):
+            return []
+
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith(".json"):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            entries.append((path, st.st_size, st.st_mtime))
+
+        entries.sort(key=lambda e: e[2])
+        return entries
+
+    def _count(self, hit: bool):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def _evict(self):
+        """Drop least recently used entries until within both caps."""
+        with self._lock:
+            entries = self._entries()
+            total_bytes = sum(size for _, size, _ in entries)
+
+            while entries and (len(entries) > self.max_entries or total_bytes > self.max_bytes):
+                path, size, _ = entries.pop(0)
+                self._remove(path)
+                total_bytes -= size
+
+    @staticmethod
+    def _remove(path: str):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+class ProphetModelCache(JsonFileCache):
+    """
+    Disk-backed LRU cache of fitted Prophet models,
+    stored with Prophet's JSON serialization.
+    """
+
+    def _decode(self, text: str) -> Prophet:
+        return model_from_json(text)
+
+    def _encode(self, model: Prophet) -> str:
+        return model_to_json(model)
+
+    def get(self, key: str) -> Optional[Prophet]:
+        """
+        Load a fitted model from the cache.
+
+        Returns:
+            Prophet: The fitted model, or None on a miss or unreadable entry
+        """
+        return super().get(key)
+
+
+# Global cache instance
+model_cache = ProphetModelCache(
+    cache_dir=settings.model_cache_dir,
+    max_entries=settings.model_cache_max_entries,
+    max_size_mb=settings.model_cache_max_size_mb
+)
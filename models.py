@@ -9,10 +9,15 @@ from sqlalchemy import (
     Text,
     Date,
     Boolean,
-    DECIMAL
+    DECIMAL,
+    Index,
+    case,
+    cast,
+    literal_column
 )
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, column_property
 from sqlalchemy.sql import func
+from sqlalchemy.sql.expression import Grouping
 from database import Base
 import datetime
 
@@ -45,9 +50,11 @@ class Product(Base):
     )  # Raw Material → Work in Progress → Finished
 
     # Stock & Costing
-    current_stock = Column(Integer, default=0)
+    # active_history: keep the old value on assignment, even when expired,
+    # so health_snapshot.py can compute the critical-item delta
+    current_stock = column_property(Column(Integer, default=0), active_history=True)
     safety_stock_level = Column(Integer, default=10)
-    optimal_stock_level = Column(Integer, default=50)
+    optimal_stock_level = column_property(Column(Integer, default=50), active_history=True)
     unit_price = Column(Float, nullable=False)
 
     # Relationships
@@ -67,11 +74,37 @@ class Product(Base):
     )
 
 
+# Stock ratio thresholds (share of optimal stock level)
+CRITICAL_STOCK_RATIO = 0.2
+REORDER_STOCK_RATIO = 0.5
+
+# Share of the optimal stock level on hand (0.2 = 20%).
+# Without an optimal level (0 or NULL) the ratio is the stock itself when it is
+# negative - below every threshold, as in "current_stock < optimal * ratio" -
+# and NULL (never low) otherwise.
+# Filter and sort on this exact expression so the database can use ix_products_stock_ratio.
+# The plain "/" operator and literal 0 keep the rendered SQL identical to the index expression.
+product_stock_ratio = case(
+    (
+        Product.optimal_stock_level != literal_column("0"),
+        cast(Product.current_stock, Float).op("/", return_type=Float)(Product.optimal_stock_level)
+    ),
+    (Product.current_stock < literal_column("0"), cast(Product.current_stock, Float))
+)
+
+# Parenthesized: PostgreSQL only accepts a bare column or function call as an index expression
+Index("ix_products_stock_ratio", Grouping(product_stock_ratio))
+
+
 # =====================================================
 # 3. INVENTORY LOGS (Stock Movement History)
 # =====================================================
 class InventoryLog(Base):
     __tablename__ = "inventory_logs"
+    __table_args__ = (
+        # Stock history of a product, newest first
+        Index("ix_inventory_logs_product_id_change_date", "product_id", "change_date"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     product_id = Column(Integer, ForeignKey("products.id"), nullable=False)
@@ -96,6 +129,9 @@ class InventoryLog(Base):
 # =====================================================
 class Forecast(Base):
     __tablename__ = "forecasts"
+    __table_args__ = (
+        Index("ix_forecasts_product_id_forecast_date", "product_id", "forecast_date"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     product_id = Column(Integer, ForeignKey("products.id"), nullable=False)
@@ -119,13 +155,15 @@ class Order(Base):
 
     status = Column(
         String,
-        default="PENDING"
+        default="PENDING",
+        index=True
     )  # PENDING → CONFIRMED → SHIPPED → DELIVERED
 
     ai_risk_assessment = Column(Text, nullable=True)
     created_at = Column(
         DateTime(timezone=True),
-        server_default=func.now()
+        server_default=func.now(),
+        index=True
     )
 
 
@@ -140,8 +178,11 @@ class Supplier(Base):
     contact_email = Column(String, nullable=False)
 
     # --- Updated Fields for Dashboard Compatibility ---
-    category = Column(String, default="General")
-    reliability_score = Column(Float, default=95.0)  # 1–10 scale
+    category = Column(String, default="General", index=True)
+    reliability_score = column_property(
+        Column(Float, default=95.0),  # 1–10 scale
+        active_history=True  # old value needed by health_snapshot.py
+    )
     delivery_speed_days = Column(Integer, default=5)
     lead_time_days = Column(Integer, default=5) # Alias for compatibility
     price_per_unit = Column(Float, default=0.0) # Added for quick cost calc
@@ -158,6 +199,10 @@ class Supplier(Base):
 # =====================================================
 class PurchaseOrder(Base):
     __tablename__ = "purchase_orders"
+    __table_args__ = (
+        # Supplier analysis and a supplier's most recent POs
+        Index("ix_purchase_orders_supplier_id_created_at", "supplier_id", "created_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     po_number = Column(String, unique=True, nullable=False)
@@ -175,14 +220,19 @@ class PurchaseOrder(Base):
     priority = Column(String, default="Medium")
 
     total_amount = Column(DECIMAL(10, 2), nullable=True) # Kept original field
-    status = Column(
-        String,
-        default="DRAFT"
-    )  # DRAFT → APPROVED → IN_TRANSIT → RECEIVED
+    status = column_property(
+        Column(
+            String,
+            default="DRAFT",
+            index=True
+        ),  # DRAFT → APPROVED → IN_TRANSIT → RECEIVED
+        active_history=True  # old value needed by health_snapshot.py
+    )
 
     created_at = Column(
         DateTime(timezone=True),
-        server_default=func.now()
+        server_default=func.now(),
+        index=True
     )
     expected_delivery = Column(DateTime, nullable=True)
     expected_delivery_date = Column(Date, nullable=True)
@@ -205,7 +255,8 @@ class POItem(Base):
     po_id = Column(
         Integer,
         ForeignKey("purchase_orders.id"),
-        nullable=False
+        nullable=False,
+        index=True
     )
     product_id = Column(
         Integer,
@@ -217,4 +268,31 @@ class POItem(Base):
     unit_price = Column(DECIMAL(10, 2), nullable=False)
 
     purchase_order = relationship("PurchaseOrder", back_populates="items")
-    product = relationship("Product", back_populates="po_items")
\ No newline at end of file
+    product = relationship("Product", back_populates="po_items")
+
+
+# =====================================================
+# 9. HEALTH SNAPSHOT (Materialized Health Score Inputs)
+# =====================================================
+class HealthSnapshot(Base):
+    """
+    Single row (id = 1) maintained incrementally by health_snapshot.py,
+    so /procurement/health does not scan products and suppliers.
+    """
+    __tablename__ = "health_snapshots"
+
+    id = Column(Integer, primary_key=True)
+    critical_items = Column(Integer, nullable=False, default=0)   # products below CRITICAL_STOCK_RATIO
+    pending_pos = Column(Integer, nullable=False, default=0)      # POs in DRAFT / APPROVED
+    rated_suppliers = Column(Integer, nullable=False, default=0)  # suppliers with a reliability score
+    reliability_sum = Column(Float, nullable=False, default=0.0)
+
+    updated_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now()
+    )
+    rebuilt_at = Column(DateTime(timezone=True), nullable=True)
+
+    @property
+    def avg_reliability(self):
+        return self.reliability_sum / self.rated_suppliers if self.rated_suppliers else None
@@ -4,11 +4,16 @@
 # - Adaptive Prophet model that adjusts based on data availability
 # - Train and forecast
 # - Add holidays and seasonality based on data quality
+# - Reuse cached fits when the same series and configuration were seen before
+# - Predict once per horizon and derive forecast, components and seasonality from it
 
+import numpy as np
 import pandas as pd
+from statistics import NormalDist
 from prophet import Prophet
 from typing import Optional
 from config import settings, get_data_quality_tier
+from model_cache import model_cache, make_cache_key
 
 
 class DemandProphetModel:
@@ -25,7 +30,8 @@ class DemandProphetModel:
         daily_seasonality: bool = None,
         seasonality_mode: str = None,
         changepoint_prior_scale: float = None,
-        add_country_holidays: str = "IN"
+        add_country_holidays: str = "IN",
+        precision: str = None
     ):
         """
         Initialize adaptive Prophet model.
@@ -38,8 +44,14 @@ class DemandProphetModel:
             seasonality_mode: 'additive' or 'multiplicative'
             changepoint_prior_scale: Flexibility of trend changes
             add_country_holidays: Country code for holidays (e.g., 'IN' for India)
+            precision: 'full' for simulated uncertainty intervals, 'fast' for
+                       few/no simulation draws (default: settings.forecast_precision)
         """
         
+        self.precision = precision or settings.forecast_precision
+        if self.precision not in ("full", "fast"):
+            raise ValueError(f"Unknown precision '{self.precision}'. Use 'full' or 'fast'.")
+        
         self.data_months = data_months
         self.quality_tier = None
         
@@ -74,14 +86,20 @@ class DemandProphetModel:
             daily_seasonality=daily_seasonality if daily_seasonality is not None else settings.daily_seasonality,
             seasonality_mode=seasonality_mode or settings.base_seasonality_mode,
             changepoint_prior_scale=changepoint_prior_scale,
-            interval_width=0.95  # 95% confidence interval
+            interval_width=settings.confidence_interval,
+            uncertainty_samples=(
+                settings.fast_uncertainty_samples if self.precision == "fast"
+                else settings.full_uncertainty_samples
+            )
         )
         
         # Add country holidays if appropriate
+        self.holiday_country = None
         if self.add_holidays and add_country_holidays:
             try:
                 self.model.add_country_holidays(country_name=add_country_holidays)
                 self.holidays_enabled = True
+                self.holiday_country = add_country_holidays
             except Exception:
                 self.holidays_enabled = False
         else:
@@ -89,6 +107,8 @@ class DemandProphetModel:
         
         self._is_trained = False
         self._training_data = None
+        self._predictions = {}
+        self.loaded_from_cache = False
 
     def add_regressor(self, name: str, prior_scale: float = 10.0, mode: str = "additive"):
         """
@@ -104,12 +124,38 @@ class DemandProphetModel:
             raise ValueError("Cannot add regressors after model is trained.")
         self.model.add_regressor(name, prior_scale=prior_scale, mode=mode)
 
-    def train(self, monthly_df: pd.DataFrame):
+    def _fit_config(self) -> dict:
+        """
+        Collect every setting that changes the fitted parameters.
+        Used as part of the model cache key.
+        """
+        return {
+            "yearly_seasonality": self.model.yearly_seasonality,
+            "weekly_seasonality": self.model.weekly_seasonality,
+            "daily_seasonality": self.model.daily_seasonality,
+            "seasonality_mode": self.model.seasonality_mode,
+            "changepoint_prior_scale": self.model.changepoint_prior_scale,
+            "seasonality_prior_scale": self.model.seasonality_prior_scale,
+            "holidays_prior_scale": self.model.holidays_prior_scale,
+            "n_changepoints": self.model.n_changepoints,
+            "changepoint_range": self.model.changepoint_range,
+            "mcmc_samples": self.model.mcmc_samples,
+            "holiday_country": self.holiday_country,
+            "extra_regressors": self.model.extra_regressors
+        }
+
+    def train(self, monthly_df: pd.DataFrame, use_cache: bool = None, init: dict = None):
         """
         Train the Prophet model on monthly data.
         
+        If an identical series was already fitted with the same configuration,
+        the cached fit is loaded instead of running the optimizer again.
+        
         Args:
             monthly_df: DataFrame with 'ds' (date) and 'y' (value) columns
+            use_cache: Use the fitted model cache (default: settings.model_cache_enabled)
+            init: Optional Stan initial values, e.g. from get_warm_start_params()
+                  of a model fitted on overlapping data
         """
         if len(monthly_df) < settings.min_months_for_analysis:
             raise ValueError(
@@ -122,9 +168,121 @@ class DemandProphetModel:
             self.data_months = len(monthly_df)
             self.quality_tier = get_data_quality_tier(self.data_months)
         
-        self.model.fit(monthly_df)
+        if use_cache is None:
+            use_cache = settings.model_cache_enabled
+        
+        cache_key = make_cache_key(monthly_df, self._fit_config()) if use_cache else None
+        cached_model = model_cache.get(cache_key) if cache_key else None
+        
+        if cached_model is not None:
+            # Prediction-only settings are not part of the key - keep ours
+            cached_model.interval_width = self.model.interval_width
+            cached_model.uncertainty_samples = self.model.uncertainty_samples
+            self.model = cached_model
+            self.loaded_from_cache = True
+        else:
+            if init:
+                # Prophet falls back to defaults for any param whose shape changed
+                self.model.fit(monthly_df, init=init)
+            else:
+                self.model.fit(monthly_df)
+            if cache_key:
+                try:
+                    model_cache.put(cache_key, self.model)
+                except Exception:
+                    # Caching is best-effort; a failed write must not fail the forecast
+                    pass
+        
         self._is_trained = True
         self._training_data = monthly_df.copy()
+        self._predictions = {}
+
+    def get_warm_start_params(self) -> Optional[dict]:
+        """
+        Get fitted parameters in the form Prophet accepts as `init` for a new fit.
+        
+        sigma_obs is left out so Prophet starts it from its default: a short,
+        heavily parameterized series fits almost exactly, and starting the next
+        fit from that near-zero noise level makes the optimizer far slower
+        than a cold start.
+        
+        Returns:
+            dict: Stan initial values, or None if not trained
+        """
+        if not self._is_trained:
+            return None
+        
+        params = self.model.params
+        if self.model.mcmc_samples == 0:
+            return {
+                "k": params["k"][0][0],
+                "m": params["m"][0][0],
+                "delta": params["delta"][0],
+                "beta": params["beta"][0]
+            }
+        return {
+            "k": np.mean(params["k"]),
+            "m": np.mean(params["m"]),
+            "delta": np.mean(params["delta"], axis=0),
+            "beta": np.mean(params["beta"], axis=0)
+        }
+
+    def _predict(self, periods: int) -> pd.DataFrame:
+        """
+        Predict over history plus `periods` future months, memoized per horizon.
+        
+        Args:
+            periods: Number of future months to include
+            
+        Returns:
+            pd.DataFrame: Raw Prophet prediction frame
+        """
+        if periods not in self._predictions:
+            future = self.model.make_future_dataframe(periods=periods, freq="MS")
+            prediction = self.model.predict(future)
+            
+            # Prophet skips interval columns when uncertainty sampling is off
+            if "yhat_lower" not in prediction.columns:
+                self._add_analytic_intervals(prediction)
+            
+            self._predictions[periods] = prediction
+        return self._predictions[periods]
+
+    def _add_analytic_intervals(self, prediction: pd.DataFrame):
+        """
+        Approximate uncertainty bounds from the in-sample residual spread.
+        
+        Used in 'fast' mode instead of Prophet's trend simulation. The band is
+        yhat +/- z * residual_std, widened by sqrt(k) for the k-th future month.
+        """
+        last_historical_date = self.model.history_dates.max()
+        in_sample = prediction[["ds", "yhat"]].merge(self._training_data[["ds", "y"]], on="ds")
+        residual_std = float((in_sample["y"] - in_sample["yhat"]).std()) if len(in_sample) > 1 else 0.0
+        if np.isnan(residual_std):
+            residual_std = 0.0
+        
+        z = NormalDist().inv_cdf(0.5 + self.model.interval_width / 2)
+        steps_ahead = (prediction["ds"] > last_historical_date).cumsum().clip(lower=1)
+        margin = z * residual_std * np.sqrt(steps_ahead)
+        
+        prediction["yhat_lower"] = prediction["yhat"] - margin
+        prediction["yhat_upper"] = prediction["yhat"] + margin
+
+    def _predict_history(self) -> pd.DataFrame:
+        """
+        In-sample prediction rows, reusing any prediction already made.
+        
+        The history rows of a combined history+horizon prediction are the
+        same as an in-sample-only prediction, so no extra predict() is needed
+        once forecast() has run.
+        """
+        if self._predictions:
+            prediction = self._predictions[max(self._predictions)]
+        else:
+            prediction = self._predict(0)
+        
+        last_historical_date = self.model.history_dates.max()
+        return prediction[prediction["ds"] <= last_historical_date]
 
     def forecast(self, periods: int = 1) -> pd.DataFrame:
         """
@@ -145,9 +303,8 @@ class DemandProphetModel:
                 f"Requested: {periods}"
             )
         
-        # Create future dataframe
-        future = self.model.make_future_dataframe(periods=periods, freq="MS")
-        forecast = self.model.predict(future)
+        # Combined history + future prediction (memoized per horizon)
+        forecast = self._predict(periods)
 
         # Get only the future forecast points (exclude historical)
         last_historical_date = self.model.history_dates.max()
@@ -188,8 +345,7 @@ class DemandProphetModel:
         if not self._is_trained:
             return None
         
-        future = self.model.make_future_dataframe(periods=0, freq="MS")
-        forecast = self.model.predict(future)
+        forecast = self._predict_history()
         
         components = ["ds", "trend"]
         if "yearly" in forecast.columns:
@@ -214,8 +370,7 @@ class DemandProphetModel:
                 "interpretation": "Model not trained"
             }
         
-        future = self.model.make_future_dataframe(periods=0, freq="MS")
-        forecast = self.model.predict(future)
+        forecast = self._predict_history()
         
         # Calculate relative strength as ratio of component variance to total
         total_variance = forecast["yhat"].var()
@@ -286,12 +441,16 @@ class DemandProphetModel:
             dict: Model configuration and data quality information
         """
         info = {
+            "model_type": "prophet",
             "is_trained": self._is_trained,
             "data_months": self.data_months,
             "yearly_seasonality_enabled": self.model.yearly_seasonality,
             "holidays_enabled": self.holidays_enabled,
             "seasonality_mode": self.model.seasonality_mode,
-            "changepoint_prior_scale": self.model.changepoint_prior_scale
+            "changepoint_prior_scale": self.model.changepoint_prior_scale,
+            "precision": self.precision,
+            "uncertainty_samples": self.model.uncertainty_samples,
+            "loaded_from_cache": self.loaded_from_cache
         }
         
         if self.quality_tier:
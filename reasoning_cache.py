@@ -0,0 +1,137 @@
+# backend/reasoning_cache.py
+# --------------------------
+# Responsibility:
+# - TTL cache for short LLM-generated texts (procurement urgency reasoning)
+# - Bounded, concurrent fan-out of the blocking LLM calls
+# - Per-request deadline: late calls answer with fallback text, keep running
+#   in the background and fill the cache for the next request
+
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, Future, wait
+from typing import Callable, Dict, Hashable, Optional, Tuple
+
+from config import settings
+
+
+class ReasoningCache:
+    """
+    In-process TTL cache in front of a small LLM worker pool.
+
+    Identical keys requested while a call is in flight share that call, so
+    a page refreshed during a slow LLM response does not start a second one.
+    Failed calls are not cached; the next request retries them.
+    """
+
+    def __init__(self, max_workers: int = 8, ttl: int = 3600, max_entries: int = 1024):
+        self.max_workers = max_workers
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="llm")
+        self._entries = OrderedDict()   # key -> (expires_at, text)
+        self._pending: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.fallbacks = 0
+
+    def get(self, key: Hashable) -> Optional[str]:
+        """Cached text for key, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, text = entry
+            if expires_at < time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return text
+
+    def resolve(
+        self,
+        requests: Dict[Hashable, Tuple[Callable[[], str], str]],
+        deadline: float
+    ) -> Dict[Hashable, str]:
+        """
+        Get a text for every key, generating missing ones concurrently.
+
+        Args:
+            requests: key -> (generate, fallback); generate() makes the LLM
+                      call and may raise, fallback is used if it fails or
+                      does not finish in time
+            deadline: Seconds to wait for uncached keys
+
+        Returns:
+            dict: key -> generated, cached or fallback text
+        """
+        results = {}
+        futures = {}
+        for key, (generate, _) in requests.items():
+            cached = self.get(key)
+            if cached is not None:
+                results[key] = cached
+            else:
+                futures[key] = self._start(key, generate)
+
+        if futures:
+            wait(futures.values(), timeout=deadline)
+
+        fallbacks = 0
+        for key, future in futures.items():
+            if future.done() and future.exception() is None:
+                results[key] = future.result()
+            else:
+                results[key] = requests[key][1]
+                fallbacks += 1
+
+        with self._lock:
+            self.hits += len(requests) - len(futures)
+            self.misses += len(futures)
+            self.fallbacks += fallbacks
+        return results
+
+    def stats(self) -> dict:
+        """Get cache usage statistics."""
+        with self._lock:
+            entries, pending = len(self._entries), len(self._pending)
+            hits, misses, fallbacks = self.hits, self.misses, self.fallbacks
+        return {
+            "entries": entries,
+            "in_flight": pending,
+            "hits": hits,
+            "misses": misses,
+            "fallbacks": fallbacks,
+            "max_workers": self.max_workers,
+            "ttl_seconds": self.ttl
+        }
+
+    def _start(self, key: Hashable, generate: Callable[[], str]) -> Future:
+        with self._lock:
+            future = self._pending.get(key)
+            if future is None:
+                future = self._executor.submit(self._generate, key, generate)
+                self._pending[key] = future
+            return future
+
+    def _generate(self, key: Hashable, generate: Callable[[], str]) -> str:
+        try:
+            text = generate()
+            with self._lock:
+                self._entries[key] = (time.time() + self.ttl, text)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+            return text
+        finally:
+            with self._lock:
+                self._pending.pop(key, None)
+
+
+# Global cache instance
+reasoning_cache = ReasoningCache(
+    max_workers=settings.llm_reasoning_workers,
+    ttl=settings.llm_reasoning_cache_ttl_seconds,
+    max_entries=settings.llm_reasoning_cache_entries
+)
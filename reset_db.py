@@ -19,9 +19,11 @@ if confirm == "yes":
         connection.execute(text("DROP TABLE IF EXISTS products CASCADE"))
         connection.execute(text("DROP TABLE IF EXISTS suppliers CASCADE"))
         connection.execute(text("DROP TABLE IF EXISTS users CASCADE"))
+        connection.execute(text("DROP TABLE IF EXISTS health_snapshots"))
+        connection.execute(text("DROP TABLE IF EXISTS alembic_version"))
         connection.commit()
         
     print("✅ All tables dropped.")
-    print("🔄 Now run 'python main.py' to recreate them with the NEW columns.")
+    print("🔄 Now run 'python migrate.py' (or start the API) to recreate them.")
 else:
     print("❌ Operation cancelled.")
\ No newline at end of file
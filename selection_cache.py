@@ -0,0 +1,38 @@
+# backend/selection_cache.py
+# --------------------------
+# Responsibility:
+# - Remembers auto-selected forecaster winners per category and data fingerprint
+# - Disk-backed LRU, independent of the fitted Prophet model cache
+
+import hashlib
+import json
+from typing import Optional
+
+from config import settings
+from model_cache import JsonFileCache
+
+
+class ModelSelectionCache(JsonFileCache):
+    """
+    Remembers the winning forecaster of an auto-selection tournament,
+    keyed by category and a coarse data fingerprint.
+    """
+
+    @staticmethod
+    def make_key(category: str, fingerprint: dict) -> str:
+        payload = json.dumps([category, fingerprint], sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get_winner(self, category: str, fingerprint: dict) -> Optional[dict]:
+        return self.get(self.make_key(category, fingerprint))
+
+    def put_winner(self, category: str, fingerprint: dict, selection: dict):
+        self.put(self.make_key(category, fingerprint), selection)
+
+
+# Global cache instance
+selection_cache = ModelSelectionCache(
+    cache_dir=settings.auto_select_cache_dir,
+    max_entries=settings.auto_select_cache_entries,
+    max_size_mb=settings.auto_select_cache_max_size_mb
+)
@@ -3,9 +3,11 @@
 
 from sqlalchemy.orm import Session
 import models, database
+from migrate import upgrade_database
+import health_snapshot  # keeps the health snapshot in sync with seeded rows
 
 # Initialize database
-models.Base.metadata.create_all(bind=database.engine)
+upgrade_database()
 db = database.SessionLocal()
 
 # Sample Suppliers Data
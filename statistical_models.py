@@ -0,0 +1,343 @@
+# backend/statistical_models.py
+# -----------------------------
+# Responsibility:
+# - Lightweight NumPy forecasters for short, flat or intermittent series
+# - Same interface as DemandProphetModel (train / forecast / get_seasonality_strength / get_model_info)
+# - Seasonal naive, Holt's linear / damped trend, Croston / SBA
+
+from abc import ABC, abstractmethod
+
+import numpy as np
+import pandas as pd
+from statistics import NormalDist
+from typing import Optional
+from config import settings, get_data_quality_tier
+
+
+class StatisticalForecaster(ABC):
+    """
+    Base class for closed-form statistical forecasters.
+    Subclasses implement _fit() and _predict().
+    """
+
+    model_type = "statistical"
+    seasonal = False
+
+    def __init__(self, data_months: int = None, precision: str = None):
+        """
+        Initialize the forecaster.
+
+        Args:
+            data_months: Number of months of historical data
+            precision: Accepted for interface compatibility; intervals are always analytic
+        """
+        self.data_months = data_months
+        self.quality_tier = get_data_quality_tier(data_months) if data_months is not None else None
+        self.precision = precision or settings.forecast_precision
+        self.holidays_enabled = False
+        self.loaded_from_cache = False
+
+        self._is_trained = False
+        self._training_data = None
+        self._residual_std = 0.0
+
+    @abstractmethod
+    def _fit(self, y: np.ndarray) -> np.ndarray:
+        """Fit on history and return one-step-ahead in-sample predictions."""
+
+    @abstractmethod
+    def _predict(self, periods: int) -> np.ndarray:
+        """Point forecasts for the next `periods` months."""
+
+    def train(self, monthly_df: pd.DataFrame, **kwargs):
+        """
+        Train the forecaster on monthly data.
+
+        Args:
+            monthly_df: DataFrame with 'ds' (date) and 'y' (value) columns
+        """
+        if len(monthly_df) < settings.min_months_for_analysis:
+            raise ValueError(
+                f"Need at least {settings.min_months_for_analysis} data points to train. "
+                f"Provided: {len(monthly_df)}"
+            )
+
+        if self.data_months is None:
+            self.data_months = len(monthly_df)
+            self.quality_tier = get_data_quality_tier(self.data_months)
+
+        self._training_data = monthly_df[["ds", "y"]].copy()
+        y = self._training_data["y"].to_numpy(dtype=float)
+
+        fitted = self._fit(y)
+
+        # Residual spread of the one-step-ahead fit drives the interval width
+        residuals = (y - fitted)[~np.isnan(fitted)]
+        self._residual_std = float(residuals.std(ddof=1)) if len(residuals) > 1 else 0.0
+        self._is_trained = True
+
+    def forecast(self, periods: int = 1) -> pd.DataFrame:
+        """
+        Generate forecast for future periods.
+
+        Args:
+            periods: Number of months to forecast
+
+        Returns:
+            pd.DataFrame: Forecast results with Date, Forecasted_Units, bounds
+        """
+        if not self._is_trained:
+            raise ValueError("Model must be trained before forecasting.")
+
+        if periods > settings.max_forecast_horizon:
+            raise ValueError(
+                f"Forecast horizon cannot exceed {settings.max_forecast_horizon} months. "
+                f"Requested: {periods}"
+            )
+
+        yhat = self._predict(periods)
+
+        z = NormalDist().inv_cdf(0.5 + settings.confidence_interval / 2)
+        margin = z * self._residual_std * np.sqrt(np.arange(1, periods + 1))
+
+        dates = pd.date_range(
+            self._training_data["ds"].max() + pd.DateOffset(months=1),
+            periods=periods,
+            freq="MS"
+        )
+
+        forecast_df = pd.DataFrame({
+            "Date": dates,
+            "Forecasted_Units": yhat,
+            "Lower_Bound": yhat - margin,
+            "Upper_Bound": yhat + margin
+        })
+
+        # Enforce non-negative forecasts (units can't be negative)
+        for col in ["Forecasted_Units", "Lower_Bound", "Upper_Bound"]:
+            forecast_df[col] = forecast_df[col].clip(lower=0).round().astype(int)
+
+        return forecast_df
+
+    def get_components(self) -> Optional[pd.DataFrame]:
+        """Statistical forecasters have no additive component breakdown."""
+        return None
+
+    def get_seasonality_strength(self) -> dict:
+        """
+        Seasonality metrics in the same shape as DemandProphetModel.
+
+        Returns:
+            dict: Seasonality strength metrics with interpretation
+        """
+        return {
+            "yearly_seasonality_strength": 0.0,
+            "holiday_impact_strength": 0.0,
+            "seasonality_detected": False,
+            "interpretation": (
+                "Model not trained" if not self._is_trained
+                else "Seasonality not modelled - forecast is based on level and trend only"
+            ),
+            "holidays_enabled": False
+        }
+
+    def get_model_info(self) -> dict:
+        """
+        Get information about the model configuration.
+
+        Returns:
+            dict: Model configuration and data quality information
+        """
+        info = {
+            "model_type": self.model_type,
+            "is_trained": self._is_trained,
+            "data_months": self.data_months,
+            "yearly_seasonality_enabled": self.seasonal,
+            "holidays_enabled": False,
+            "seasonality_mode": "additive" if self.seasonal else None,
+            "changepoint_prior_scale": None,
+            "precision": self.precision,
+            "uncertainty_samples": 0,
+            "loaded_from_cache": False
+        }
+
+        if self.quality_tier:
+            info.update({
+                "data_quality_tier": self.quality_tier["tier"],
+                "data_quality_label": self.quality_tier["label"],
+                "confidence": self.quality_tier["confidence"],
+                "warning": self.quality_tier["warning"]
+            })
+
+        return info
+
+    @property
+    def is_trained(self) -> bool:
+        """Check if the model has been trained."""
+        return self._is_trained
+
+
+class SeasonalNaiveModel(StatisticalForecaster):
+    """
+    Repeats the value from the same month last year.
+    Falls back to the last observed value when less than a year is available.
+    """
+
+    model_type = "seasonal_naive"
+    seasonal = True
+
+    def __init__(self, data_months: int = None, precision: str = None, season_length: int = 12):
+        super().__init__(data_months=data_months, precision=precision)
+        self.season_length = season_length
+        self._y = None
+
+    def _lag(self, n: int) -> int:
+        return self.season_length if n >= self.season_length else 1
+
+    def _fit(self, y: np.ndarray) -> np.ndarray:
+        self._y = y
+        lag = self._lag(len(y))
+        fitted = np.full(len(y), np.nan)
+        fitted[lag:] = y[:-lag]
+        return fitted
+
+    def _predict(self, periods: int) -> np.ndarray:
+        lag = self._lag(len(self._y))
+        last_season = self._y[-lag:]
+        return np.array([last_season[h % lag] for h in range(periods)], dtype=float)
+
+    def get_seasonality_strength(self) -> dict:
+        """Seasonal swing of the average month-of-year profile, as % of the mean."""
+        result = super().get_seasonality_strength()
+        if not self._is_trained or len(self._y) < self.season_length:
+            return result
+
+        profile = self._training_data.groupby(self._training_data["ds"].dt.month)["y"].mean()
+        mean = abs(float(self._training_data["y"].mean()))
+        strength = float((profile.max() - profile.min()) / mean * 100) if mean > 0 else 0.0
+        detected = strength > settings.weak_seasonality_threshold
+
+        if not detected:
+            interpretation = "No significant seasonal pattern detected"
+        elif strength > settings.strong_seasonality_threshold:
+            interpretation = "Strong seasonal patterns - demand varies significantly throughout the year"
+        elif strength > settings.moderate_seasonality_threshold:
+            interpretation = "Moderate seasonal patterns - noticeable variation across months"
+        else:
+            interpretation = "Weak seasonal patterns - some monthly variation present"
+
+        result.update({
+            "yearly_seasonality_strength": round(strength, 1),
+            "seasonality_detected": detected,
+            "interpretation": interpretation
+        })
+        return result
+
+
+class HoltModel(StatisticalForecaster):
+    """
+    Holt's linear trend exponential smoothing, optionally damped.
+
+    Smoothing parameters are chosen by minimizing in-sample one-step squared
+    error over a grid; the recursion runs vectorized across all grid points.
+    """
+
+    ALPHAS = np.linspace(0.1, 0.9, 9)
+    BETAS = np.array([0.05, 0.1, 0.2, 0.3, 0.5])
+    PHIS = np.array([0.8, 0.85, 0.9, 0.95, 0.98])
+
+    def __init__(self, data_months: int = None, precision: str = None, damped: bool = False):
+        super().__init__(data_months=data_months, precision=precision)
+        self.damped = damped
+        self.model_type = "damped_holt" if damped else "holt"
+        self.alpha = None
+        self.beta = None
+        self.phi = 1.0
+        self._level = None
+        self._trend = None
+
+    def _fit(self, y: np.ndarray) -> np.ndarray:
+        phis = self.PHIS if self.damped else np.array([1.0])
+        alpha, beta, phi = (g.ravel() for g in np.meshgrid(self.ALPHAS, self.BETAS, phis, indexing="ij"))
+
+        level = np.full(alpha.shape, y[0])
+        trend = np.full(alpha.shape, y[1] - y[0])
+        fitted = np.full((len(y), len(alpha)), np.nan)
+
+        for t in range(1, len(y)):
+            prediction = level + phi * trend
+            fitted[t] = prediction
+            new_level = alpha * y[t] + (1 - alpha) * prediction
+            trend = beta * (new_level - level) + (1 - beta) * phi * trend
+            level = new_level
+
+        sse = np.nansum((fitted - y[:, None]) ** 2, axis=0)
+        best = int(np.argmin(sse))
+
+        self.alpha = float(alpha[best])
+        self.beta = float(beta[best])
+        self.phi = float(phi[best])
+        self._level = float(level[best])
+        self._trend = float(trend[best])
+        return fitted[:, best]
+
+    def _predict(self, periods: int) -> np.ndarray:
+        damping = np.cumsum(self.phi ** np.arange(1, periods + 1))
+        return self._level + damping * self._trend
+
+    def get_model_info(self) -> dict:
+        info = super().get_model_info()
+        info.update({"alpha": self.alpha, "beta": self.beta, "phi": self.phi})
+        return info
+
+
+class CrostonModel(StatisticalForecaster):
+    """
+    Croston's method for intermittent demand, with the optional
+    Syntetos-Boylan (SBA) bias correction.
+    """
+
+    def __init__(self, data_months: int = None, precision: str = None, alpha: float = None, sba: bool = True):
+        super().__init__(data_months=data_months, precision=precision)
+        self.alpha = alpha if alpha is not None else settings.croston_alpha
+        self.sba = sba
+        self.model_type = "sba" if sba else "croston"
+        self._rate = 0.0
+
+    def _fit(self, y: np.ndarray) -> np.ndarray:
+        correction = (1 - self.alpha / 2) if self.sba else 1.0
+        fitted = np.full(len(y), np.nan)
+
+        nonzero = np.flatnonzero(y > 0)
+        if len(nonzero) == 0:
+            self._rate = 0.0
+            fitted[1:] = 0.0
+            return fitted
+
+        # Initialize from the first demand occurrence
+        size = y[nonzero[0]]
+        interval = float(nonzero[0] + 1)
+        since_last = 0
+
+        for t in range(nonzero[0] + 1, len(y)):
+            fitted[t] = correction * size / interval
+            since_last += 1
+            if y[t] > 0:
+                size += self.alpha * (y[t] - size)
+                interval += self.alpha * (since_last - interval)
+                since_last = 0
+
+        self._rate = correction * size / interval
+        return fitted
+
+    def _predict(self, periods: int) -> np.ndarray:
+        return np.full(periods, self._rate)
+
+
+STATISTICAL_MODELS = {
+    "seasonal_naive": lambda data_months, precision: SeasonalNaiveModel(data_months, precision),
+    "holt": lambda data_months, precision: HoltModel(data_months, precision, damped=False),
+    "damped_holt": lambda data_months, precision: HoltModel(data_months, precision, damped=True),
+    "croston": lambda data_months, precision: CrostonModel(data_months, precision, sba=False),
+    "sba": lambda data_months, precision: CrostonModel(data_months, precision, sba=True)
+}
@@ -0,0 +1,274 @@
+# backend/supplier_index.py
+# -------------------------
+# Responsibility:
+# - Load suppliers once and keep per-category scoring arrays in memory
+# - Vectorized best-supplier matching for many products at a time
+# - Batch supplier x product score matrices with configurable weights and top-k
+# - Invalidation on supplier writes, plus a max age for writes from other processes
+
+import math
+import threading
+import time
+from collections import namedtuple
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+import models
+from config import settings
+
+# Detached snapshot of a supplier row - safe to share between requests and sessions
+SupplierRow = namedtuple(
+    "SupplierRow",
+    ["id", "name", "category", "reliability_score", "delivery_speed_days", "price_per_unit"]
+)
+
+DEFAULT_WEIGHTS = {"reliability": 0.4, "lead_time": 0.3, "price": 0.3}
+
+
+def normalize_weights(weights: Optional[Dict[str, float]] = None) -> Dict[str, float]:
+    """
+    Fill in default weights and rescale them to sum to 1, so scores stay 0-100.
+
+    Raises:
+        ValueError: On unknown keys, non-finite or negative weights, or an all-zero total
+    """
+    merged = dict(DEFAULT_WEIGHTS)
+    if weights:
+        unknown = set(weights) - set(DEFAULT_WEIGHTS)
+        if unknown:
+            raise ValueError(
+                f"Unknown weight(s): {', '.join(sorted(unknown))}. "
+                f"Use {', '.join(DEFAULT_WEIGHTS)}"
+            )
+        merged.update(weights)
+
+    if not all(math.isfinite(w) for w in merged.values()):
+        raise ValueError("Weights must be finite numbers")
+    if any(w < 0 for w in merged.values()):
+        raise ValueError("Weights must not be negative")
+    total = sum(merged.values())
+    if total <= 0:
+        raise ValueError("At least one weight must be positive")
+    return {k: w / total for k, w in merged.items()}
+
+
+def score_matrix(
+    reliability: np.ndarray,
+    lead_days: np.ndarray,
+    supplier_prices: np.ndarray,
+    product_prices: np.ndarray,
+    weights: Optional[Dict[str, float]] = None
+) -> np.ndarray:
+    """
+    Batch version of calculate_supplier_score.
+
+    Args:
+        reliability: Supplier reliability scores (0-100)
+        lead_days: Supplier delivery speed in days
+        supplier_prices: Supplier price per unit
+        product_prices: Product unit prices; NaN or 0 gets the neutral price score
+        weights: reliability / lead_time / price weights (default 40/30/30)
+
+    Returns:
+        np.ndarray: Scores (products x suppliers), 0-100 rounded to 2 decimals
+    """
+    weights = normalize_weights(weights)
+    base = (
+        (reliability / 100) * weights["reliability"]
+        + np.maximum(0, 1 - lead_days / 30) * weights["lead_time"]
+    )
+
+    prices = product_prices[:, None]
+    priced = np.isfinite(prices) & (prices != 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        price_norm = np.where(
+            priced,
+            np.maximum(0, 1 - supplier_prices[None, :] / (prices * 2)),
+            0.7  # Default neutral score
+        )
+    return np.round((base[None, :] + price_norm * weights["price"]) * 100, 2)
+
+
+def top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """
+    Column indices of the k best scores per row, best first.
+
+    Ties keep the lower column (lower supplier id) first; -inf entries
+    (excluded suppliers) sort last.
+    """
+    k = min(k, scores.shape[1])
+    if k <= 0:
+        return np.empty((scores.shape[0], 0), dtype=int)
+    if k < scores.shape[1]:
+        candidates = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    else:
+        candidates = np.broadcast_to(np.arange(scores.shape[1]), scores.shape)
+    candidate_scores = np.take_along_axis(scores, candidates, axis=1)
+    # Sort each row by score desc, then column asc
+    order = np.lexsort((candidates, -candidate_scores), axis=1)
+    best = np.take_along_axis(candidates, order, axis=1)
+
+    # argpartition picks arbitrarily among scores tied with the k-th best;
+    # redo those rows with a stable full sort so the lower column wins
+    tied = (scores >= candidate_scores.min(axis=1, keepdims=True)).sum(axis=1) > k
+    if tied.any():
+        best[tied] = np.argsort(-scores[tied], axis=1, kind="stable")[:, :k]
+    return best
+
+
+class _CategoryRanking:
+    """Scoring arrays for one category's suppliers, ordered by id."""
+
+    def __init__(self, suppliers: List[SupplierRow]):
+        self.suppliers = suppliers
+        self.categories = np.array([s.category for s in suppliers], dtype=object)
+        self.reliability = np.array([s.reliability_score or 0.0 for s in suppliers], dtype=float)
+        self.lead_days = np.array([s.delivery_speed_days or 0 for s in suppliers], dtype=float)
+        self.price_per_unit = np.array([s.price_per_unit or 0.0 for s in suppliers], dtype=float)
+
+    def scores(self, product_prices: np.ndarray, weights: Optional[Dict[str, float]] = None) -> np.ndarray:
+        """Score matrix (products x suppliers)."""
+        return score_matrix(self.reliability, self.lead_days, self.price_per_unit, product_prices, weights)
+
+
+class SupplierIndex:
+    """
+    In-memory supplier rankings, rebuilt lazily after invalidate().
+
+    Products whose category has no supplier are matched against every
+    supplier instead.
+    """
+
+    def __init__(self, max_age: int = 300):
+        self.max_age = max_age
+        self._rankings: Optional[Dict[str, _CategoryRanking]] = None
+        self._everyone: Optional[_CategoryRanking] = None
+        self._loaded_at = 0.0
+        self._lock = threading.Lock()
+        self.rebuilds = 0
+
+    def invalidate(self):
+        """Drop the index; the next lookup reloads suppliers."""
+        with self._lock:
+            self._rankings = None
+            self._everyone = None
+
+    def best_for_products(
+        self,
+        db: Session,
+        categories: Sequence[str],
+        product_prices: Sequence[Optional[float]]
+    ) -> List[Optional[Tuple[SupplierRow, float]]]:
+        """
+        Best supplier and its score for every product.
+
+        Args:
+            db: Session used to (re)load suppliers if the index is stale
+            categories: Product categories
+            product_prices: Product unit prices (None / 0 = neutral price score)
+
+        Returns:
+            list: (supplier, score) per product, or None if there are no suppliers
+        """
+        rankings, everyone = self._load(db)
+        prices = np.array([np.nan if p is None else p for p in product_prices], dtype=float)
+        results: List[Optional[Tuple[SupplierRow, float]]] = [None] * len(categories)
+        if everyone is None:
+            return results
+
+        by_category: Dict[str, List[int]] = {}
+        for i, category in enumerate(categories):
+            by_category.setdefault(category, []).append(i)
+
+        for category, positions in by_category.items():
+            ranking = rankings.get(category, everyone)
+            scores = ranking.scores(prices[positions])
+            # argmax keeps the first (lowest id) supplier on ties
+            best = scores.argmax(axis=1)
+            for row, position in enumerate(positions):
+                results[position] = (ranking.suppliers[best[row]], float(scores[row, best[row]]))
+        return results
+
+    def best_for_product(self, db: Session, category: str, product_price: Optional[float] = None):
+        """Single-product convenience wrapper around best_for_products."""
+        return self.best_for_products(db, [category], [product_price])[0]
+
+    def score_all(
+        self,
+        db: Session,
+        categories: Sequence[str],
+        product_prices: Sequence[Optional[float]],
+        weights: Optional[Dict[str, float]] = None,
+        same_category_only: bool = False
+    ) -> Tuple[List[SupplierRow], np.ndarray]:
+        """
+        Score every supplier against every product.
+
+        Args:
+            db: Session used to (re)load suppliers if the index is stale
+            categories: Product categories (used with same_category_only)
+            product_prices: Product unit prices
+            weights: Optional reliability / lead_time / price weights
+            same_category_only: Exclude (score -inf) suppliers outside the
+                product's category, unless the category has no suppliers
+
+        Returns:
+            tuple: (suppliers ordered by id, score matrix products x suppliers)
+        """
+        _, everyone = self._load(db)
+        if everyone is None:
+            return [], np.empty((len(categories), 0))
+
+        prices = np.array([np.nan if p is None else p for p in product_prices], dtype=float)
+        scores = everyone.scores(prices, weights)
+
+        if same_category_only and len(categories):
+            product_categories = np.array(categories, dtype=object)
+            allowed = product_categories[:, None] == everyone.categories[None, :]
+            allowed |= ~allowed.any(axis=1, keepdims=True)
+            scores = np.where(allowed, scores, -np.inf)
+
+        return everyone.suppliers, scores
+
+    def stats(self) -> dict:
+        """Get index statistics."""
+        with self._lock:
+            rankings, everyone, loaded_at = self._rankings, self._everyone, self._loaded_at
+        return {
+            "loaded": rankings is not None,
+            "suppliers": len(everyone.suppliers) if everyone is not None else 0,
+            "categories": len(rankings) if rankings is not None else 0,
+            "age_seconds": round(time.time() - loaded_at, 1) if rankings is not None else None,
+            "rebuilds": self.rebuilds
+        }
+
+    def _load(self, db: Session):
+        with self._lock:
+            if self._rankings is not None and time.time() - self._loaded_at < self.max_age:
+                return self._rankings, self._everyone
+
+            rows = db.query(
+                models.Supplier.id,
+                models.Supplier.name,
+                models.Supplier.category,
+                models.Supplier.reliability_score,
+                models.Supplier.delivery_speed_days,
+                models.Supplier.price_per_unit
+            ).order_by(models.Supplier.id).all()
+            suppliers = [SupplierRow(*row) for row in rows]
+
+            grouped: Dict[str, List[SupplierRow]] = {}
+            for supplier in suppliers:
+                grouped.setdefault(supplier.category, []).append(supplier)
+
+            self._rankings = {category: _CategoryRanking(group) for category, group in grouped.items()}
+            self._everyone = _CategoryRanking(suppliers) if suppliers else None
+            self._loaded_at = time.time()
+            self.rebuilds += 1
+            return self._rankings, self._everyone
+
+
+# Global index instance
+supplier_index = SupplierIndex(max_age=settings.supplier_index_max_age_seconds)
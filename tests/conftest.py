@@ -0,0 +1,17 @@
+# tests/conftest.py
+# Shared test setup: import the flat backend modules and point every
+# on-disk store at a throwaway directory before anything reads settings.
+
+import os
+import sys
+import tempfile
+
+_TMP = tempfile.mkdtemp(prefix="backend-tests-")
+
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{os.path.join(_TMP, 'test.db')}")
+os.environ.setdefault("MODEL_CACHE_DIR", os.path.join(_TMP, "model_cache"))
+os.environ.setdefault("AUTO_SELECT_CACHE_DIR", os.path.join(_TMP, "selection_cache"))
+os.environ.setdefault("DATASET_DIR", os.path.join(_TMP, "datasets"))
+os.environ.setdefault("GROQ_API_KEY", "test")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
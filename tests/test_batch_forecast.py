@@ -0,0 +1,106 @@
+# tests/test_batch_forecast.py
+
+import io
+import json
+import os
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import forecast_service
+
+
+def timed_fit(category, monthly_df, periods, precision, model_type):
+    started = time.time()
+    time.sleep(0.3)
+    return {"category": category, "status": "success", "pid": os.getpid(), "span": (started, time.time())}
+
+
+def monthly(months: int = 12) -> pd.DataFrame:
+    return pd.DataFrame({
+        "ds": pd.date_range("2023-01-01", periods=months, freq="MS"),
+        "y": np.arange(months, dtype=float) + 10
+    })
+
+
+def max_overlap(spans) -> int:
+    events = sorted([(start, 1) for start, _ in spans] + [(end, -1) for _, end in spans])
+    running = peak = 0
+    for _, change in events:
+        running += change
+        peak = max(peak, running)
+    return peak
+
+
+def test_batch_reports_errors_then_every_category(monkeypatch):
+    monkeypatch.setattr(forecast_service, "_forecast_category", timed_fit)
+    prepared = {f"C{i}": monthly() for i in range(4)}
+
+    results = list(forecast_service.forecast_prepared_categories(
+        prepared=prepared, errors={"Tiny": "Only 2 month(s)"}, periods=1, max_workers=2
+    ))
+
+    assert results[0] == {"category": "Tiny", "status": "error", "message": "Only 2 month(s)"}
+    assert sorted(r["category"] for r in results[1:]) == sorted(prepared)
+
+
+@pytest.fixture
+def two_worker_pool(monkeypatch):
+    forecast_service.shutdown_batch_pool()
+    monkeypatch.setattr(forecast_service.settings, "batch_forecast_workers", 2)
+    yield
+    forecast_service.shutdown_batch_pool()
+
+
+def test_max_workers_limits_concurrent_fits_and_pool_is_reused(monkeypatch, two_worker_pool):
+    monkeypatch.setattr(forecast_service, "_forecast_category", timed_fit)
+    prepared = {f"C{i}": monthly() for i in range(6)}
+
+    first = list(forecast_service.forecast_prepared_categories(prepared=prepared, periods=1, max_workers=2))
+    pool = forecast_service.get_batch_pool()
+    second = list(forecast_service.forecast_prepared_categories(prepared=prepared, periods=1, max_workers=1))
+
+    assert max_overlap([r["span"] for r in first]) <= 2
+    assert max_overlap([r["span"] for r in second]) == 1
+    assert forecast_service.get_batch_pool() is pool
+    # Same worker processes serve both batches
+    assert {r["pid"] for r in second} <= {r["pid"] for r in first}
+    assert os.getpid() not in {r["pid"] for r in first}
+
+
+def test_shutdown_batch_pool_starts_fresh_pool_on_next_batch(monkeypatch):
+    monkeypatch.setattr(forecast_service, "_forecast_category", timed_fit)
+    pool = forecast_service.get_batch_pool()
+
+    forecast_service.shutdown_batch_pool()
+    results = list(forecast_service.forecast_prepared_categories(prepared={"A": monthly()}, periods=1))
+
+    assert results[0]["status"] == "success"
+    assert forecast_service.get_batch_pool() is not pool
+
+
+def test_batch_endpoint_streams_one_line_per_category():
+    from fastapi.testclient import TestClient
+    import main
+
+    rng = np.random.default_rng(0)
+    dates = pd.date_range("2023-01-01", "2023-12-31", freq="D")
+    sales = pd.concat([
+        pd.DataFrame({"Date": dates, "Category": category, "Units_Sold": rng.integers(0, 50, len(dates))})
+        for category in ("A", "B")
+    ] + [pd.DataFrame({"Date": dates[:40], "Category": "Tiny", "Units_Sold": 1})])
+    upload = {"file": ("sales.csv", sales.to_csv(index=False).encode("utf-8"), "text/csv")}
+    form = {"date_col": "Date", "category_col": "Category", "units_col": "Units_Sold", "model_type": "holt"}
+    client = TestClient(main.app)
+
+    response = client.post("/forecast/batch", files=upload, data={**form, "max_workers": "2"})
+    assert response.status_code == 200
+    lines = [json.loads(line) for line in io.StringIO(response.text) if line.strip()]
+
+    assert lines[0]["category"] == "Tiny" and lines[0]["status"] == "error"
+    assert {line["category"]: line["status"] for line in lines[1:]} == {"A": "success", "B": "success"}
+
+    rejected = client.post("/forecast/batch", files=upload, data={**form, "max_workers": "0"})
+    assert rejected.status_code == 400
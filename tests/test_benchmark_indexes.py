@@ -0,0 +1,22 @@
+# tests/test_benchmark_indexes.py
+
+from sqlalchemy import create_engine
+
+import benchmark_indexes
+
+
+def test_benchmark_drops_and_rebuilds_every_index(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'bench.db'}")
+    benchmark_indexes.seed(engine, rows=2_000, batch_size=500)
+
+    before = benchmark_indexes.run_queries(engine, repeats=1)
+    benchmark_indexes.create_indexes(engine)
+    # A second run must not fail on indexes that already exist
+    benchmark_indexes.drop_indexes(engine)
+    benchmark_indexes.create_indexes(engine)
+    after = benchmark_indexes.run_queries(engine, repeats=1)
+
+    for label in ("Critical product count (health)", "Most depleted products (recommendations)"):
+        assert "ix_products_stock_ratio" not in before[label]["plan"]
+        assert "ix_products_stock_ratio" in after[label]["plan"]
+    assert all("USING" in result["plan"] for result in after.values())
@@ -0,0 +1,63 @@
+# tests/test_compute_executor.py
+
+import asyncio
+import threading
+import time
+
+import pandas as pd
+
+import forecast_service
+from compute_executor import ComputeExecutor
+
+
+def slow_fit(category, monthly_df, periods, precision, model_type):
+    time.sleep(0.5)
+    return {"category": category, "status": "success"}
+
+
+def test_iterate_yields_every_item():
+    executor = ComputeExecutor(max_workers=2)
+
+    async def collect():
+        return [item async for item in executor.iterate(iter(range(5)))]
+
+    assert asyncio.run(collect()) == [0, 1, 2, 3, 4]
+
+
+def test_iterate_closes_generator_on_executor_when_consumer_stops():
+    executor = ComputeExecutor(max_workers=2)
+    closed = threading.Event()
+    closed_on = []
+
+    def produce():
+        try:
+            for i in range(100):
+                yield i
+        finally:
+            closed_on.append(threading.current_thread().name)
+            closed.set()
+
+    async def consume_one():
+        items = executor.iterate(produce())
+        async for item in items:
+            break
+        await items.aclose()
+        return item
+
+    assert asyncio.run(consume_one()) == 0
+    assert closed.wait(5)
+    assert closed_on[0].startswith("compute")
+
+
+def test_closing_batch_forecast_cancels_queued_categories(monkeypatch):
+    monkeypatch.setattr(forecast_service, "_forecast_category", slow_fit)
+    prepared = {f"C{i}": pd.DataFrame() for i in range(8)}
+
+    results = forecast_service.forecast_prepared_categories(prepared=prepared, errors={}, periods=3, max_workers=1)
+    first = next(results)
+    started = time.perf_counter()
+    results.close()
+
+    assert first["status"] == "success"
+    # Only the fit already running is waited for, not the 6 still queued
+    assert time.perf_counter() - started < 2.0
@@ -0,0 +1,133 @@
+# tests/test_data_preparation.py
+
+import gzip
+import io
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from data_preparation import (
+    detect_input_format,
+    prepare_all_categories,
+    prepare_category_data,
+    stream_monthly_totals
+)
+
+
+def make_sales(months: int = 24, categories=("A", "B")) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    dates = pd.date_range("2022-01-01", periods=months * 30, freq="D")
+    rows = [
+        {"Date": d, "Category": c, "Units_Sold": int(rng.integers(0, 50))}
+        for d in dates for c in categories
+    ]
+    return pd.DataFrame(rows)
+
+
+def csv_bytes(df: pd.DataFrame) -> bytes:
+    return df.to_csv(index=False).encode("utf-8")
+
+
+def test_prepare_all_categories_matches_per_category():
+    df = make_sales()
+    prepared, errors = prepare_all_categories(df)
+
+    assert errors == {}
+    assert sorted(prepared) == ["A", "B"]
+    for category, monthly in prepared.items():
+        expected = prepare_category_data(df, category)
+        pd.testing.assert_frame_equal(
+            monthly.reset_index(drop=True), expected.reset_index(drop=True), check_dtype=False
+        )
+
+
+def test_prepare_all_categories_reports_short_series():
+    df = pd.concat([make_sales(24, ("A",)), make_sales(2, ("Tiny",))])
+    prepared, errors = prepare_all_categories(df)
+
+    assert "A" in prepared
+    assert "Tiny" in errors and "Tiny" not in prepared
+
+
+def test_prepare_all_categories_subset():
+    prepared, _ = prepare_all_categories(make_sales(), categories=["B"])
+    assert list(prepared) == ["B"]
+
+
+def test_prepare_all_categories_without_dates():
+    df = pd.DataFrame({"Date": ["x", "y"], "Category": ["A", "A"], "Units_Sold": [1, 2]})
+    with pytest.raises(ValueError):
+        prepare_all_categories(df)
+
+
+def test_detect_input_format():
+    pytest.importorskip("pyarrow")
+    df = make_sales(2)
+    parquet = io.BytesIO()
+    df.to_parquet(parquet)
+
+    assert detect_input_format(io.BytesIO(csv_bytes(df))) == "csv"
+    assert detect_input_format(io.BytesIO(gzip.compress(csv_bytes(df)))) == "csv.gz"
+    assert detect_input_format(io.BytesIO(parquet.getvalue())) == "parquet"
+
+
+def test_stream_monthly_totals_csv_chunks_match_whole_file():
+    data = csv_bytes(make_sales())
+    whole = stream_monthly_totals(io.BytesIO(data))
+    chunked = stream_monthly_totals(io.BytesIO(data), chunksize=97)
+    pd.testing.assert_series_equal(whole, chunked)
+
+
+def test_stream_monthly_totals_parses_ambiguous_dates_like_whole_file():
+    # The first date is unambiguously day-first; later chunks start with
+    # dates like 01/02/2023 that would otherwise be read month-first
+    dates = pd.date_range("2023-01-13", "2023-12-31", freq="D")
+    df = pd.DataFrame({"Date": dates.strftime("%d/%m/%Y"), "Category": "A", "Units_Sold": 1})
+    data = csv_bytes(df)
+
+    with pytest.warns(UserWarning, match="dayfirst"):
+        chunked = stream_monthly_totals(io.BytesIO(data), chunksize=19)
+    expected, _ = prepare_all_categories(pd.read_csv(io.BytesIO(data), dtype=str))
+
+    monthly = chunked.loc["A"].rename_axis("ds").rename("y").reset_index()
+    pd.testing.assert_frame_equal(monthly, expected["A"])
+    assert list(chunked.loc["A"]) == [dates[dates.month == m].size for m in range(1, 13)]
+
+
+def test_stream_monthly_totals_gzip_matches_csv():
+    data = csv_bytes(make_sales())
+    pd.testing.assert_series_equal(
+        stream_monthly_totals(io.BytesIO(data)),
+        stream_monthly_totals(io.BytesIO(gzip.compress(data)))
+    )
+
+
+def test_stream_monthly_totals_parquet_matches_csv():
+    pytest.importorskip("pyarrow")
+    df = make_sales()
+    parquet = io.BytesIO()
+    df.to_parquet(parquet)
+    parquet.seek(0)
+
+    pd.testing.assert_series_equal(
+        stream_monthly_totals(parquet, chunksize=100),
+        stream_monthly_totals(io.BytesIO(csv_bytes(df)))
+    )
+
+
+def test_parquet_integer_category_matches_string_filter():
+    # Native int columns must behave like the CSV path, which reads strings
+    pytest.importorskip("pyarrow")
+    df = make_sales(categories=(101, 202))
+    parquet = io.BytesIO()
+    df.to_parquet(parquet)
+    parquet.seek(0)
+
+    totals = stream_monthly_totals(parquet, categories=["101"])
+    assert set(totals.index.get_level_values(0)) == {"101"}
+
+
+def test_stream_monthly_totals_missing_column():
+    with pytest.raises(ValueError):
+        stream_monthly_totals(io.BytesIO(b"Date,Category\n2024-01-01,A\n"))
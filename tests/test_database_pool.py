@@ -0,0 +1,94 @@
+# tests/test_database_pool.py
+
+import os
+import threading
+import time
+
+import pytest
+from sqlalchemy import create_engine, exc, text
+
+import database
+from database import InstrumentedQueuePool, PoolMonitor
+
+
+@pytest.fixture
+def monitored(monkeypatch, tmp_path):
+    monitor = PoolMonitor()
+    monkeypatch.setattr(database, "pool_monitor", monitor)
+    engine = create_engine(
+        f"sqlite:///{os.path.join(tmp_path, 'pool.db')}",
+        poolclass=InstrumentedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.2
+    )
+    monitor.attach(engine)
+    yield engine, monitor
+    engine.dispose()
+
+
+def hold_connection(engine, seconds: float) -> threading.Thread:
+    held = threading.Event()
+
+    def hold():
+        with engine.connect():
+            held.set()
+            time.sleep(seconds)
+
+    thread = threading.Thread(target=hold)
+    thread.start()
+    assert held.wait(5)
+    return thread
+
+
+def test_counts_checkouts_and_new_connections(monitored):
+    engine, monitor = monitored
+    for _ in range(3):
+        with engine.connect() as conn:
+            conn.execute(text("select 1"))
+
+    stats = monitor.stats()
+    assert stats["checkouts"] == 3
+    assert stats["connections_opened"] == 1
+    assert stats["waits"] == 0 and stats["timeouts"] == 0
+
+
+def test_records_wait_for_busy_pool(monitored):
+    engine, monitor = monitored
+    holder = hold_connection(engine, 0.1)
+
+    with engine.connect():
+        pass
+    holder.join()
+
+    stats = monitor.stats()
+    assert stats["waits"] == 1
+    assert stats["max_wait_ms"] >= 50
+    assert stats["avg_wait_ms"] == stats["max_wait_ms"]
+
+
+def test_records_timeout(monitored):
+    engine, monitor = monitored
+    holder = hold_connection(engine, 0.5)
+
+    with pytest.raises(exc.TimeoutError):
+        engine.connect()
+    holder.join()
+
+    stats = monitor.stats()
+    assert stats["timeouts"] == 1
+    assert stats["waits"] == 1
+
+
+def test_pool_stats_survive_dispose():
+    with database.engine.connect():
+        pass
+    before = database.get_pool_stats()["checkouts"]
+
+    database.engine.dispose()
+    with database.engine.connect():
+        pass
+
+    stats = database.get_pool_stats()
+    assert stats["pool_class"] == "InstrumentedQueuePool"
+    assert stats["checkouts"] == before + 1
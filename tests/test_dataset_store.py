@@ -0,0 +1,125 @@
+# tests/test_dataset_store.py
+
+import io
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from data_preparation import prepare_all_categories
+from dataset_store import DatasetStore, make_dataset_id
+
+MAPPING = ("Date", "Category", "Units_Sold")
+
+
+def sales_csv(months: int = 12, categories=("A", "B"), seed: int = 0) -> bytes:
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range("2023-01-01", periods=months * 30, freq="D")
+    df = pd.DataFrame([
+        {"Date": d, "Category": c, "Units_Sold": int(rng.integers(0, 50))}
+        for d in dates for c in categories
+    ])
+    return df.to_csv(index=False).encode("utf-8")
+
+
+def assert_same_prepared(actual: dict, expected: dict):
+    assert sorted(actual) == sorted(expected)
+    for category, monthly in expected.items():
+        pd.testing.assert_frame_equal(
+            actual[category].reset_index(drop=True), monthly.reset_index(drop=True), check_dtype=False
+        )
+
+
+def test_dataset_id_depends_on_content_and_mapping():
+    data = sales_csv()
+    source = io.BytesIO(data)
+
+    dataset_id = make_dataset_id(source, *MAPPING)
+
+    assert source.tell() == 0
+    assert dataset_id == make_dataset_id(io.BytesIO(data), *MAPPING)
+    assert dataset_id != make_dataset_id(io.BytesIO(sales_csv(seed=1)), *MAPPING)
+    assert dataset_id != make_dataset_id(io.BytesIO(data), "Date", "Category", "Other")
+
+
+def test_create_and_get_round_trip(tmp_path):
+    data = sales_csv()
+    store = DatasetStore(str(tmp_path))
+
+    meta = store.create(io.BytesIO(data), *MAPPING)
+    record = store.get(meta["dataset_id"])
+
+    assert meta["categories"] == ["A", "B"]
+    assert meta["months_per_category"] == {"A": 12, "B": 12}
+    expected, _ = prepare_all_categories(pd.read_csv(io.BytesIO(data)))
+    assert_same_prepared(record["prepared"], expected)
+
+
+def test_reupload_returns_existing_dataset(tmp_path):
+    data = sales_csv()
+    store = DatasetStore(str(tmp_path))
+
+    first = store.create(io.BytesIO(data), *MAPPING)
+    second = store.create(io.BytesIO(data), *MAPPING)
+
+    assert second == first
+    assert store.stats()["on_disk"] == 1
+
+
+def test_reload_from_disk(tmp_path):
+    store = DatasetStore(str(tmp_path))
+    meta = store.create(io.BytesIO(sales_csv()), *MAPPING)
+    in_memory = store.get(meta["dataset_id"])
+
+    # A fresh store (restart / other worker) only has the files on disk
+    reloaded = DatasetStore(str(tmp_path)).get(meta["dataset_id"])
+
+    assert reloaded is not None
+    assert DatasetStore.describe(reloaded) == meta
+    assert_same_prepared(reloaded["prepared"], in_memory["prepared"])
+    assert reloaded["errors"] == in_memory["errors"]
+
+
+def test_short_categories_survive_round_trip(tmp_path):
+    data = sales_csv(months=12, categories=("A",)) + sales_csv(months=2, categories=("Tiny",)).split(b"\n", 1)[1]
+    store = DatasetStore(str(tmp_path))
+    meta = store.create(io.BytesIO(data), *MAPPING)
+
+    reloaded = DatasetStore(str(tmp_path)).get(meta["dataset_id"])
+
+    assert "Tiny" in meta["insufficient_categories"]
+    assert reloaded["errors"] == meta["insufficient_categories"]
+
+
+def test_delete(tmp_path):
+    store = DatasetStore(str(tmp_path))
+    meta = store.create(io.BytesIO(sales_csv()), *MAPPING)
+
+    assert store.delete(meta["dataset_id"]) is True
+    assert store.get(meta["dataset_id"]) is None
+    assert DatasetStore(str(tmp_path)).get(meta["dataset_id"]) is None
+    assert store.delete(meta["dataset_id"]) is False
+
+
+def test_memory_eviction_falls_back_to_disk(tmp_path):
+    store = DatasetStore(str(tmp_path), max_memory_entries=1)
+    first = store.create(io.BytesIO(sales_csv(seed=0)), *MAPPING)
+    store.create(io.BytesIO(sales_csv(seed=1)), *MAPPING)
+
+    assert store.stats()["in_memory"] == 1
+    assert store.get(first["dataset_id"]) is not None
+
+
+def test_disk_eviction(tmp_path):
+    store = DatasetStore(str(tmp_path), max_disk_entries=1)
+    store.create(io.BytesIO(sales_csv(seed=0)), *MAPPING)
+    store.create(io.BytesIO(sales_csv(seed=1)), *MAPPING)
+
+    assert store.stats()["on_disk"] == 1
+
+
+@pytest.mark.parametrize("dataset_id", ["../../etc/passwd", "abc", "F" * 64])
+def test_rejects_foreign_ids(tmp_path, dataset_id):
+    store = DatasetStore(str(tmp_path))
+    assert store.get(dataset_id) is None
+    assert store.delete(dataset_id) is False
@@ -0,0 +1,97 @@
+# tests/test_evaluation.py
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import evaluation
+from evaluation import _monthly_cutoffs, run_cross_validation
+
+
+def monthly(months: int = 18, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "ds": pd.date_range("2022-01-01", periods=months, freq="MS"),
+        "y": 100 + 10 * np.sin(np.arange(months) / 2) + rng.normal(0, 2, months)
+    })
+
+
+ONE_MONTH = pd.Timedelta(days=31)
+
+
+def test_cutoffs_leave_a_full_horizon_of_actuals():
+    df = monthly(18)
+
+    cutoffs = _monthly_cutoffs(df, initial_months=12, period_months=1, horizon=ONE_MONTH)
+
+    assert cutoffs == list(df["ds"].iloc[11:17])
+    assert cutoffs[-1] <= df["ds"].iloc[-1] - ONE_MONTH
+
+
+def test_cutoffs_are_spaced_and_capped_to_most_recent():
+    df = monthly(24)
+
+    spaced = _monthly_cutoffs(df, initial_months=12, period_months=3, horizon=ONE_MONTH)
+    capped = _monthly_cutoffs(df, initial_months=12, period_months=1, horizon=ONE_MONTH, max_cutoffs=3)
+
+    assert spaced == list(df["ds"].iloc[[11, 14, 17, 20]])
+    assert capped == list(df["ds"].iloc[19:22])
+
+
+def test_cutoffs_ignore_row_order():
+    df = monthly(18)
+    shuffled = df.sample(frac=1, random_state=0)
+
+    assert _monthly_cutoffs(shuffled, 12, 1, ONE_MONTH) == _monthly_cutoffs(df, 12, 1, ONE_MONTH)
+
+
+@pytest.mark.parametrize("parallel", [None, "threads"])
+def test_cross_validation_respects_cutoff_cap(parallel):
+    result = run_cross_validation(monthly(30), initial_months=24, parallel=parallel, max_cutoffs=2)
+
+    assert result["status"] == "success", result["message"]
+    assert result["cv_details"]["cutoffs"] == 2
+    assert result["cv_details"]["evaluation_points"] == 2
+    assert result["metrics"]["mae"] >= 0
+
+
+def test_cross_validation_rejects_short_series_and_bad_mode():
+    assert run_cross_validation(monthly(26), initial_months=24)["status"] == "insufficient_data"
+    assert run_cross_validation(monthly(30), initial_months=24, parallel="gpu")["status"] == "error"
+
+
+@pytest.fixture
+def uncached_fits(monkeypatch):
+    monkeypatch.setattr(evaluation.settings, "model_cache_enabled", False)
+    inits = []
+    train = evaluation.DemandProphetModel.train
+
+    def recording_train(self, monthly_df, use_cache=None, init=None):
+        inits.append(init)
+        return train(self, monthly_df, use_cache=use_cache, init=init)
+
+    monkeypatch.setattr(evaluation.DemandProphetModel, "train", recording_train)
+    return inits
+
+
+def test_backtest_warm_starts_each_origin_from_the_previous_fit(uncached_fits):
+    result = evaluation.run_backtest(monthly(30), horizons=[1, 3], min_train_months=24, max_origins=4)
+
+    assert result["status"] == "success", result["message"]
+    assert result["backtest_details"]["origins"] == 4
+    assert result["backtest_details"]["warm_started_fits"] == 3
+    assert uncached_fits[0] is None
+    assert all(set(init) == {"k", "m", "delta", "beta"} for init in uncached_fits[1:])
+
+
+def test_backtest_cold_fits_match_table_shape(uncached_fits):
+    warm = evaluation.run_backtest(monthly(30), horizons=[1, 3], min_train_months=24, max_origins=4)
+    cold = evaluation.run_backtest(monthly(30), horizons=[1, 3], min_train_months=24, max_origins=4, warm_start=False)
+
+    assert cold["backtest_details"]["warm_started_fits"] == 0
+    assert all(init is None for init in uncached_fits[4:])
+    # Origins 26..29 months: horizon 3 only fits where three actuals remain
+    assert [(r["train_months"], r["horizon"]) for r in cold["results"]] == \
+        [(r["train_months"], r["horizon"]) for r in warm["results"]] == \
+        [(26, 1), (26, 3), (27, 1), (27, 3), (28, 1), (29, 1)]
+    assert cold["metrics"]["mae"] == pytest.approx(warm["metrics"]["mae"], rel=0.1, abs=1.0)
@@ -0,0 +1,193 @@
+# tests/test_health_snapshot.py
+# Every write must leave the incrementally maintained snapshot equal to a
+# full recomputation (check_snapshot() == {}).
+
+from datetime import datetime
+
+import pytest
+from sqlalchemy import text
+
+import database
+import health_snapshot
+import models
+
+
+@pytest.fixture
+def db():
+    models.Base.metadata.drop_all(bind=database.engine)
+    models.Base.metadata.create_all(bind=database.engine)
+    session = database.SessionLocal()
+    health_snapshot.get_snapshot(session)  # build the (empty) row
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+def stored(session):
+    snapshot = session.get(models.HealthSnapshot, health_snapshot.SNAPSHOT_ID, populate_existing=True)
+    return {field: getattr(snapshot, field) for field in health_snapshot.TOTAL_FIELDS}
+
+
+def add_product(session, sku, current_stock, optimal_stock_level=100):
+    product = models.Product(
+        sku=sku, name=sku, category="A", unit_price=10.0,
+        current_stock=current_stock, optimal_stock_level=optimal_stock_level
+    )
+    session.add(product)
+    session.commit()
+    return product
+
+
+def add_supplier(session, name, reliability_score=None):
+    supplier = models.Supplier(name=name, contact_email=f"{name}@example.com", category="A")
+    if reliability_score is not None:
+        supplier.reliability_score = reliability_score
+    session.add(supplier)
+    session.commit()
+    return supplier
+
+
+def test_is_critical_matches_sql_ratio():
+    assert health_snapshot.is_critical(19, 100)
+    assert not health_snapshot.is_critical(20, 100)
+    assert not health_snapshot.is_critical(5, 0)
+    assert not health_snapshot.is_critical(0, 0)
+    assert health_snapshot.is_critical(-1, 0)
+    assert health_snapshot.is_critical(-1, None)
+    assert not health_snapshot.is_critical(None, 100)
+
+
+def test_products_without_optimal_level(db):
+    add_product(db, "P1", -3, optimal_stock_level=0)
+    add_product(db, "P2", 0, optimal_stock_level=0)
+    add_product(db, "P3", 7, optimal_stock_level=0)
+
+    assert stored(db)["critical_items"] == 1
+    assert health_snapshot.check_snapshot(db) == {}
+
+
+def test_empty_database(db):
+    assert stored(db) == {"critical_items": 0, "pending_pos": 0, "rated_suppliers": 0, "reliability_sum": 0.0}
+    assert health_snapshot.check_snapshot(db) == {}
+
+
+def test_product_create_update_delete(db):
+    critical = add_product(db, "P1", 5)
+    healthy = add_product(db, "P2", 50)
+    assert stored(db)["critical_items"] == 1
+
+    healthy.current_stock = 10
+    db.commit()
+    assert stored(db)["critical_items"] == 2
+
+    critical.optimal_stock_level = 10
+    db.commit()
+    assert stored(db)["critical_items"] == 1
+
+    db.delete(healthy)
+    db.commit()
+    assert stored(db)["critical_items"] == 0
+    assert health_snapshot.check_snapshot(db) == {}
+
+
+def test_product_defaults_count_on_insert(db):
+    # current_stock defaults to 0 of 50 - critical once inserted
+    db.add(models.Product(sku="P1", name="P1", category="A", unit_price=1.0))
+    db.commit()
+    assert stored(db)["critical_items"] == 1
+    assert health_snapshot.check_snapshot(db) == {}
+
+
+def test_assignment_to_expired_attribute(db):
+    product = add_product(db, "P1", 5)
+    db.commit()  # expires product; the next assignment never reads the old value
+    product.current_stock = 500
+    db.commit()
+    assert stored(db)["critical_items"] == 0
+    assert health_snapshot.check_snapshot(db) == {}
+
+
+def test_inventory_log_stock_movement(db):
+    product = add_product(db, "P1", 50)
+    product.current_stock += -40
+    db.add(models.InventoryLog(product_id=product.id, quantity_change=-40, reason="SALE"))
+    db.commit()
+    assert stored(db)["critical_items"] == 1
+    assert health_snapshot.check_snapshot(db) == {}
+
+
+def test_purchase_order_status_changes(db):
+    supplier = add_supplier(db, "S1", 90)
+    po = models.PurchaseOrder(po_number="PO-1", supplier_id=supplier.id)
+    db.add(po)
+    db.commit()
+    assert stored(db)["pending_pos"] == 1  # DRAFT by default
+
+    po.status = "APPROVED"
+    db.commit()
+    assert stored(db)["pending_pos"] == 1
+
+    po.status = "RECEIVED"
+    db.commit()
+    assert stored(db)["pending_pos"] == 0
+
+    db.commit()
+    po.status = "DRAFT"  # expired attribute again
+    db.commit()
+    assert stored(db)["pending_pos"] == 1
+    assert health_snapshot.check_snapshot(db) == {}
+
+
+def test_supplier_create_update_delete(db):
+    first = add_supplier(db, "S1", 80)
+    add_supplier(db, "S2")  # default reliability 95
+    assert stored(db)["rated_suppliers"] == 2
+    assert stored(db)["reliability_sum"] == pytest.approx(175.0)
+
+    first.reliability_score = 60
+    db.commit()
+    assert stored(db)["reliability_sum"] == pytest.approx(155.0)
+
+    first.reliability_score = None
+    db.commit()
+    assert stored(db)["rated_suppliers"] == 1
+
+    db.delete(first)
+    db.commit()
+    assert stored(db)["reliability_sum"] == pytest.approx(95.0)
+    assert health_snapshot.check_snapshot(db) == {}
+
+
+def test_bulk_write_drops_row_and_read_rebuilds(db):
+    add_product(db, "P1", 5)
+    add_product(db, "P2", 5)
+    db.query(models.Product).filter(models.Product.sku == "P1").delete()
+    db.commit()
+    assert db.execute(text("SELECT count(*) FROM health_snapshots")).scalar() == 0
+
+    snapshot = health_snapshot.get_snapshot(db)
+    assert snapshot.critical_items == 1
+    assert snapshot.rebuilt_at is not None
+
+
+def test_placeholder_row_is_rebuilt_on_read(db):
+    add_product(db, "P1", 5)
+    db.execute(text("DELETE FROM health_snapshots"))
+    db.commit()
+    assert health_snapshot._insert_placeholder_row(db)
+    assert not health_snapshot._insert_placeholder_row(db)
+    db.commit()
+
+    assert health_snapshot.get_snapshot(db).critical_items == 1
+
+
+def test_check_and_rebuild_repair_drift(db):
+    add_product(db, "P1", 5)
+    db.execute(text("UPDATE health_snapshots SET critical_items = 7"))
+    db.commit()
+    assert health_snapshot.check_snapshot(db) == {"critical_items": {"stored": 7, "actual": 1}}
+
+    health_snapshot.rebuild_snapshot(db)
+    db.commit()
+    assert health_snapshot.check_snapshot(db) == {}
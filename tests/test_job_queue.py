@@ -0,0 +1,138 @@
+# tests/test_job_queue.py
+
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+
+import main
+from job_queue import JobQueue, QueueFull
+
+
+def wait_finished(job, timeout: float = 10):
+    deadline = time.time() + timeout
+    while not job.finished:
+        assert time.time() < deadline, f"job still {job.status}"
+        time.sleep(0.01)
+    return job
+
+
+def test_job_succeeds_with_progress_and_cleanup():
+    queue = JobQueue(max_workers=1)
+    cleaned = threading.Event()
+
+    def work(job):
+        job.report(0.5, "Halfway")
+        return {"answer": 42}
+
+    job = wait_finished(queue.submit("test", work, on_finish=cleaned.set))
+
+    assert job.status == "succeeded"
+    assert job.progress == 1.0
+    assert job.to_dict()["result"] == {"answer": 42}
+    assert "result" not in job.to_dict(include_result=False)
+    assert cleaned.is_set()
+    assert queue.stats()["succeeded"] == 1
+
+
+def test_job_failure_keeps_http_detail():
+    queue = JobQueue(max_workers=1)
+
+    def work(job):
+        raise HTTPException(status_code=400, detail="Bad category")
+
+    job = wait_finished(queue.submit("test", work))
+
+    assert job.status == "failed"
+    assert job.error == "Bad category"
+
+
+def test_cancel_queued_job_never_starts():
+    queue = JobQueue(max_workers=1)
+    release = threading.Event()
+    started = []
+
+    blocker = queue.submit("test", lambda job: release.wait(5))
+    queued = queue.submit("test", lambda job: started.append(job.job_id))
+
+    assert queue.cancel(queued.job_id).status == "cancelled"
+    release.set()
+    wait_finished(blocker)
+
+    assert started == []
+    assert queued.message == "Cancelled before start"
+
+
+def test_cancel_running_job_stops_at_checkpoint():
+    queue = JobQueue(max_workers=1)
+    running = threading.Event()
+
+    def work(job):
+        running.set()
+        while True:
+            job.report(0.1)
+            time.sleep(0.01)
+
+    job = queue.submit("test", work)
+    assert running.wait(5)
+    queue.cancel(job.job_id)
+
+    assert wait_finished(job).status == "cancelled"
+
+
+def test_queue_full():
+    queue = JobQueue(max_workers=1, max_queued=1)
+    release = threading.Event()
+    queue.submit("test", lambda job: release.wait(5))
+    time.sleep(0.05)  # let the first job start
+    queue.submit("test", lambda job: None)
+
+    with pytest.raises(QueueFull):
+        queue.submit("test", lambda job: None)
+    release.set()
+
+
+def test_finished_jobs_expire():
+    queue = JobQueue(max_workers=1, result_ttl=0)
+    job = wait_finished(queue.submit("test", lambda job: None))
+    time.sleep(0.01)
+
+    assert queue.list() == []
+    assert queue.get(job.job_id) is None
+
+
+def test_background_evaluate_job_result_is_served():
+    rng = np.random.default_rng(0)
+    dates = pd.date_range("2023-01-01", "2023-12-31", freq="D")
+    units = np.where(dates.month == 6, 0, rng.integers(0, 50, len(dates)))
+    # A month without sales: quality_checks.has_zero_values is a numpy bool before conversion
+    sales = pd.DataFrame({"Date": dates, "Category": "A", "Units_Sold": units})
+    client = TestClient(main.app)
+
+    response = client.post(
+        "/forecast/evaluate",
+        files={"file": ("sales.csv", sales.to_csv(index=False).encode("utf-8"), "text/csv")},
+        data={
+            "category": "A", "date_col": "Date", "category_col": "Category", "units_col": "Units_Sold",
+            "background": "true"
+        }
+    )
+    assert response.status_code == 202
+
+    deadline = time.time() + 120
+    while True:
+        polled = client.get(response.json()["status_url"])
+        assert polled.status_code == 200
+        if polled.json()["status"] not in ("queued", "running"):
+            break
+        assert time.time() < deadline
+        time.sleep(0.2)
+
+    body = polled.json()
+    assert body["status"] == "succeeded", body["error"]
+    assert body["result"]["diagnostics"]["quality_checks"]["has_zero_values"] is True
+    assert client.get("/jobs").json()["jobs"][0]["job_id"] == body["job_id"]
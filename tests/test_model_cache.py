@@ -0,0 +1,66 @@
+# tests/test_model_cache.py
+
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from model_cache import JsonFileCache, make_cache_key
+
+CONFIG = {"seasonality_mode": "additive", "extra_regressors": {"promo": {"prior_scale": 10.0}}}
+
+
+def monthly(months: int = 24) -> pd.DataFrame:
+    return pd.DataFrame({
+        "ds": pd.date_range("2022-01-01", periods=months, freq="MS"),
+        "y": np.arange(months, dtype=float) + 10,
+        "promo": np.zeros(months)
+    })
+
+
+def test_key_is_stable_for_same_data_and_column_order():
+    df = monthly()
+
+    assert make_cache_key(df, CONFIG) == make_cache_key(monthly(), dict(reversed(CONFIG.items())))
+    assert make_cache_key(df, CONFIG) == make_cache_key(df[["promo", "y", "ds"]], CONFIG)
+
+
+def test_key_changes_with_regressor_values():
+    df = monthly()
+    promoted = monthly()
+    promoted.loc[5, "promo"] = 1.0
+
+    assert make_cache_key(df, CONFIG) != make_cache_key(promoted, CONFIG)
+
+
+def test_key_changes_with_extra_columns_and_names():
+    df = monthly()
+
+    assert make_cache_key(df, CONFIG) != make_cache_key(df.assign(cap=100.0), CONFIG)
+    assert make_cache_key(df, CONFIG) != make_cache_key(df.rename(columns={"promo": "discount"}), CONFIG)
+
+
+def test_key_changes_with_series_and_config():
+    df = monthly()
+    revised = monthly()
+    revised.loc[0, "y"] += 1
+
+    assert make_cache_key(df, CONFIG) != make_cache_key(revised, CONFIG)
+    assert make_cache_key(df, CONFIG) != make_cache_key(df, {**CONFIG, "seasonality_mode": "multiplicative"})
+
+
+def test_hit_and_miss_counters_are_thread_safe(tmp_path):
+    cache = JsonFileCache(str(tmp_path))
+    cache.put("present", {"value": 1})
+
+    def lookup(i):
+        return cache.get("present" if i % 2 else "absent")
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lookup, range(2000)))
+
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"]) == (1000, 1000)
+
+    cache.clear()
+    assert (cache.stats()["hits"], cache.stats()["misses"]) == (0, 0)
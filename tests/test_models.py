@@ -0,0 +1,62 @@
+# tests/test_models.py
+
+import itertools
+
+import pytest
+from sqlalchemy import select, text
+
+import database
+import models
+
+STOCKS = [-5, 0, 1, 19, 20, 49, 50, 100, 250]
+OPTIMAL_LEVELS = [0, 10, 100, 1000]
+
+
+@pytest.fixture
+def db():
+    models.Base.metadata.drop_all(bind=database.engine)
+    models.Base.metadata.create_all(bind=database.engine)
+    session = database.SessionLocal()
+    for i, (stock, optimal) in enumerate(itertools.product(STOCKS, OPTIMAL_LEVELS)):
+        session.add(models.Product(
+            sku=f"P{i}", name=f"P{i}", category="A", unit_price=1.0,
+            current_stock=stock, optimal_stock_level=optimal
+        ))
+    session.commit()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.mark.parametrize("threshold", [models.CRITICAL_STOCK_RATIO, models.REORDER_STOCK_RATIO])
+def test_stock_ratio_filter_matches_original_check(db, threshold):
+    # The pre-SQL check was "current_stock < optimal_stock_level * ratio"
+    expected = {
+        p.sku for p in db.query(models.Product)
+        if p.current_stock < p.optimal_stock_level * threshold
+    }
+    actual = set(db.scalars(select(models.Product.sku).where(models.product_stock_ratio < threshold)))
+    assert actual == expected
+
+
+def test_stock_ratio_orders_most_depleted_first(db):
+    ratios = db.scalars(
+        select(models.product_stock_ratio)
+        .where(models.product_stock_ratio < models.REORDER_STOCK_RATIO)
+        .order_by(models.product_stock_ratio)
+    ).all()
+    assert ratios[0] == -5
+    assert ratios == sorted(ratios)
+
+
+def test_stock_ratio_queries_use_index(db):
+    query = (
+        select(models.Product.name)
+        .where(models.product_stock_ratio < models.REORDER_STOCK_RATIO)
+        .order_by(models.product_stock_ratio, models.Product.id)
+        .limit(10)
+    )
+    compiled = query.compile(database.engine, compile_kwargs={"literal_binds": True})
+    plan = " ".join(row[-1] for row in db.execute(text(f"EXPLAIN QUERY PLAN {compiled}")))
+    assert "ix_products_stock_ratio" in plan
@@ -0,0 +1,112 @@
+# tests/test_reasoning_cache.py
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from reasoning_cache import ReasoningCache
+
+
+def counting(text: str, calls: list, delay: float = 0.0):
+    def generate():
+        calls.append(text)
+        time.sleep(delay)
+        return text
+    return generate
+
+
+def wait_idle(cache: ReasoningCache, timeout: float = 5):
+    deadline = time.time() + timeout
+    while cache.stats()["in_flight"]:
+        assert time.time() < deadline
+        time.sleep(0.01)
+
+
+def test_generates_once_then_serves_from_cache():
+    cache = ReasoningCache(max_workers=2)
+    calls = []
+
+    first = cache.resolve({"a": (counting("A", calls), "fallback")}, deadline=5)
+    second = cache.resolve({"a": (counting("A", calls), "fallback")}, deadline=5)
+
+    assert first == second == {"a": "A"}
+    assert calls == ["A"]
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["fallbacks"]) == (1, 1, 0)
+
+
+def test_concurrent_requests_share_one_call():
+    cache = ReasoningCache(max_workers=4)
+    calls = []
+    request = {"a": (counting("A", calls, delay=0.2), "fallback")}
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(lambda _: cache.resolve(request, deadline=5), range(4)))
+
+    assert results == [{"a": "A"}] * 4
+    assert calls == ["A"]
+
+
+def test_late_call_falls_back_and_fills_cache():
+    cache = ReasoningCache(max_workers=2)
+    calls = []
+
+    late = cache.resolve({"a": (counting("A", calls, delay=0.3), "fallback")}, deadline=0.01)
+    assert late == {"a": "fallback"}
+    assert cache.stats()["fallbacks"] == 1
+
+    # The slow call keeps running and answers the next request
+    wait_idle(cache)
+    assert cache.resolve({"a": (counting("A", calls), "fallback")}, deadline=0.01) == {"a": "A"}
+    assert calls == ["A"]
+
+
+def test_failed_call_is_not_cached():
+    cache = ReasoningCache(max_workers=1)
+    attempts = []
+
+    def broken():
+        attempts.append(1)
+        raise RuntimeError("LLM down")
+
+    assert cache.resolve({"a": (broken, "fallback")}, deadline=5) == {"a": "fallback"}
+    wait_idle(cache)
+    assert cache.resolve({"a": (broken, "fallback")}, deadline=5) == {"a": "fallback"}
+    assert len(attempts) == 2
+
+
+def test_expired_entries_are_regenerated():
+    cache = ReasoningCache(max_workers=1, ttl=0)
+    calls = []
+
+    cache.resolve({"a": (counting("A", calls), "fallback")}, deadline=5)
+    time.sleep(0.01)
+    cache.resolve({"a": (counting("A", calls), "fallback")}, deadline=5)
+
+    assert calls == ["A", "A"]
+
+
+def test_entry_limit_drops_least_recently_used():
+    cache = ReasoningCache(max_workers=1, max_entries=2)
+    calls = []
+    for key in ("a", "b", "a", "c"):
+        cache.resolve({key: (counting(key, calls), "fallback")}, deadline=5)
+
+    assert cache.get("a") == "a" and cache.get("c") == "c"
+    assert cache.get("b") is None
+
+
+def test_counters_are_thread_safe():
+    cache = ReasoningCache(max_workers=2)
+    cache.resolve({"a": (lambda: "A", "fallback")}, deadline=5)
+    start = threading.Barrier(8)
+
+    def hammer(_):
+        start.wait()
+        for _ in range(250):
+            cache.resolve({"a": (lambda: "A", "fallback")}, deadline=5)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(hammer, range(8)))
+
+    assert cache.stats()["hits"] == 2000
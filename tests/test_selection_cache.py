@@ -0,0 +1,85 @@
+# tests/test_selection_cache.py
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import forecast_service
+from selection_cache import ModelSelectionCache
+
+CANDIDATES = ["holt", "seasonal_naive"]
+
+
+def monthly(months: int = 24, level: float = 100.0, category: str = "A") -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        "ds": pd.date_range("2022-01-01", periods=months, freq="MS"),
+        "y": level + rng.normal(0, 5, months)
+    })
+    df.attrs["category"] = category
+    return df
+
+
+@pytest.fixture
+def cache(monkeypatch, tmp_path):
+    selection = ModelSelectionCache(str(tmp_path))
+    monkeypatch.setattr(forecast_service, "selection_cache", selection)
+    return selection
+
+
+def test_winner_round_trip(tmp_path):
+    cache = ModelSelectionCache(str(tmp_path))
+    fingerprint = {"months": 24, "level_bucket": 48}
+
+    assert cache.get_winner("A", fingerprint) is None
+    cache.put_winner("A", fingerprint, {"model_type": "holt"})
+
+    assert cache.get_winner("A", fingerprint) == {"model_type": "holt"}
+    assert cache.get_winner("B", fingerprint) is None
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 2
+
+
+def test_second_selection_is_served_from_cache(cache, monkeypatch):
+    first = forecast_service.auto_select_model(monthly(), candidates=CANDIDATES)
+
+    # A cache hit must not score any candidate again
+    monkeypatch.setattr(forecast_service, "score_model_holdout", pytest.fail)
+    second = forecast_service.auto_select_model(monthly(), candidates=CANDIDATES)
+
+    assert first["from_cache"] is False
+    assert second == {**first, "from_cache": True}
+
+
+def test_small_revision_keeps_winner(cache):
+    forecast_service.auto_select_model(monthly(), candidates=CANDIDATES)
+    revised = monthly()
+    revised.loc[3, "y"] += 1
+
+    assert forecast_service.auto_select_model(revised, candidates=CANDIDATES)["from_cache"] is True
+
+
+@pytest.mark.parametrize("changed, candidates", [
+    (monthly(months=25), CANDIDATES),                  # new month
+    (monthly(level=200.0), CANDIDATES),                # level shift
+    (monthly(category="B"), CANDIDATES),               # other category
+    (monthly(), ["holt", "seasonal_naive", "sba"])     # other tournament
+])
+def test_changed_series_or_candidates_reselect(cache, changed, candidates):
+    forecast_service.auto_select_model(monthly(), candidates=CANDIDATES)
+
+    assert forecast_service.auto_select_model(changed, candidates=candidates)["from_cache"] is False
+
+
+def test_selection_cache_ignores_model_cache_setting(cache, monkeypatch):
+    monkeypatch.setattr(forecast_service.settings, "model_cache_enabled", False)
+    forecast_service.auto_select_model(monthly(), candidates=CANDIDATES)
+
+    assert forecast_service.auto_select_model(monthly(), candidates=CANDIDATES)["from_cache"] is True
+
+
+def test_selection_cache_can_be_disabled(cache, monkeypatch):
+    monkeypatch.setattr(forecast_service.settings, "auto_select_cache_enabled", False)
+    forecast_service.auto_select_model(monthly(), candidates=CANDIDATES)
+
+    assert forecast_service.auto_select_model(monthly(), candidates=CANDIDATES)["from_cache"] is False
+    assert cache.stats()["entries"] == 0
@@ -0,0 +1,118 @@
+# tests/test_statistical_models.py
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from statistical_models import (
+    STATISTICAL_MODELS,
+    CrostonModel,
+    HoltModel,
+    SeasonalNaiveModel,
+    StatisticalForecaster
+)
+
+
+def monthly(values) -> pd.DataFrame:
+    return pd.DataFrame({
+        "ds": pd.date_range("2022-01-01", periods=len(values), freq="MS"),
+        "y": np.asarray(values, dtype=float)
+    })
+
+
+def test_base_class_is_abstract():
+    with pytest.raises(TypeError):
+        StatisticalForecaster()
+
+    class Incomplete(StatisticalForecaster):
+        def _fit(self, y):
+            return y
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+@pytest.mark.parametrize("model_type", sorted(STATISTICAL_MODELS))
+def test_forecast_shape_and_bounds(model_type):
+    rng = np.random.default_rng(1)
+    model = STATISTICAL_MODELS[model_type](None, None)
+    model.train(monthly(rng.integers(0, 40, 24)))
+
+    forecast = model.forecast(periods=3)
+
+    assert list(forecast.columns) == ["Date", "Forecasted_Units", "Lower_Bound", "Upper_Bound"]
+    assert list(forecast["Date"]) == list(pd.date_range("2024-01-01", periods=3, freq="MS"))
+    assert (forecast["Lower_Bound"] >= 0).all()
+    assert (forecast["Lower_Bound"] <= forecast["Forecasted_Units"]).all()
+    assert (forecast["Forecasted_Units"] <= forecast["Upper_Bound"]).all()
+    assert model.is_trained
+    assert model.get_model_info()
+
+
+def test_forecast_requires_training():
+    with pytest.raises(ValueError):
+        HoltModel().forecast(periods=1)
+
+
+def test_train_rejects_short_history():
+    with pytest.raises(ValueError):
+        HoltModel().train(monthly([1, 2, 3]))
+
+
+def test_seasonal_naive_repeats_last_year():
+    values = list(range(10, 34))
+    model = SeasonalNaiveModel()
+    model.train(monthly(values))
+
+    forecast = model.forecast(periods=3)
+
+    assert list(forecast["Forecasted_Units"]) == values[12:15]
+
+
+def test_seasonal_naive_uses_last_value_without_a_full_year():
+    model = SeasonalNaiveModel()
+    model.train(monthly([5, 6, 7, 8, 9, 11]))
+
+    assert list(model.forecast(periods=2)["Forecasted_Units"]) == [11, 11]
+
+
+def test_holt_extrapolates_linear_trend():
+    model = HoltModel()
+    model.train(monthly([10 + 5 * t for t in range(12)]))
+
+    assert list(model.forecast(periods=3)["Forecasted_Units"]) == [70, 75, 80]
+
+
+def test_damped_holt_flattens_trend():
+    history = monthly([10 + 5 * t for t in range(12)])
+    linear, damped = HoltModel(), HoltModel(damped=True)
+    linear.train(history)
+    damped.train(history)
+
+    assert damped.phi < 1.0
+    assert damped.forecast(periods=6)["Forecasted_Units"].iloc[-1] < linear.forecast(periods=6)["Forecasted_Units"].iloc[-1]
+
+
+def test_croston_forecasts_demand_rate():
+    # 12 units every 3rd month = 4 units a month
+    values = [0, 0, 12] * 8
+    croston = CrostonModel(sba=False)
+    croston.train(monthly(values))
+
+    assert list(croston.forecast(periods=3)["Forecasted_Units"]) == [4, 4, 4]
+
+
+def test_sba_shrinks_croston_rate():
+    values = [0, 0, 12] * 8
+    croston, sba = CrostonModel(alpha=0.2, sba=False), CrostonModel(alpha=0.2, sba=True)
+    croston.train(monthly(values))
+    sba.train(monthly(values))
+
+    assert sba._rate == pytest.approx(croston._rate * 0.9)
+
+
+def test_croston_all_zero_history():
+    model = CrostonModel()
+    model.train(monthly([0] * 12))
+
+    assert list(model.forecast(periods=2)["Forecasted_Units"]) == [0, 0]
@@ -0,0 +1,133 @@
+# tests/test_supplier_index.py
+
+import math
+
+import numpy as np
+import pytest
+
+import database
+import models
+from main import calculate_supplier_score
+from supplier_index import DEFAULT_WEIGHTS, SupplierIndex, normalize_weights, score_matrix, top_k
+
+
+def test_normalize_weights_defaults_sum_to_one():
+    weights = normalize_weights()
+    assert set(weights) == set(DEFAULT_WEIGHTS)
+    assert math.isclose(sum(weights.values()), 1.0)
+
+
+def test_normalize_weights_rescales_partial_override():
+    weights = normalize_weights({"reliability": 0.0, "lead_time": 1.0, "price": 1.0})
+    assert weights == {"reliability": 0.0, "lead_time": 0.5, "price": 0.5}
+
+
+@pytest.mark.parametrize("weights", [
+    {"speed": 1.0},
+    {"price": -0.1},
+    {"reliability": 0.0, "lead_time": 0.0, "price": 0.0},
+    {"price": float("nan")},
+    {"reliability": float("inf")},
+    {"lead_time": float("-inf")}
+])
+def test_normalize_weights_rejects_invalid(weights):
+    with pytest.raises(ValueError):
+        normalize_weights(weights)
+
+
+@pytest.fixture
+def db():
+    models.Base.metadata.drop_all(bind=database.engine)
+    models.Base.metadata.create_all(bind=database.engine)
+    session = database.SessionLocal()
+    rng = np.random.default_rng(7)
+    for i in range(30):
+        session.add(models.Supplier(
+            name=f"S{i}",
+            contact_email=f"s{i}@example.com",
+            category=["A", "B", "C"][i % 3],
+            reliability_score=float(rng.uniform(50, 100)),
+            delivery_speed_days=int(rng.integers(1, 40)),
+            price_per_unit=float(rng.uniform(1, 50))
+        ))
+    session.commit()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+PRODUCTS = [("A", 10.0), ("A", None), ("B", 0.0), ("B", 25.5), ("C", 3.0), ("Z", 40.0), ("Z", None)]
+
+
+def test_score_matrix_matches_calculate_supplier_score(db):
+    suppliers = db.query(models.Supplier).order_by(models.Supplier.id).all()
+    prices = [price for _, price in PRODUCTS]
+
+    scores = score_matrix(
+        np.array([s.reliability_score for s in suppliers]),
+        np.array([s.delivery_speed_days for s in suppliers], dtype=float),
+        np.array([s.price_per_unit for s in suppliers]),
+        np.array([np.nan if p is None else p for p in prices])
+    )
+
+    expected = [[calculate_supplier_score(s, p) for s in suppliers] for p in prices]
+    np.testing.assert_allclose(scores, expected, atol=0.011)
+
+
+def test_best_for_products_matches_calculate_supplier_score(db):
+    suppliers = db.query(models.Supplier).order_by(models.Supplier.id).all()
+    index = SupplierIndex()
+
+    matches = index.best_for_products(db, [c for c, _ in PRODUCTS], [p for _, p in PRODUCTS])
+
+    for (category, price), (best, score) in zip(PRODUCTS, matches):
+        # Categories without suppliers are matched against everyone
+        candidates = [s for s in suppliers if s.category == category] or suppliers
+        expected = max(calculate_supplier_score(s, price) for s in candidates)
+        assert best.category == category or category == "Z"
+        assert score == pytest.approx(expected, abs=0.011)
+        assert calculate_supplier_score(db.get(models.Supplier, best.id), price) == pytest.approx(expected, abs=0.011)
+
+
+def test_best_for_products_without_suppliers():
+    models.Base.metadata.drop_all(bind=database.engine)
+    models.Base.metadata.create_all(bind=database.engine)
+    session = database.SessionLocal()
+    try:
+        assert SupplierIndex().best_for_products(session, ["A"], [1.0]) == [None]
+    finally:
+        session.close()
+
+
+def test_score_all_same_category_only(db):
+    suppliers, scores = SupplierIndex().score_all(
+        db, [c for c, _ in PRODUCTS], [p for _, p in PRODUCTS], same_category_only=True
+    )
+    categories = np.array([s.category for s in suppliers])
+
+    for row, (category, _) in enumerate(PRODUCTS):
+        excluded = np.isneginf(scores[row])
+        if category == "Z":
+            assert not excluded.any()
+        else:
+            assert (excluded == (categories != category)).all()
+
+
+def test_top_k_orders_best_first_with_ties_by_column():
+    scores = np.array([
+        [10.0, 30.0, 20.0, 30.0, 5.0],
+        [1.0, -np.inf, 3.0, 2.0, 3.0]
+    ])
+
+    assert top_k(scores, 3).tolist() == [[1, 3, 2], [2, 4, 3]]
+    assert top_k(scores, 5).tolist() == [[1, 3, 2, 0, 4], [2, 4, 3, 0, 1]]
+    assert top_k(scores, 10).shape == (2, 5)
+    assert top_k(scores, 0).shape == (2, 0)
+
+
+def test_top_k_matches_full_sort():
+    rng = np.random.default_rng(3)
+    scores = np.round(rng.uniform(0, 100, (20, 50)), 0)  # plenty of ties
+    expected = [sorted(range(50), key=lambda j: (-row[j], j))[:7] for row in scores]
+    assert top_k(scores, 7).tolist() == expected